@@ -0,0 +1,54 @@
+# apps/api/v1/cache.py
+"""
+Cache des actions de lecture des ViewSets.
+Les clés combinent l'action, les filtres normalisés, le périmètre de
+l'utilisateur et la version des tags des données lues : une écriture
+(signal ou opération en masse) invalide ses tags et périme les entrées
+sans attendre leur expiration.
+"""
+from rest_framework.response import Response
+
+from apps.core.utils import CacheManager
+
+
+class CacheVueMixin:
+    """
+    Fournit reponse_en_cache() aux actions, et met en cache la liste si
+    `tags_liste_cache` est renseigné.
+    """
+    tags_liste_cache = ()
+    parametres_hors_cache = ('format',)
+
+    def cle_perimetre(self) -> str:
+        """Périmètre de données de l'utilisateur ; 'all' sans restriction."""
+        return 'all'
+
+    def cle_cache(self, tags, ignores=None) -> str:
+        ignores = set(self.parametres_hors_cache if ignores is None else ignores)
+        filtres = {
+            cle: sorted(self.request.query_params.getlist(cle))
+            for cle in self.request.query_params
+            if cle not in ignores
+        }
+        return CacheManager.generate_cache_key(
+            f"api:{self.basename}:{self.action}",
+            perimetre=self.cle_perimetre(),
+            filtres=filtres,
+            tags=tags
+        )
+
+    def reponse_en_cache(self, tags, calculer, cache_type='api_response', ignores=None):
+        """Response construite depuis le cache ou par `calculer()` (données sérialisables)."""
+        return Response(CacheManager.get_or_set(
+            self.cle_cache(tags, ignores), calculer, cache_type=cache_type
+        ))
+
+    def list(self, request, *args, **kwargs):
+        if not self.tags_liste_cache:
+            return super().list(request, *args, **kwargs)
+        lister = super().list
+        return self.reponse_en_cache(
+            self.tags_liste_cache,
+            lambda: lister(request, *args, **kwargs).data,
+            cache_type='static_data'
+        )
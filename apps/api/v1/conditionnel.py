@@ -0,0 +1,76 @@
+# apps/api/v1/conditionnel.py
+"""
+Requêtes GET conditionnelles (ETag / Last-Modified) pour les ViewSets.
+Les validateurs sont calculés avant toute sérialisation : date de
+modification de la ligne pour le détail, empreinte max(modified) +
+nombre de lignes du queryset filtré pour la liste. Une requête dont
+le validateur correspond reçoit un 304 sans exécuter la vue.
+"""
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class RequetesConditionnellesMixin:
+    """
+    À placer avant le ViewSet DRF. `modeles_dependants` liste les modèles
+    dont la représentation embarque des données (noms, compteurs) : leur
+    dernière modification entre dans les validateurs.
+    """
+    modeles_dependants = ()
+
+    def get_queryset_validateurs(self):
+        """Queryset filtré sans annotations ni préchargements, pour les validateurs."""
+        return self.filter_queryset(self.get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        empreinte = self.get_queryset_validateurs().order_by().aggregate(
+            derniere=Max('modified'), nombre=Count('pk')
+        )
+        # Liste : validation par ETag seulement, une suppression ne fait pas
+        # progresser max(modified)
+        return self._repondre_conditionnellement(
+            request, empreinte['derniere'], (empreinte['nombre'],), False,
+            super().list, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        modifie = self.get_queryset_validateurs().filter(
+            **{self.lookup_field: kwargs.get(lookup_url_kwarg)}
+        ).values_list('modified', flat=True).first()
+        if modifie is None:
+            # Laisser la vue produire le 404
+            return super().retrieve(request, *args, **kwargs)
+        return self._repondre_conditionnellement(
+            request, modifie, (kwargs.get(lookup_url_kwarg),), True,
+            super().retrieve, *args, **kwargs
+        )
+
+    def _repondre_conditionnellement(self, request, derniere, parties, avec_date, vue, *args, **kwargs):
+        dates = [derniere] + [
+            modele.all_objects.aggregate(derniere=Max('modified'))['derniere']
+            for modele in self.modeles_dependants
+        ]
+        dates = [d for d in dates if d is not None]
+        last_modified = int(max(dates).timestamp()) if dates else None
+
+        # La représentation dépend aussi des paramètres, du format et de l'utilisateur
+        signature = repr((
+            [d.isoformat() for d in dates], parties, request.get_full_path(),
+            request.accepted_media_type, request.user.pk,
+        ))
+        etag = f'"{hashlib.sha1(signature.encode()).hexdigest()}"'
+
+        reponse = get_conditional_response(
+            request, etag=etag, last_modified=last_modified if avec_date else None
+        )
+        if reponse is None:
+            reponse = vue(request, *args, **kwargs)
+            if not 200 <= reponse.status_code < 300:
+                return reponse
+        reponse['ETag'] = etag
+        if last_modified is not None:
+            reponse['Last-Modified'] = http_date(last_modified)
+        return reponse
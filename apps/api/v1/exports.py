@@ -0,0 +1,139 @@
+# apps/api/v1/exports.py
+"""
+Exports en flux des biens (CSV et XLSX) sans limite de lignes.
+Les lignes sont lues par curseur serveur sur une projection values()
+et écrites au fil de l'eau : la mémoire du worker reste bornée.
+"""
+import csv
+import tempfile
+from datetime import datetime
+from django.http import FileResponse, StreamingHttpResponse
+import xlsxwriter
+
+from apps.patrimoine.models import Bien
+
+# Taille des lots lus sur le curseur serveur
+EXPORT_CHUNK_SIZE = 2000
+
+STATUTS = dict(Bien.StatutBien.choices)
+ETATS = dict(Bien.EtatPhysique.choices)
+
+
+def _date(valeur):
+    return valeur.strftime('%d/%m/%Y') if valeur else ''
+
+
+# (en-tête, fonction d'extraction depuis la ligne values())
+EXPORT_COLUMNS = [
+    ('Code Patrimoine', lambda r: r['code_patrimoine']),
+    ('Nom', lambda r: r['nom']),
+    ('Catégorie', lambda r: r['categorie__nom']),
+    ('Sous-catégorie', lambda r: r['sous_categorie__nom']),
+    ('Entité', lambda r: r['entite__nom']),
+    ('Localisation', lambda r: f"{r['commune__nom'] or ''} {r['localisation_precise']}"),
+    ('Valeur Acquisition', lambda r: float(r['valeur_acquisition'])),
+    ('Date Acquisition', lambda r: _date(r['date_acquisition'])),
+    ('Statut', lambda r: STATUTS.get(r['statut'], r['statut'])),
+    ('État', lambda r: ETATS.get(r['etat_physique'], r['etat_physique'])),
+    ('Responsable', lambda r: r['responsable_actuel_nom']),
+    ('Marque', lambda r: r['marque']),
+    ('Modèle', lambda r: r['modele']),
+    ('N° Série', lambda r: r['numero_serie']),
+    ('Fournisseur', lambda r: r['fournisseur']),
+    ('Garantie', lambda r: _date(r['date_fin_garantie'])),
+    ('Tags', lambda r: ', '.join(r['tags']) if r['tags'] else ''),
+]
+
+EXPORT_FIELDS = [
+    'code_patrimoine', 'nom', 'categorie__nom', 'sous_categorie__nom',
+    'entite__nom', 'commune__nom', 'localisation_precise',
+    'valeur_acquisition', 'date_acquisition', 'statut', 'etat_physique',
+    'marque', 'modele', 'numero_serie', 'fournisseur',
+    'date_fin_garantie', 'tags', 'responsable_actuel_nom',
+]
+
+
+def iter_lignes_export(queryset):
+    """Itère les lignes d'export via un curseur serveur."""
+    lignes = queryset.values(*EXPORT_FIELDS)
+    for ligne in lignes.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield [extraire(ligne) for _, extraire in EXPORT_COLUMNS]
+
+
+def _nom_fichier(extension):
+    return f'export_biens_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+
+
+class _Echo:
+    """Pseudo-buffer : csv.writer écrit, la réponse en flux consomme."""
+
+    def write(self, value):
+        return value
+
+
+def export_csv_response(queryset):
+    """Réponse CSV produite ligne par ligne."""
+    writer = csv.writer(_Echo())
+
+    def generer():
+        # BOM pour l'ouverture correcte dans Excel (équivalent utf-8-sig)
+        yield '\ufeff'
+        yield writer.writerow([entete for entete, _ in EXPORT_COLUMNS])
+        for ligne in iter_lignes_export(queryset):
+            yield writer.writerow(ligne)
+
+    response = StreamingHttpResponse(generer(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{_nom_fichier("csv")}"'
+    return response
+
+
+def export_xlsx_response(queryset):
+    """
+    Réponse XLSX écrite en mode constant_memory de xlsxwriter.
+    Chaque ligne est vidée sur disque dès son écriture ; le fichier final,
+    assemblé dans un fichier temporaire, est renvoyé par blocs.
+    """
+    fichier = tempfile.TemporaryFile(suffix='.xlsx')
+    workbook = xlsxwriter.Workbook(fichier, {
+        'constant_memory': True,
+        'tmpdir': tempfile.gettempdir(),
+    })
+    worksheet = workbook.add_worksheet('Biens')
+
+    # Format pour les en-têtes
+    header_format = workbook.add_format({
+        'bold': True,
+        'bg_color': '#1E88E5',
+        'font_color': 'white',
+        'border': 1
+    })
+
+    # Format pour les montants
+    money_format = workbook.add_format({
+        'num_format': '#,##0.00 "XAF"',
+        'border': 1
+    })
+
+    # Les formats de colonnes doivent précéder les lignes en constant_memory
+    worksheet.set_column('A:A', 20)  # Code patrimoine
+    worksheet.set_column('B:B', 30)  # Nom
+    worksheet.set_column('G:G', 15, money_format)  # Colonne valeur
+
+    for col_num, (entete, _) in enumerate(EXPORT_COLUMNS):
+        worksheet.write(0, col_num, entete, header_format)
+
+    nombre_lignes = 0
+    for nombre_lignes, ligne in enumerate(iter_lignes_export(queryset), start=1):
+        worksheet.write_row(nombre_lignes, 0, ligne)
+
+    # Ajouter les filtres
+    worksheet.autofilter(0, 0, nombre_lignes, len(EXPORT_COLUMNS) - 1)
+    workbook.close()
+    fichier.seek(0)
+
+    return FileResponse(
+        fichier,
+        as_attachment=True,
+        filename=_nom_fichier('xlsx'),
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    )
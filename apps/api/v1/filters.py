@@ -0,0 +1,95 @@
+# apps/api/v1/filters.py
+"""
+Jeux de filtres des ViewSets du registre.
+"""
+from datetime import datetime
+from django_filters import rest_framework as django_filters
+
+from apps.patrimoine.models import Bien, Categorie, Entite
+from apps.patrimoine.services.categorie_service import CategorieArbreService
+
+
+class BienFilter(django_filters.FilterSet):
+    """Filtres avancés pour les biens."""
+    
+    valeur_min = django_filters.NumberFilter(
+        field_name='valeur_acquisition',
+        lookup_expr='gte'
+    )
+    valeur_max = django_filters.NumberFilter(
+        field_name='valeur_acquisition',
+        lookup_expr='lte'
+    )
+    date_acquisition_debut = django_filters.DateFilter(
+        field_name='date_acquisition',
+        lookup_expr='gte'
+    )
+    date_acquisition_fin = django_filters.DateFilter(
+        field_name='date_acquisition',
+        lookup_expr='lte'
+    )
+    province = django_filters.CharFilter(
+        field_name='commune__departement__province__id',
+        lookup_expr='exact'
+    )
+    departement = django_filters.CharFilter(
+        field_name='commune__departement__id',
+        lookup_expr='exact'
+    )
+    tags = django_filters.CharFilter(
+        method='filter_tags'
+    )
+    sans_responsable = django_filters.BooleanFilter(
+        method='filter_sans_responsable'
+    )
+    maintenance_en_retard = django_filters.BooleanFilter(
+        method='filter_maintenance_en_retard'
+    )
+    categorie_arbre = django_filters.UUIDFilter(
+        method='filter_categorie_arbre'
+    )
+    
+    class Meta:
+        model = Bien
+        fields = [
+            'statut', 'etat_physique', 'categorie', 
+            'sous_categorie', 'entite', 'commune'
+        ]
+    
+    def filter_tags(self, queryset, name, value):
+        tags = value.split(',')
+        return queryset.filter(tags__overlap=tags)
+    
+    def filter_sans_responsable(self, queryset, name, value):
+        if value:
+            return queryset.filter(responsabilites__isnull=True)
+        return queryset
+    
+    def filter_categorie_arbre(self, queryset, name, value):
+        """La catégorie et toutes ses descendantes, sur l'index du chemin."""
+        chemin = CategorieArbreService.get_chemin(value)
+        if chemin is None:
+            # Catégorie inconnue ou inactive
+            return queryset.none()
+        if not chemin:
+            # Chemin pas encore calculé : un préfixe vide ne filtrerait rien
+            categorie = Categorie.objects.get(pk=value)
+            return queryset.filter(
+                categorie__in=[categorie.pk] + [c.pk for c in categorie.get_descendants()]
+            )
+        return queryset.filter(categorie__chemin__startswith=chemin)
+    
+    def filter_maintenance_en_retard(self, queryset, name, value):
+        if value:
+            return queryset.filter(
+                prochaine_maintenance__lt=datetime.now().date()
+            )
+        return queryset
+
+
+class EntiteFilter(django_filters.FilterSet):
+    """Filtres pour les entités."""
+    
+    class Meta:
+        model = Entite
+        fields = ['type', 'parent', 'commune', 'actif']
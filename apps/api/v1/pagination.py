@@ -0,0 +1,168 @@
+# apps/api/v1/pagination.py
+"""
+Pagination par curseur (keyset) pour les grands parcours du registre.
+Chaque page filtre sur (champ, id) au-delà du dernier élément lu, au lieu
+d'un OFFSET : le coût d'une page est le même en début ou en fin de
+parcours. Le total est estimé par le planificateur, sans COUNT(*).
+"""
+import base64
+import json
+from collections import OrderedDict
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def estimer_nombre(queryset) -> int:
+    """Nombre de lignes estimé par le planificateur (EXPLAIN), sans les compter."""
+    if queryset.query.is_empty():
+        # .none() : aucun SQL à expliquer (EmptyResultSet)
+        return 0
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _valeur(objet, nom):
+    """Attribut d'une instance ou clé d'une ligne values()."""
+    return objet[nom] if isinstance(objet, dict) else getattr(objet, nom)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination par curseur sur un ordre indexé, départagé par l'id.
+    Le curseur opaque encode l'ordre, la valeur de tri et l'id du dernier
+    élément de la page, et le sens de lecture. Accepte les instances
+    comme les lignes values() (qui doivent alors contenir le champ trié).
+    """
+    cursor_query_param = 'cursor'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = 'Curseur invalide'
+
+    # Ordres autorisés : chacun doit être couvert par un index (champ, id)
+    ordres = ('-created', 'created', '-modified', 'modified',
+              '-date_acquisition', 'date_acquisition',
+              'code_patrimoine', '-code_patrimoine')
+    ordre_par_defaut = '-created'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordre = self.get_ordre(request)
+        self.total_estime = None
+
+        curseur = self.decode_cursor(request)
+        inverse = bool(curseur and curseur.get('r'))
+        champ = self.ordre.lstrip('-')
+        descendant = self.ordre.startswith('-') != inverse
+
+        queryset = queryset.order_by(
+            *(f"{'-' if descendant else ''}{nom}" for nom in (champ, 'id'))
+        )
+        if curseur:
+            comparaison = 'lt' if descendant else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{champ}__{comparaison}': curseur['v']})
+                | Q(**{champ: curseur['v'], f'id__{comparaison}': curseur['id']})
+            )
+        else:
+            self.total_estime = estimer_nombre(queryset)
+
+        # Une ligne de plus pour savoir s'il reste une page dans ce sens
+        resultats = list(queryset[:self.page_size + 1])
+        suite = len(resultats) > self.page_size
+        resultats = resultats[:self.page_size]
+        if inverse:
+            resultats.reverse()
+
+        self.champ = champ
+        self.premier = resultats[0] if resultats else None
+        self.dernier = resultats[-1] if resultats else None
+        self.a_suivante = suite if not inverse else curseur is not None
+        self.a_precedente = suite if inverse else curseur is not None
+        return resultats
+
+    def get_page_size(self, request):
+        try:
+            taille = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(taille, self.max_page_size))
+
+    def get_ordre(self, request):
+        ordre = request.query_params.get('ordering', self.ordre_par_defaut)
+        return ordre if ordre in self.ordres else self.ordre_par_defaut
+
+    def decode_cursor(self, request):
+        encode = request.query_params.get(self.cursor_query_param)
+        if not encode:
+            return None
+        try:
+            curseur = json.loads(base64.urlsafe_b64decode(encode.encode('ascii')))
+            if curseur['o'] != self.ordre or 'v' not in curseur or 'id' not in curseur:
+                raise ValueError
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return curseur
+
+    def encode_cursor(self, objet, inverse=False):
+        valeur = _valeur(objet, self.champ)
+        curseur = {
+            'o': self.ordre,
+            # isoformat complet : DjangoJSONEncoder tronque les microsecondes
+            'v': valeur.isoformat() if hasattr(valeur, 'isoformat') else valeur,
+            'id': str(_valeur(objet, 'id')),
+            'r': int(inverse),
+        }
+        encode = base64.urlsafe_b64encode(
+            json.dumps(curseur).encode('ascii')
+        ).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encode)
+
+    def get_next_link(self):
+        if not self.a_suivante or self.dernier is None:
+            return None
+        return self.encode_cursor(self.dernier)
+
+    def get_previous_link(self):
+        if not self.a_precedente:
+            return None
+        if self.premier is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.premier, inverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('total_estime', self.total_estime),
+            ('page_size', self.page_size),
+            ('ordering', self.ordre),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'total_estime': {'type': 'integer', 'nullable': True},
+                'page_size': {'type': 'integer'},
+                'ordering': {'type': 'string'},
+                'results': schema,
+            },
+        }
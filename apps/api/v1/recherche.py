@@ -0,0 +1,35 @@
+# apps/api/v1/recherche.py
+"""
+Filtre DRF de recherche plein texte sur search_vector (index GIN).
+Remplace SearchFilter et ses icontains sur plusieurs colonnes.
+"""
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from apps.patrimoine.services.search_service import RechercheService
+
+
+class RechercheTexteFilter(filters.BaseFilterBackend):
+    """
+    Filtre `?search=` via le vecteur pondéré et classe par pertinence.
+    Placé après OrderingFilter : le classement par rang ne s'applique
+    que si aucun `?ordering=` explicite n'est demandé.
+    """
+    search_param = api_settings.SEARCH_PARAM
+    ordering_param = api_settings.ORDERING_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        texte = request.query_params.get(self.search_param, '')
+        if not texte.strip():
+            return queryset
+        classer = not request.query_params.get(self.ordering_param)
+        return RechercheService.rechercher(queryset, texte, classer=classer)
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Recherche plein texte (syntaxe web, français)',
+            'schema': {'type': 'string'},
+        }]
@@ -0,0 +1,13 @@
+# apps/api/v1/registre.py
+"""
+Projection du registre des biens : colonnes lues par values() et rendues
+telles quelles par l'action registre, sans sérialiseur.
+"""
+
+CHAMPS_REGISTRE = (
+    'id', 'code_patrimoine', 'code_barre', 'nom', 'statut', 'etat_physique',
+    'date_acquisition', 'valeur_acquisition', 'valeur_actuelle_cache',
+    'numero_serie', 'marque', 'modele', 'created', 'modified',
+    'categorie_id', 'categorie__nom', 'sous_categorie_id', 'sous_categorie__nom',
+    'entite_id', 'entite__code', 'entite__nom', 'responsable_actuel_nom',
+)
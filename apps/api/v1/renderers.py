@@ -0,0 +1,60 @@
+# apps/api/v1/renderers.py
+"""
+Renderers rapides pour les lectures volumineuses.
+ORJSONRenderer remplace le JSONRenderer de DRF (encodage natif des
+dates, UUID et dataclasses) ; MessagePackRenderer sert les clients
+mobiles qui le demandent via Accept: application/x-msgpack.
+Les Decimal sont rendus en chaînes, comme COERCE_DECIMAL_TO_STRING.
+"""
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+import msgpack
+import orjson
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _encoder(valeur):
+    """Types non natifs pour orjson / msgpack."""
+    if isinstance(valeur, Decimal):
+        return str(valeur)
+    if isinstance(valeur, UUID):
+        return str(valeur)
+    if isinstance(valeur, (datetime, date, time)):
+        return valeur.isoformat()
+    if isinstance(valeur, Promise):
+        return str(valeur)
+    if isinstance(valeur, (set, frozenset, tuple)):
+        return list(valeur)
+    if hasattr(valeur, 'tolist'):
+        # Scalaires et tableaux NumPy
+        return valeur.tolist()
+    raise TypeError(f"Type non sérialisable: {type(valeur).__name__}")
+
+
+class ORJSONRenderer(BaseRenderer):
+    """JSON via orjson."""
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_encoder, option=self.options)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack pour les clients scanners (Accept: application/x-msgpack)."""
+    media_type = 'application/x-msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encoder, use_bin_type=True)
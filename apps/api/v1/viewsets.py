@@ -3,31 +3,38 @@
 ViewSets API optimisés avec filtres avancés, permissions granulaires et cache.
 """
 from django.db.models import Q, Count, Sum, Avg, F, Prefetch
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, DjangoModelPermissions
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.pagination import PageNumberPagination
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from django_filters import rest_framework as django_filters
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
-import pandas as pd
-import xlsxwriter
-from io import BytesIO
 from datetime import datetime, timedelta
 
+from apps.core.utils import MetricsCollector
 from apps.patrimoine.models import (
     Bien, Categorie, SousCategorie, Entite, 
     HistoriqueValeur, ResponsableBien, BienResponsabilite,
-    Province, Departement, Commune
+    Province, Departement, Commune, ImportBiens
 )
+from apps.patrimoine.services.import_service import MODES_IMPORT
+from apps.patrimoine.services.hierarchie_service import EntiteHierarchieService
+from apps.patrimoine.services.categorie_service import CategorieArbreService
+from apps.patrimoine.services.search_service import RechercheService, AutocompletionService
+from apps.patrimoine.services.facettes_service import FacettesService
+from apps.patrimoine.services.agregation_service import StatistiquesBiensService
+from apps.patrimoine.services.cumuls_service import CumulsBiensService
+from apps.patrimoine.tasks import traiter_import_biens
 from .serializers import (
     BienSerializer, BienDetailSerializer, BienCreateSerializer,
     CategorieSerializer, SousCategorieSerializer,
@@ -36,9 +43,19 @@ from .serializers import (
     StatistiquesSerializer, DashboardSerializer
 )
 from .filters import BienFilter, EntiteFilter
+from .exports import export_csv_response, export_xlsx_response
+from .recherche import RechercheTexteFilter
+from .pagination import KeysetPagination
+from .registre import CHAMPS_REGISTRE
+from .conditionnel import RequetesConditionnellesMixin
+from .cache import CacheVueMixin
 from .permissions import IsOwnerOrReadOnly, CanManageBien
 
 
+# Paramètres de présentation sans effet sur les facettes
+PARAMETRES_HORS_FACETTES = {'page', 'page_size', 'ordering', 'format', 'pagination', 'cursor'}
+
+
 class OptimizedPagination(PageNumberPagination):
     """Pagination optimisée avec métadonnées enrichies."""
     page_size = 20
@@ -57,7 +74,7 @@ class OptimizedPagination(PageNumberPagination):
         })
 
 
-class BienViewSet(viewsets.ModelViewSet):
+class BienViewSet(RequetesConditionnellesMixin, CacheVueMixin, viewsets.ModelViewSet):
     """
     ViewSet complet pour la gestion des biens avec fonctionnalités avancées.
     """
@@ -66,58 +83,124 @@ class BienViewSet(viewsets.ModelViewSet):
     pagination_class = OptimizedPagination
     filter_backends = [
         django_filters.DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter
+        filters.OrderingFilter,
+        RechercheTexteFilter
     ]
     filterset_class = BienFilter
-    search_fields = [
-        'nom', 'code_patrimoine', 'description', 
-        'numero_serie', 'tags', 'marque', 'modele'
-    ]
     ordering_fields = [
         'nom', 'date_acquisition', 'valeur_acquisition',
         'created', 'modified', 'statut', 'etat_physique'
     ]
     ordering = ['-created']
+    modeles_dependants = (Categorie, SousCategorie, Entite)
+    # Référentiels dont les libellés figurent dans les agrégats mis en cache
+    TAGS_REFERENTIELS = ('categorie', 'entite')
+    
+    # Projection de la liste : colonnes affichées et libellés des relations,
+    # le responsable actuel étant lu sur ses colonnes dénormalisées
+    CHAMPS_LISTE = (
+        'id', 'code_patrimoine', 'nom', 'statut', 'etat_physique',
+        'date_acquisition', 'valeur_acquisition', 'valeur_actuelle_cache',
+        'numero_serie', 'marque', 'modele', 'created', 'modified',
+        'categorie__id', 'categorie__nom', 'categorie__code', 'categorie__type',
+        'sous_categorie__id', 'sous_categorie__nom', 'sous_categorie__code',
+        'entite__id', 'entite__nom', 'entite__code',
+        'responsable_actuel_id', 'responsable_actuel_nom',
+        'responsable_actuel_fonction',
+    )
+    ACTIONS_DETAIL = ('retrieve', 'update', 'partial_update')
+    # Actions à ordre propre (pertinence), toujours paginées par numéro de page
+    ACTIONS_SANS_CURSEUR = ('recherche',)
+    # Lignes values() rendues telles quelles par l'action registre
+    CHAMPS_REGISTRE = CHAMPS_REGISTRE
     
     def get_queryset(self):
-        """Queryset optimisé avec prefetch et select_related."""
-        queryset = Bien.objects.select_related(
-            'categorie',
-            'sous_categorie', 
-            'entite',
-            'entite__commune',
-            'entite__commune__departement',
-            'entite__commune__departement__province',
-            'created_by',
-            'modified_by'
-        ).prefetch_related(
-            'historique_valeurs',
-            'responsabilites__responsable__user',
-            Prefetch(
-                'responsabilites',
-                queryset=BienResponsabilite.objects.filter(
-                    actif=True,
-                    date_fin__isnull=True
-                ).select_related('responsable__user'),
-                to_attr='responsabilites_actives'
+        """
+        Plan de requête propre à chaque action.
+        La liste lit une projection étroite sans préchargements ni agrégats,
+        de sorte que le coût d'une page ne dépend pas de l'historique des
+        biens ; seul le détail charge historique et responsabilités.
+        """
+        if self.action == 'list':
+            queryset = Bien.objects.select_related(
+                'categorie', 'sous_categorie', 'entite'
+            ).only(*self.CHAMPS_LISTE)
+        elif self.action in self.ACTIONS_DETAIL:
+            queryset = Bien.objects.select_related(
+                'categorie',
+                'sous_categorie', 
+                'entite',
+                'entite__commune',
+                'entite__commune__departement',
+                'entite__commune__departement__province',
+                'created_by',
+                'modified_by',
+                'responsable_actuel__responsable__user'
+            ).prefetch_related(
+                'historique_valeurs',
+                'responsabilites__responsable__user'
+            ).annotate(
+                nombre_historiques=Count('historique_valeurs'),
+                valeur_moyenne_historique=Avg('historique_valeurs__valeur')
+            )
+        else:
+            queryset = Bien.objects.select_related(
+                'categorie', 'sous_categorie', 'entite'
             )
-        ).annotate(
-            nombre_historiques=Count('historique_valeurs'),
-            valeur_moyenne_historique=Avg('historique_valeurs__valeur')
-        )
         
+        return self.filtrer_par_perimetre(queryset)
+    
+    @property
+    def paginator(self):
+        """
+        Pagination par numéro de page, ou par curseur sur demande
+        (?pagination=cursor, puis liens next/previous) pour les parcours
+        complets du registre. La recherche garde son classement par
+        pertinence et reste paginée par numéro de page.
+        """
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            curseur = params.get('pagination') == 'cursor' or KeysetPagination.cursor_query_param in params
+            if curseur and self.action not in self.ACTIONS_SANS_CURSEUR:
+                self._paginator = KeysetPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+    
+    def get_queryset_validateurs(self):
+        return self.filter_queryset(self.filtrer_par_perimetre(Bien.objects.all()))
+    
+    def filtrer_par_perimetre(self, queryset):
+        """Restreint le queryset aux entités accessibles à l'utilisateur."""
         # Filtrer par entité si l'utilisateur n'est pas superadmin
         if not self.request.user.is_superuser:
             user_entites = self.request.user.responsabilite_biens.entite_principale
             if user_entites:
+                # Sous-arbre complet, par jointure sur la table de fermeture
                 queryset = queryset.filter(
-                    Q(entite=user_entites) | 
-                    Q(entite__parent=user_entites)
+                    entite__ancetres_liens__ancetre=user_entites
                 )
         
         return queryset.filter(is_removed=False)
     
+    def cle_perimetre(self):
+        """Identifiant du périmètre de l'utilisateur, pour les clés de cache."""
+        if self.request.user.is_superuser:
+            return 'all'
+        responsable = getattr(self.request.user, 'responsabilite_biens', None)
+        return str(getattr(responsable, 'entite_principale_id', None) or 'all')
+    
+    def tags_lecture(self):
+        """
+        Tags des agrégats de biens de l'utilisateur : une écriture hors de
+        son sous-arbre ne périme pas ses entrées.
+        """
+        perimetre = self.cle_perimetre()
+        return [
+            *self.TAGS_REFERENTIELS,
+            *EntiteHierarchieService.tags_perimetre(None if perimetre == 'all' else perimetre)
+        ]
+    
     def get_serializer_class(self):
         """Sérialiseur adapté selon l'action."""
         if self.action == 'create':
@@ -131,81 +214,116 @@ class BienViewSet(viewsets.ModelViewSet):
         responses={200: StatistiquesSerializer}
     )
     @action(detail=False, methods=['get'])
-    @method_decorator(cache_page(60 * 15))  # Cache 15 minutes
     def statistiques(self, request):
-        """Retourne les statistiques globales des biens."""
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        stats = {
-            'total_biens': queryset.count(),
-            'valeur_totale': queryset.aggregate(
-                total=Sum('valeur_acquisition')
-            )['total'] or 0,
-            'valeur_actuelle_totale': queryset.aggregate(
-                total=Sum('valeur_actuelle_cache')
-            )['total'] or 0,
-            'repartition_statut': list(
-                queryset.values('statut').annotate(
-                    count=Count('id'),
-                    valeur=Sum('valeur_acquisition')
-                ).order_by('-count')
-            ),
-            'repartition_categorie': list(
-                queryset.values(
-                    'categorie__nom',
-                    'categorie__type'
-                ).annotate(
-                    count=Count('id'),
-                    valeur=Sum('valeur_acquisition')
-                ).order_by('-valeur')
-            ),
-            'repartition_entite': list(
-                queryset.values(
-                    'entite__nom',
-                    'entite__code'
-                ).annotate(
-                    count=Count('id'),
-                    valeur=Sum('valeur_acquisition')
-                ).order_by('-valeur')[:10]
-            ),
-            'acquisitions_par_mois': list(
-                queryset.filter(
-                    date_acquisition__gte=datetime.now().date() - timedelta(days=365)
-                ).values(
-                    mois=F('date_acquisition__month'),
-                    annee=F('date_acquisition__year')
-                ).annotate(
-                    count=Count('id'),
-                    valeur=Sum('valeur_acquisition')
-                ).order_by('annee', 'mois')
-            ),
-            'top_10_valeur': list(
-                queryset.order_by('-valeur_acquisition')[:10].values(
-                    'code_patrimoine',
-                    'nom',
-                    'valeur_acquisition',
-                    'categorie__nom'
-                )
-            ),
-            'biens_critiques': {
-                'a_reformer': queryset.filter(
-                    etat_physique__in=['MAUVAIS', 'HORS_USAGE']
-                ).count(),
-                'sans_responsable': queryset.filter(
-                    responsabilites__isnull=True
-                ).count(),
-                'garantie_expiree': queryset.filter(
-                    date_fin_garantie__lt=datetime.now().date()
-                ).count(),
-                'maintenance_en_retard': queryset.filter(
-                    prochaine_maintenance__lt=datetime.now().date()
-                ).count(),
-            }
-        }
+        """
+        Retourne les statistiques globales des biens.
+        Calculées sur un queryset sans annotations : un agrégat conditionnel
+        pour les indicateurs, un GROUPING SETS pour les répartitions.
+        Mises en cache par filtres et périmètre, jusqu'à la prochaine écriture.
+        """
+        def calculer():
+            queryset = self.filter_queryset(
+                self.filtrer_par_perimetre(Bien.objects.all())
+            )
+            return StatistiquesSerializer(StatistiquesBiensService.calculer(queryset)).data
         
-        serializer = StatistiquesSerializer(stats)
-        return Response(serializer.data)
+        return self.reponse_en_cache(
+            self.tags_lecture(), calculer, cache_type='reports'
+        )
     
+    @extend_schema(
+        summary="Recherche plein texte classée des biens",
+        parameters=[
+            OpenApiParameter(name='q', type=OpenApiTypes.STR, required=True)
+        ]
+    )
+    @action(detail=False, methods=['get'])
+    def recherche(self, request):
+        """
+        Recherche pondérée (code, nom, n° de série, marque/modèle, description)
+        sur l'index GIN, résultats classés par pertinence.
+        """
+        texte = request.query_params.get('q', '').strip()
+        if not texte:
+            return Response(
+                {'error': 'Paramètre q requis'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = RechercheService.rechercher(
+            self.filter_queryset(self.filtrer_par_perimetre(Bien.objects.all())),
+            texte
+        ).values(
+            'id', 'code_patrimoine', 'nom', 'numero_serie', 'marque', 'modele',
+            'statut', 'categorie__nom', 'entite__nom', 'rang'
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
+
+    @extend_schema(summary="Registre allégé des biens (lignes à plat)")
+    @action(detail=False, methods=['get'])
+    def registre(self, request):
+        """
+        Lecture à haut débit pour les clients mobiles et la synchronisation :
+        lignes values() à plat, sans sérialiseur, filtrées et paginées comme
+        la liste (JSON via orjson, ou MessagePack sur demande).
+        """
+        queryset = self.filter_queryset(
+            self.filtrer_par_perimetre(Bien.objects.all())
+        ).values(*self.CHAMPS_REGISTRE)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
+
+    @extend_schema(
+        summary="Autocomplétion approchée des biens",
+        parameters=[
+            OpenApiParameter(name='q', type=OpenApiTypes.STR, required=True),
+            OpenApiParameter(name='limit', type=OpenApiTypes.INT, default=10)
+        ]
+    )
+    @action(detail=False, methods=['get'])
+    def autocompletion(self, request):
+        """
+        Suggestions sur code patrimoine, n° de série, code-barres et nom,
+        tolérantes aux fautes de frappe (pg_trgm).
+        """
+        try:
+            limite = int(request.query_params.get('limit', 10))
+        except ValueError:
+            limite = 10
+
+        suggestions = AutocompletionService.suggerer(
+            self.filtrer_par_perimetre(Bien.objects.all()),
+            request.query_params.get('q', ''),
+            limite=limite,
+            perimetre=self.cle_perimetre()
+        )
+        return Response(suggestions)
+
+    @extend_schema(summary="Facettes du registre pour les filtres courants")
+    @action(detail=False, methods=['get'])
+    def facettes(self, request):
+        """
+        Comptes par statut, état, catégorie, entité et année d'acquisition
+        pour les filtres de la liste, calculés en une requête GROUPING SETS.
+        """
+        def calculer():
+            queryset = self.filter_queryset(
+                self.filtrer_par_perimetre(Bien.objects.all())
+            )
+            return FacettesService.calculer(queryset)
+
+        return self.reponse_en_cache(
+            self.tags_lecture(), calculer,
+            cache_type='dashboard', ignores=PARAMETRES_HORS_FACETTES
+        )
+
     @extend_schema(
         summary="Export Excel des biens",
         parameters=[
@@ -219,89 +337,18 @@ class BienViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=['get'])
     def export(self, request):
-        """Export des biens en Excel/CSV avec filtres appliqués."""
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # Limiter à 10000 lignes pour éviter les timeouts
-        queryset = queryset[:10000]
-        
-        # Préparer les données
-        data = []
-        for bien in queryset:
-            responsable = bien.responsable_actuel
-            data.append({
-                'Code Patrimoine': bien.code_patrimoine,
-                'Nom': bien.nom,
-                'Catégorie': bien.categorie.nom,
-                'Sous-catégorie': bien.sous_categorie.nom,
-                'Entité': bien.entite.nom,
-                'Localisation': f"{bien.commune.nom if bien.commune else ''} {bien.localisation_precise}",
-                'Valeur Acquisition': float(bien.valeur_acquisition),
-                'Date Acquisition': bien.date_acquisition.strftime('%d/%m/%Y'),
-                'Statut': bien.get_statut_display(),
-                'État': bien.get_etat_physique_display(),
-                'Responsable': responsable.responsable.user.get_full_name() if responsable else '',
-                'Marque': bien.marque,
-                'Modèle': bien.modele,
-                'N° Série': bien.numero_serie,
-                'Fournisseur': bien.fournisseur,
-                'Garantie': bien.date_fin_garantie.strftime('%d/%m/%Y') if bien.date_fin_garantie else '',
-                'Tags': ', '.join(bien.tags) if bien.tags else '',
-            })
-        
-        df = pd.DataFrame(data)
-        
-        # Générer le fichier
-        output = BytesIO()
-        format_type = request.query_params.get('format', 'xlsx')
-        
-        if format_type == 'csv':
-            df.to_csv(output, index=False, encoding='utf-8-sig')
-            content_type = 'text/csv'
-            filename = f'export_biens_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        else:
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                df.to_excel(writer, sheet_name='Biens', index=False)
-                
-                # Formater l'Excel
-                workbook = writer.book
-                worksheet = writer.sheets['Biens']
-                
-                # Format pour les en-têtes
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'bg_color': '#1E88E5',
-                    'font_color': 'white',
-                    'border': 1
-                })
-                
-                # Format pour les montants
-                money_format = workbook.add_format({
-                    'num_format': '#,##0.00 "XAF"',
-                    'border': 1
-                })
-                
-                # Appliquer les formats
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                
-                worksheet.set_column('G:G', 15, money_format)  # Colonne valeur
-                worksheet.set_column('A:A', 20)  # Code patrimoine
-                worksheet.set_column('B:B', 30)  # Nom
-                
-                # Ajouter les filtres
-                worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
-                
-            content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            filename = f'export_biens_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-        
-        output.seek(0)
-        response = HttpResponse(
-            output.read(),
-            content_type=content_type
+        """
+        Export des biens en Excel/CSV avec filtres appliqués.
+        Les lignes sont diffusées en flux, sans limite de nombre.
+        """
+        # Projection légère : ni préchargements ni agrégats de get_queryset
+        queryset = self.filter_queryset(
+            self.filtrer_par_perimetre(Bien.objects.all())
         )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        return response
+        
+        if request.query_params.get('format', 'xlsx') == 'csv':
+            return export_csv_response(queryset)
+        return export_xlsx_response(queryset)
     
     @extend_schema(
         summary="Import en masse de biens",
@@ -310,7 +357,8 @@ class BienViewSet(viewsets.ModelViewSet):
                 'type': 'object',
                 'properties': {
                     'file': {'type': 'string', 'format': 'binary'},
-                    'mode': {'type': 'string', 'enum': ['create', 'update', 'upsert']}
+                    'mode': {'type': 'string', 'enum': ['create', 'update', 'upsert']},
+                    'chunk_size': {'type': 'integer', 'default': 1000}
                 }
             }
         }
@@ -321,7 +369,10 @@ class BienViewSet(viewsets.ModelViewSet):
         parser_classes=[MultiPartParser, FormParser]
     )
     def import_bulk(self, request):
-        """Import en masse de biens depuis Excel/CSV."""
+        """
+        Import en masse de biens depuis Excel/CSV.
+        Crée un job asynchrone ; la progression se suit via import_statut.
+        """
         if 'file' not in request.FILES:
             return Response(
                 {'error': 'Aucun fichier fourni'},
@@ -330,87 +381,71 @@ class BienViewSet(viewsets.ModelViewSet):
         
         file = request.FILES['file']
         mode = request.data.get('mode', 'create')
+        if mode not in MODES_IMPORT:
+            return Response(
+                {'error': f'Mode invalide: {mode}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         try:
-            # Lire le fichier
-            if file.name.endswith('.csv'):
-                df = pd.read_csv(file, encoding='utf-8-sig')
-            else:
-                df = pd.read_excel(file)
-            
-            results = {
-                'success': 0,
-                'errors': 0,
-                'details': []
-            }
-            
-            # Traiter chaque ligne
-            for index, row in df.iterrows():
-                try:
-                    # Mapper les données
-                    data = {
-                        'code_patrimoine': row.get('Code Patrimoine'),
-                        'nom': row.get('Nom'),
-                        'description': row.get('Description', ''),
-                        'valeur_acquisition': row.get('Valeur Acquisition'),
-                        'date_acquisition': pd.to_datetime(row.get('Date Acquisition')).date(),
-                        # ... mapper autres champs
-                    }
-                    
-                    if mode == 'update':
-                        bien = Bien.objects.get(code_patrimoine=data['code_patrimoine'])
-                        serializer = BienCreateSerializer(
-                            bien, 
-                            data=data, 
-                            partial=True,
-                            context={'request': request}
-                        )
-                    elif mode == 'upsert':
-                        bien = Bien.objects.filter(
-                            code_patrimoine=data['code_patrimoine']
-                        ).first()
-                        if bien:
-                            serializer = BienCreateSerializer(
-                                bien,
-                                data=data,
-                                partial=True,
-                                context={'request': request}
-                            )
-                        else:
-                            serializer = BienCreateSerializer(
-                                data=data,
-                                context={'request': request}
-                            )
-                    else:  # create
-                        serializer = BienCreateSerializer(
-                            data=data,
-                            context={'request': request}
-                        )
-                    
-                    if serializer.is_valid():
-                        serializer.save()
-                        results['success'] += 1
-                    else:
-                        results['errors'] += 1
-                        results['details'].append({
-                            'row': index + 2,
-                            'errors': serializer.errors
-                        })
-                
-                except Exception as e:
-                    results['errors'] += 1
-                    results['details'].append({
-                        'row': index + 2,
-                        'errors': str(e)
-                    })
-            
-            return Response(results)
-            
-        except Exception as e:
+            chunk_size = int(request.data.get('chunk_size', 1000))
+        except (TypeError, ValueError):
+            chunk_size = 1000
+        
+        if not file.name.lower().endswith(('.csv', '.xls', '.xlsx')):
             return Response(
-                {'error': f'Erreur lors de la lecture du fichier: {str(e)}'},
+                {'error': 'Format de fichier non supporté (CSV ou Excel attendu)'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # Le fichier est stocké puis traité par lots en tâche de fond
+        job = ImportBiens.objects.create(
+            fichier=file,
+            mode=mode,
+            chunk_size=max(1, min(chunk_size, 5000)),
+            created_by=request.user
+        )
+        transaction.on_commit(
+            lambda: traiter_import_biens.delay(str(job.id))
+        )
+        
+        return Response(
+            self._etat_import(job),
+            status=status.HTTP_202_ACCEPTED
+        )
+    
+    @extend_schema(summary="Progression d'un import en masse")
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'imports/(?P<job_id>[0-9a-f-]+)'
+    )
+    def import_statut(self, request, job_id=None):
+        """Retourne l'état d'avancement d'un import."""
+        queryset = ImportBiens.objects.all()
+        if not request.user.is_superuser:
+            queryset = queryset.filter(created_by=request.user)
+        job = get_object_or_404(queryset, pk=job_id)
+        
+        data = self._etat_import(job)
+        data['erreurs'] = job.erreurs
+        return Response(data)
+    
+    def _etat_import(self, job):
+        """Résumé sérialisable d'un job d'import."""
+        return {
+            'id': str(job.id),
+            'statut': job.statut,
+            'mode': job.mode,
+            'lignes_total': job.lignes_total,
+            'lignes_traitees': job.lignes_traitees,
+            'lignes_importees': job.lignes_importees,
+            'lignes_en_erreur': job.lignes_en_erreur,
+            'progression': job.progression,
+            'message': job.message,
+            'date_debut': job.date_debut,
+            'date_fin': job.date_fin,
+        }
     
     @extend_schema(summary="Transférer un bien vers une autre entité")
     @action(detail=True, methods=['post'])
@@ -521,7 +556,7 @@ class BienViewSet(viewsets.ModelViewSet):
         return response
 
 
-class EntiteViewSet(viewsets.ModelViewSet):
+class EntiteViewSet(RequetesConditionnellesMixin, viewsets.ModelViewSet):
     """
     ViewSet pour la gestion des entités avec hiérarchie.
     """
@@ -548,6 +583,11 @@ class EntiteViewSet(viewsets.ModelViewSet):
     search_fields = ['nom', 'code', 'responsable__first_name', 'responsable__last_name']
     ordering_fields = ['nom', 'created', 'type']
     ordering = ['type', 'nom']
+    # Compteurs et montants des biens annotés sur chaque entité
+    modeles_dependants = (Bien,)
+    
+    def get_queryset_validateurs(self):
+        return self.filter_queryset(Entite.objects.all())
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -556,32 +596,9 @@ class EntiteViewSet(viewsets.ModelViewSet):
     
     @extend_schema(summary="Arbre hiérarchique des entités")
     @action(detail=False, methods=['get'])
-    @method_decorator(cache_page(60 * 30))  # Cache 30 minutes
     def arbre(self, request):
         """Retourne l'arbre hiérarchique complet des entités."""
-        
-        def build_tree(parent=None):
-            entites = Entite.objects.filter(
-                parent=parent,
-                actif=True
-            ).order_by('type', 'nom')
-            
-            tree = []
-            for entite in entites:
-                node = {
-                    'id': str(entite.id),
-                    'nom': entite.nom,
-                    'code': entite.code,
-                    'type': entite.type,
-                    'responsable': entite.responsable.get_full_name() if entite.responsable else None,
-                    'nombre_biens': entite.biens.count(),
-                    'enfants': build_tree(entite)
-                }
-                tree.append(node)
-            
-            return tree
-        
-        return Response(build_tree())
+        return Response(EntiteHierarchieService.get_arbre())
     
     @extend_schema(summary="Dashboard de l'entité")
     @action(detail=True, methods=['get'])
@@ -589,33 +606,36 @@ class EntiteViewSet(viewsets.ModelViewSet):
         """Retourne le dashboard complet d'une entité."""
         entite = self.get_object()
         
-        # Inclure les sous-entités
-        entites_ids = [entite.id]
-        entites_ids.extend(
-            entite.sous_entites.values_list('id', flat=True)
-        )
+        # Inclure toutes les sous-entités, à toute profondeur
+        biens = Bien.objects.filter(entite__ancetres_liens__ancetre=entite)
         
-        biens = Bien.objects.filter(entite_id__in=entites_ids)
+        # Totaux lus sur les cumuls pré-agrégés du sous-arbre
+        totaux = {'total': 0, 'valeur_totale': 0, 'valeur_actuelle': 0}
+        par_statut, par_etat = {}, {}
+        for cumul in CumulsBiensService.cumuls(entite).values(
+            'statut', 'etat_physique'
+        ).annotate(
+            nombre=Sum('nombre_biens'),
+            valeur_totale=Sum('valeur_acquisition'),
+            valeur_actuelle=Sum('valeur_actuelle')
+        ).order_by():
+            totaux['total'] += cumul['nombre']
+            totaux['valeur_totale'] += cumul['valeur_totale']
+            totaux['valeur_actuelle'] += cumul['valeur_actuelle']
+            par_statut[cumul['statut']] = par_statut.get(cumul['statut'], 0) + cumul['nombre']
+            par_etat[cumul['etat_physique']] = par_etat.get(cumul['etat_physique'], 0) + cumul['nombre']
         
         dashboard_data = {
             'entite': EntiteDetailSerializer(entite).data,
             'statistiques': {
-                'total_biens': biens.count(),
-                'valeur_totale': biens.aggregate(
-                    Sum('valeur_acquisition')
-                )['valeur_acquisition__sum'] or 0,
-                'valeur_actuelle': biens.aggregate(
-                    Sum('valeur_actuelle_cache')
-                )['valeur_actuelle_cache__sum'] or 0,
+                'total_biens': totaux['total'],
+                'valeur_totale': totaux['valeur_totale'],
+                'valeur_actuelle': totaux['valeur_actuelle'],
                 'nombre_responsables': ResponsableBien.objects.filter(
                     entite_principale=entite
                 ).count(),
-                'biens_par_statut': dict(
-                    biens.values_list('statut').annotate(Count('id'))
-                ),
-                'biens_par_etat': dict(
-                    biens.values_list('etat_physique').annotate(Count('id'))
-                ),
+                'biens_par_statut': par_statut,
+                'biens_par_etat': par_etat,
             },
             'alertes': {
                 'maintenances_en_retard': biens.filter(
@@ -624,9 +644,7 @@ class EntiteViewSet(viewsets.ModelViewSet):
                 'garanties_expirees': biens.filter(
                     date_fin_garantie__lt=datetime.now().date()
                 ).count(),
-                'biens_a_reformer': biens.filter(
-                    etat_physique__in=['MAUVAIS', 'HORS_USAGE']
-                ).count(),
+                'biens_a_reformer': par_etat.get('MAUVAIS', 0) + par_etat.get('HORS_USAGE', 0),
             },
             'derniers_mouvements': MouvementSerializer(
                 MouvementBien.objects.filter(
@@ -639,7 +657,7 @@ class EntiteViewSet(viewsets.ModelViewSet):
         return Response(dashboard_data)
 
 
-class CategorieViewSet(viewsets.ReadOnlyModelViewSet):
+class CategorieViewSet(RequetesConditionnellesMixin, CacheVueMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet pour les catégories (lecture seule).
     """
@@ -655,106 +673,79 @@ class CategorieViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['nom', 'code']
     ordering = ['type', 'ordre', 'nom']
+    modeles_dependants = (SousCategorie, Bien)
+    # Liste en cache jusqu'à la prochaine écriture sur ces modèles
+    tags_liste_cache = ('categorie', 'souscategorie', 'bien')
     
-    @method_decorator(cache_page(60 * 60))  # Cache 1 heure
-    def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+    def get_queryset_validateurs(self):
+        return self.filter_queryset(Categorie.objects.all())
     
     @extend_schema(summary="Arbre des catégories avec sous-catégories")
     @action(detail=False, methods=['get'])
-    @method_decorator(cache_page(60 * 60))
     def arbre_complet(self, request):
         """Retourne l'arbre complet des catégories et sous-catégories."""
-        categories = self.get_queryset().filter(parent__isnull=True)
-        
-        data = []
-        for cat in categories:
-            cat_data = {
-                'id': str(cat.id),
-                'nom': cat.nom,
-                'code': cat.code,
-                'type': cat.type,
-                'icone': cat.icone,
-                'couleur': cat.couleur,
-                'sous_categories': SousCategorieSerializer(
-                    cat.sous_categories.filter(actif=True),
-                    many=True
-                ).data,
-                'enfants': CategorieSerializer(
-                    cat.enfants.filter(actif=True),
-                    many=True
-                ).data
-            }
-            data.append(cat_data)
-        
-        return Response(data)
+        return Response(CategorieArbreService.get_arbre())
 
 
-# Filtres personnalisés
-class BienFilter(django_filters.FilterSet):
-    """Filtres avancés pour les biens."""
-    
-    valeur_min = django_filters.NumberFilter(
-        field_name='valeur_acquisition',
-        lookup_expr='gte'
-    )
-    valeur_max = django_filters.NumberFilter(
-        field_name='valeur_acquisition',
-        lookup_expr='lte'
-    )
-    date_acquisition_debut = django_filters.DateFilter(
-        field_name='date_acquisition',
-        lookup_expr='gte'
-    )
-    date_acquisition_fin = django_filters.DateFilter(
-        field_name='date_acquisition',
-        lookup_expr='lte'
-    )
-    province = django_filters.CharFilter(
-        field_name='commune__departement__province__id',
-        lookup_expr='exact'
-    )
-    departement = django_filters.CharFilter(
-        field_name='commune__departement__id',
-        lookup_expr='exact'
-    )
-    tags = django_filters.CharFilter(
-        method='filter_tags'
-    )
-    sans_responsable = django_filters.BooleanFilter(
-        method='filter_sans_responsable'
-    )
-    maintenance_en_retard = django_filters.BooleanFilter(
-        method='filter_maintenance_en_retard'
-    )
+class PerformanceViewSet(viewsets.ViewSet):
+    """
+    Latences par route (p50/p95/p99) et temps DB, fusionnés depuis les
+    histogrammes de PerformanceMetric sur une plage quelconque.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
     
-    class Meta:
-        model = Bien
-        fields = [
-            'statut', 'etat_physique', 'categorie', 
-            'sous_categorie', 'entite', 'commune'
+    @extend_schema(
+        summary="Routes les plus lentes",
+        parameters=[
+            OpenApiParameter(name='debut', type=OpenApiTypes.DATETIME),
+            OpenApiParameter(name='fin', type=OpenApiTypes.DATETIME),
+            OpenApiParameter(name='tri', type=OpenApiTypes.STR, enum=MetricsCollector.TRIS),
+            OpenApiParameter(name='limite', type=OpenApiTypes.INT),
         ]
-    
-    def filter_tags(self, queryset, name, value):
-        tags = value.split(',')
-        return queryset.filter(tags__overlap=tags)
-    
-    def filter_sans_responsable(self, queryset, name, value):
-        if value:
-            return queryset.filter(responsabilites__isnull=True)
-        return queryset
-    
-    def filter_maintenance_en_retard(self, queryset, name, value):
-        if value:
-            return queryset.filter(
-                prochaine_maintenance__lt=datetime.now().date()
+    )
+    @action(detail=False, methods=['get'])
+    def routes(self, request):
+        """Classement des routes par p99 (défaut) ou par temps DB cumulé ; 24 dernières heures par défaut."""
+        fin = self._date(request, 'fin')
+        debut = self._date(request, 'debut')
+        tri = request.query_params.get('tri', 'p99')
+        try:
+            limite = min(int(request.query_params.get('limite', 20)), 100)
+        except ValueError:
+            limite = None
+        
+        if debut is False or fin is False or limite is None or limite < 1:
+            return Response(
+                {'error': 'Paramètres debut, fin (ISO 8601) ou limite invalides'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-        return queryset
-
-
-class EntiteFilter(django_filters.FilterSet):
-    """Filtres pour les entités."""
+        fin = fin or timezone.now()
+        debut = debut or fin - timedelta(days=1)
+        if tri not in MetricsCollector.TRIS or debut >= fin:
+            return Response(
+                {'error': f"tri parmi {', '.join(MetricsCollector.TRIS)}, debut avant fin"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({
+            'debut': debut,
+            'fin': fin,
+            'periode': MetricsCollector.periode_pour(debut, fin),
+            'tri': tri,
+            'routes': MetricsCollector.classement_routes(debut, fin, tri=tri, limite=limite),
+        })
     
-    class Meta:
-        model = Entite
-        fields = ['type', 'parent', 'commune', 'actif']
+    @staticmethod
+    def _date(request, nom):
+        """Date du paramètre `nom` ; None si absent, False si invalide."""
+        valeur = request.query_params.get(nom)
+        if not valeur:
+            return None
+        try:
+            date = parse_datetime(valeur)
+        except ValueError:
+            # Bien formée mais impossible (2024-02-30T00:00)
+            return False
+        if date is None:
+            return False
+        return timezone.make_aware(date) if timezone.is_naive(date) else date
@@ -1,5 +1,6 @@
 # apps/core/apps.py
 from django.apps import AppConfig
+from django.db import DatabaseError
 
 
 class CoreConfig(AppConfig):
@@ -13,6 +14,11 @@ class CoreConfig(AppConfig):
         """Initialisation des composants core."""
         self._setup_logging()
         self._validate_environment()
+        try:
+            self._setup_periodic_tasks()
+        except (ImportError, DatabaseError):
+            # django_celery_beat absent ou tables pas encore migrées
+            pass
     
     def _setup_logging(self):
         """Configure le système de logging avancé."""
@@ -33,4 +39,25 @@ class CoreConfig(AppConfig):
                 warnings.warn("SECRET_KEY par défaut détectée en production!")
             
             if not settings.ALLOWED_HOSTS:
-                warnings.warn("ALLOWED_HOSTS vide en production!")
\ No newline at end of file
+                warnings.warn("ALLOWED_HOSTS vide en production!")
+    
+    def _setup_periodic_tasks(self):
+        """Configure les tâches périodiques de maintenance."""
+        from django_celery_beat.models import PeriodicTask, CrontabSchedule
+        import json
+        
+        # Purge quotidienne des métriques de performance fines à 3h
+        schedule, created = CrontabSchedule.objects.get_or_create(
+            minute=0,
+            hour=3,
+            day_of_week='*',
+            day_of_month='*',
+            month_of_year='*',
+        )
+        
+        PeriodicTask.objects.get_or_create(
+            crontab=schedule,
+            name='Nettoyage métriques de performance OPRAG',
+            task='apps.core.tasks.cleanup_old_performance_metrics',
+            kwargs=json.dumps({}),
+        )
@@ -1,39 +1,69 @@
 # apps/core/decorators.py
 from functools import wraps
+from typing import Optional
 from django.http import JsonResponse
-from django.core.cache import cache
 from django.conf import settings
+import math
 import time
 import logging
 
+from .utils import CacheManager, RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
-def rate_limit(requests_per_minute: int = 60):
-    """Décorateur de limitation de taux pour les vues."""
+def rate_limit(requests_per_minute: int = 60, entite_requests_per_minute: Optional[int] = None,
+               route: Optional[str] = None):
+    """
+    Décorateur de limitation de taux pour les vues (fenêtre glissante d'une minute).
+    
+    Le quota s'applique par route et par utilisateur (ou par IP pour un
+    anonyme) ; `entite_requests_per_minute` ajoute un quota partagé par
+    tous les utilisateurs d'une même entité. settings.RATE_LIMIT_ROUTES
+    peut surcharger les deux quotas d'une route :
+    {'nom-de-route': {'user': 120, 'entite': 600}}.
+    """
     
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
             
-            # Identifier l'utilisateur (IP + user si authentifié)
-            ip = request.META.get('REMOTE_ADDR', '0.0.0.0')
-            user_id = request.user.id if request.user.is_authenticated else 'anonymous'
-            key = f"rate_limit:{ip}:{user_id}"
+            nom_route = route or getattr(
+                getattr(request, 'resolver_match', None), 'view_name', None
+            ) or view_func.__name__
+            surcharges = getattr(settings, 'RATE_LIMIT_ROUTES', {}).get(nom_route, {})
+            
+            # Identifier l'utilisateur (user si authentifié, sinon IP)
+            if request.user.is_authenticated:
+                identifiant = f"user:{request.user.id}"
+            else:
+                identifiant = f"ip:{request.META.get('REMOTE_ADDR', '0.0.0.0')}"
+            quotas = [(
+                f"{nom_route}:{identifiant}",
+                surcharges.get('user', requests_per_minute)
+            )]
             
-            # Vérifier le cache
-            current_requests = cache.get(key, 0)
+            limite_entite = surcharges.get('entite', entite_requests_per_minute)
+            if limite_entite and request.user.is_authenticated:
+                responsable = getattr(request.user, 'responsabilite_biens', None)
+                entite_id = getattr(responsable, 'entite_principale_id', None)
+                if entite_id:
+                    quotas.append((f"{nom_route}:entite:{entite_id}", limite_entite))
             
-            if current_requests >= requests_per_minute:
-                return JsonResponse({
+            # Un seul aller-retour, atomique, pour tous les quotas
+            resultat = RateLimiter.check(quotas, window=60)
+            if not resultat.allowed:
+                retry_after = max(1, math.ceil(resultat.retry_after))
+                response = JsonResponse({
                     'error': 'Trop de requêtes. Veuillez patienter.',
-                    'retry_after': 60
+                    'retry_after': retry_after
                 }, status=429)
+                response['Retry-After'] = str(retry_after)
+                return response
             
-            # Incrémenter le compteur
-            cache.set(key, current_requests + 1, 60)  # TTL de 1 minute
-            
-            return view_func(request, *args, **kwargs)
+            response = view_func(request, *args, **kwargs)
+            response['X-RateLimit-Remaining'] = str(resultat.remaining)
+            return response
         
         return wrapper
     return decorator
@@ -3,12 +3,15 @@ from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.utils.deprecation import MiddlewareMixin
 from django.core.cache import cache
-from django.db import connection
+from django.db import connections
 from django.conf import settings
+from contextlib import ExitStack
 import time
 import logging
 import pytz
 
+from .utils import MetricsCollector
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
@@ -203,21 +206,54 @@ class AuditLogMiddleware(MiddlewareMixin):
         return ip
 
 
+class CompteurRequetesSQL:
+    """execute_wrapper qui compte et chronomètre les requêtes SQL, sans dépendre de DEBUG."""
+    
+    __slots__ = ('nombre', 'duree')
+    
+    def __init__(self):
+        self.nombre = 0
+        self.duree = 0.0
+    
+    def __call__(self, execute, sql, params, many, context):
+        self.nombre += 1
+        debut = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duree += time.perf_counter() - debut
+
+
 class PerformanceMonitoringMiddleware(MiddlewareMixin):
     """
     Middleware de monitoring des performances avec alertes automatiques.
     Suit les temps de réponse, les requêtes lentes, et l'utilisation des ressources.
+    
+    Synchrone uniquement : sous ASGI, Django exécute la chaîne dans un même
+    thread, où le compteur SQL reste installé sur les connexions pendant
+    toute la vue.
     """
     
+    sync_capable = True
+    async_capable = False
+    
     # Seuils d'alerte (en secondes)
-    SLOW_REQUEST_THRESHOLD = 2.0
+    SLOW_REQUEST_THRESHOLD = MetricsCollector.SLOW_THRESHOLD
     VERY_SLOW_REQUEST_THRESHOLD = 5.0
     
+    def __call__(self, request):
+        """Compte les requêtes SQL exécutées pendant le traitement, DEBUG ou non."""
+        compteur = CompteurRequetesSQL()
+        request._perf_compteur = compteur
+        with ExitStack() as pile:
+            for alias in connections:
+                pile.enter_context(connections[alias].execute_wrapper(compteur))
+            return super().__call__(request)
+    
     def process_request(self, request):
         """Démarre le monitoring de la requête."""
         
-        request._perf_start_time = time.time()
-        request._perf_queries_before = len(connection.queries)
+        request._perf_start_time = time.perf_counter()
     
     def process_response(self, request, response):
         """Enregistre les métriques de performance."""
@@ -226,8 +262,8 @@ class PerformanceMonitoringMiddleware(MiddlewareMixin):
             return response
         
         # Calculer les métriques
-        duration = time.time() - request._perf_start_time
-        queries_count = len(connection.queries) - request._perf_queries_before
+        duration = time.perf_counter() - request._perf_start_time
+        queries_count = request._perf_compteur.nombre if hasattr(request, '_perf_compteur') else 0
         
         # Enregistrer dans les logs
         self._log_performance_metrics(request, response, duration, queries_count)
@@ -245,40 +281,37 @@ class PerformanceMonitoringMiddleware(MiddlewareMixin):
         
         return response
     
+    def _route(self, request):
+        """Route résolue plutôt que le chemin, pour borner le nombre de séries."""
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return f"{request.method} <non résolue>"
+        return f"{request.method} {match.route or match.view_name}"
+    
     def _log_performance_metrics(self, request, response, duration, queries_count):
         """Enregistre les métriques de performance."""
         
-        # Log structuré pour l'analyse
-        logger.info(
-            "Performance metrics",
-            extra={
-                'path': request.path,
-                'method': request.method,
-                'status_code': response.status_code,
-                'duration_seconds': round(duration, 3),
-                'db_queries_count': queries_count,
-                'user_id': request.user.id if request.user.is_authenticated else None,
-                'ip_address': self._get_client_ip(request),
-            }
+        # Agrégation en mémoire, vidée périodiquement dans PerformanceMetric
+        compteur = getattr(request, '_perf_compteur', None)
+        MetricsCollector.record(
+            self._route(request), duration, queries_count, response.status_code,
+            compteur.duree if compteur else 0.0
         )
         
-        # Sauvegarder en cache pour le dashboard de monitoring
-        cache_key = f"perf_metrics_{int(time.time() // 60)}"  # Par minute
-        metrics = cache.get(cache_key, {
-            'total_requests': 0,
-            'total_duration': 0,
-            'slow_requests': 0,
-            'db_queries': 0
-        })
-        
-        metrics['total_requests'] += 1
-        metrics['total_duration'] += duration
-        metrics['db_queries'] += queries_count
-        
-        if duration > self.SLOW_REQUEST_THRESHOLD:
-            metrics['slow_requests'] += 1
-        
-        cache.set(cache_key, metrics, 3600)  # 1 heure
+        # Log structuré détaillé, seulement si le niveau DEBUG est actif
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Performance metrics",
+                extra={
+                    'path': request.path,
+                    'method': request.method,
+                    'status_code': response.status_code,
+                    'duration_seconds': round(duration, 3),
+                    'db_queries_count': queries_count,
+                    'user_id': request.user.id if request.user.is_authenticated else None,
+                    'ip_address': self._get_client_ip(request),
+                }
+            )
     
     def _alert_slow_request(self, request, duration, queries_count):
         """Alerte pour requête lente."""
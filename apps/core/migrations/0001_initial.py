@@ -0,0 +1,68 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:41
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerformanceMetric',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('periode', models.CharField(default='minute', max_length=20)),
+                ('route', models.CharField(blank=True, default='', max_length=255)),
+                ('total_requests', models.PositiveIntegerField(default=0)),
+                ('avg_response_time', models.FloatField(default=0.0)),
+                ('slow_requests_count', models.PositiveIntegerField(default=0)),
+                ('error_rate', models.FloatField(default=0.0)),
+                ('avg_db_queries', models.FloatField(default=0.0)),
+                ('max_db_queries', models.PositiveIntegerField(default=0)),
+                ('avg_db_time', models.FloatField(default=0.0)),
+                ('histogramme', models.JSONField(blank=True, default=dict)),
+                ('memory_usage_mb', models.FloatField(blank=True, null=True)),
+                ('cpu_usage_percent', models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'core_performance_metric',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['periode', 'route', 'timestamp'], name='core_perfor_periode_8d169f_idx')],
+                'unique_together': {('timestamp', 'periode', 'route')},
+            },
+        ),
+        migrations.CreateModel(
+            name='AuditLog',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('action', models.CharField(choices=[('CREATE', 'Création'), ('UPDATE', 'Modification'), ('DELETE', 'Suppression'), ('VIEW', 'Consultation'), ('EXPORT', 'Export'), ('LOGIN', 'Connexion'), ('LOGOUT', 'Déconnexion')], max_length=20)),
+                ('method', models.CharField(max_length=10)),
+                ('path', models.CharField(max_length=500)),
+                ('session_key', models.CharField(blank=True, max_length=40)),
+                ('ip_address', models.GenericIPAddressField()),
+                ('user_agent', models.TextField(blank=True)),
+                ('status_code', models.PositiveIntegerField()),
+                ('success', models.BooleanField()),
+                ('duration_ms', models.FloatField(blank=True, null=True)),
+                ('request_data', models.JSONField(blank=True, default=dict)),
+                ('response_data', models.JSONField(blank=True, default=dict)),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'core_audit_log',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['user', 'timestamp'], name='core_audit__user_id_66db5a_idx'), models.Index(fields=['action', 'timestamp'], name='core_audit__action_1cc579_idx'), models.Index(fields=['ip_address', 'timestamp'], name='core_audit__ip_addr_f0c0f7_idx')],
+            },
+        ),
+    ]
@@ -65,6 +65,8 @@ class PerformanceMetric(models.Model):
     # Période de mesure
     timestamp = models.DateTimeField(default=timezone.now)
     periode = models.CharField(max_length=20, default='minute')  # minute, hour, day
+    # Route résolue ('GET api/v1/biens/<pk>/') ; vide pour l'agrégat global
+    route = models.CharField(max_length=255, blank=True, default='')
     
     # Métriques globales
     total_requests = models.PositiveIntegerField(default=0)
@@ -75,6 +77,10 @@ class PerformanceMetric(models.Model):
     # Métriques base de données
     avg_db_queries = models.FloatField(default=0.0)
     max_db_queries = models.PositiveIntegerField(default=0)
+    avg_db_time = models.FloatField(default=0.0)  # secondes par requête
+    
+    # Histogramme des latences (classe logarithmique -> nombre de requêtes)
+    histogramme = models.JSONField(default=dict, blank=True)
     
     # Utilisation mémoire et CPU (si disponible)
     memory_usage_mb = models.FloatField(null=True, blank=True)
@@ -83,4 +89,7 @@ class PerformanceMetric(models.Model):
     class Meta:
         db_table = 'core_performance_metric'
         ordering = ['-timestamp']
-        unique_together = ['timestamp', 'periode']
\ No newline at end of file
+        unique_together = ['timestamp', 'periode', 'route']
+        indexes = [
+            models.Index(fields=['periode', 'route', 'timestamp']),
+        ]
\ No newline at end of file
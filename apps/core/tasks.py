@@ -55,49 +55,75 @@ def cleanup_old_audit_logs():
 
 
 @shared_task
-def generate_performance_report():
-    """Génère un rapport de performance quotidien."""
+def cleanup_old_performance_metrics():
+    """Purge les métriques de performance fines : minutes (7 jours), heures (90 jours)."""
     
     try:
         from apps.core.models import PerformanceMetric
+        from apps.core.utils import MetricsCollector
+        from datetime import timedelta
+        
+        now = timezone.now()
+        deleted_count = 0
+        for periode, jours in MetricsCollector.RETENTION_JOURS.items():
+            deleted_count += PerformanceMetric.objects.filter(
+                periode=periode, timestamp__lt=now - timedelta(days=jours)
+            ).delete()[0]
+        
+        logger.info(f"Nettoyage métriques: {deleted_count} lignes supprimées")
+        return deleted_count
+        
+    except Exception as e:
+        logger.error(f"Erreur lors du nettoyage des métriques de performance: {e}")
+        return 0
+
+
+@shared_task
+def generate_performance_report():
+    """
+    Génère le rapport de performance des dernières 24h : percentiles
+    globaux et routes les plus lentes, fusionnés depuis les histogrammes.
+    """
+    
+    try:
+        from apps.core.utils import MetricsCollector
         from datetime import timedelta
         
-        # Agréger les métriques des dernières 24h
-        yesterday = timezone.now() - timedelta(days=1)
-        
-        metrics = PerformanceMetric.objects.filter(
-            timestamp__gte=yesterday,
-            periode='minute'
-        ).aggregate(
-            avg_response_time=models.Avg('avg_response_time'),
-            total_requests=models.Sum('total_requests'),
-            total_slow_requests=models.Sum('slow_requests_count'),
-            avg_error_rate=models.Avg('error_rate')
+        fin = timezone.now()
+        debut = fin - timedelta(days=1)
+        
+        global_ = MetricsCollector.statistiques_routes(debut, fin, routes=['']).get('')
+        if not global_ or not global_.requetes:
+            return "Aucune requête mesurée"
+        
+        histogramme = global_.histogramme
+        error_rate = global_.erreurs * 100 / global_.requetes
+        logger.info(
+            f"Rapport performance 24h: {global_.requetes} requêtes, "
+            f"p50 {histogramme.quantile(0.50):.0f} ms, p95 {histogramme.quantile(0.95):.0f} ms, "
+            f"p99 {histogramme.quantile(0.99):.0f} ms, {global_.lentes} lentes, "
+            f"erreurs {error_rate:.2f}%"
         )
         
-        # Créer un rapport quotidien
-        if metrics['total_requests']:
-            daily_metric = PerformanceMetric.objects.create(
-                periode='day',
-                total_requests=metrics['total_requests'],
-                avg_response_time=metrics['avg_response_time'] or 0,
-                slow_requests_count=metrics['total_slow_requests'] or 0,
-                error_rate=metrics['avg_error_rate'] or 0,
+        plus_lentes = MetricsCollector.classement_routes(debut, fin, tri='p99', limite=5)
+        for ligne in plus_lentes:
+            logger.info(
+                f"Route lente: {ligne['route']} p99 {ligne['p99_ms']} ms, "
+                f"DB {ligne['temps_db_moyen_ms']} ms/requête ({ligne['requetes']} requêtes)"
+            )
+        
+        # Envoyer une alerte si nécessaire
+        if error_rate > 5.0:
+            send_mail(
+                subject='[OPRAG] Alerte: Taux d\'erreur élevé',
+                message=f'Taux d\'erreur sur 24h: {error_rate:.2f}%',
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipient_list=settings.ADMIN_EMAIL_LIST,
+                fail_silently=True
             )
-            
-            # Envoyer une alerte si nécessaire
-            if metrics['avg_error_rate'] and metrics['avg_error_rate'] > 5.0:
-                send_mail(
-                    subject='[OPRAG] Alerte: Taux d\'erreur élevé',
-                    message=f'Taux d\'erreur moyen: {metrics["avg_error_rate"]:.2f}%',
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=settings.ADMIN_EMAIL_LIST,
-                    fail_silently=True
-                )
-            
-            return f"Rapport quotidien généré: {daily_metric.id}"
+        
+        return f"Rapport généré: {global_.requetes} requêtes, p99 {histogramme.quantile(0.99):.0f} ms"
         
     except Exception as e:
         logger.error(f"Erreur lors de la génération du rapport de performance: {e}")
         return f"Erreur: {str(e)}"
-
@@ -1,16 +1,79 @@
 # apps/core/utils.py
 from django.core.cache import cache
 from django.conf import settings
-from typing import Any, Optional
+from django.db import transaction
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import atexit
 import hashlib
 import json
 import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
 
+class CacheLocal:
+    """Cache LRU borné avec expiration, local au processus."""
+    
+    def __init__(self, taille_max: int, ttl: int):
+        self.taille_max = taille_max
+        self.ttl = ttl
+        self._donnees = OrderedDict()
+        self._verrou = threading.Lock()
+    
+    def get(self, cle):
+        with self._verrou:
+            entree = self._donnees.get(cle)
+            if entree is None:
+                return None
+            expire_le, valeur = entree
+            if expire_le < time.monotonic():
+                del self._donnees[cle]
+                return None
+            self._donnees.move_to_end(cle)
+            return valeur
+    
+    def set(self, cle, valeur):
+        with self._verrou:
+            self._donnees[cle] = (time.monotonic() + self.ttl, valeur)
+            self._donnees.move_to_end(cle)
+            while len(self._donnees) > self.taille_max:
+                self._donnees.popitem(last=False)
+    
+    def delete(self, cle):
+        with self._verrou:
+            self._donnees.pop(cle, None)
+    
+    def clear(self):
+        with self._verrou:
+            self._donnees.clear()
+
+
+class EntreeCache(NamedTuple):
+    """Valeur mise en cache avec sa durée de calcul et son expiration logique."""
+    valeur: Any
+    duree_calcul: float
+    expiration: float
+
+
 class CacheManager:
-    """Gestionnaire de cache intelligent avec invalidation automatique."""
+    """
+    Gestionnaire de cache intelligent avec invalidation automatique.
+    
+    get_or_set lit d'abord un cache local au processus (LRU borné par
+    type, TTL court), puis le cache partagé. Un seul worker recalcule une
+    clé manquante (verrou cache.add) ; les autres attendent son résultat.
+    Une entrée est rafraîchie par anticipation avec une probabilité qui
+    croît à l'approche de son expiration (XFetch), et reste servie
+    périmée pendant STALE_TTL le temps de son recalcul. Les valeurs
+    retournées sont partagées : ne pas les modifier.
+    """
     
     # TTL par défaut pour différents types de données
     DEFAULT_TTL = {
@@ -21,58 +84,655 @@ class CacheManager:
         'api_response': 600,   # 10 minutes
     }
     
+    # Entrées du cache local par type ; sa durée borne l'écart entre workers
+    LOCAL_MAX_ENTRIES = {
+        'user_data': 256,
+        'static_data': 128,
+        'reports': 64,
+        'dashboard': 128,
+        'api_response': 512,
+    }
+    LOCAL_TTL = 5
+    # Délai pendant lequel une entrée expirée reste servie pendant son recalcul
+    STALE_TTL = 60
+    # Verrou de recalcul et attente maximale des autres workers
+    LOCK_TTL = 30
+    LOCK_WAIT = 5.0
+    # Agressivité du rafraîchissement anticipé (XFetch)
+    EARLY_REFRESH_BETA = 1.0
+    
+    _locaux: Dict[str, CacheLocal] = {}
+    _compteurs: Dict[str, Counter] = defaultdict(Counter)
+    _verrou_compteurs = threading.Lock()
+    
     @classmethod
     def get_or_set(cls, key: str, callback, ttl: Optional[int] = None, cache_type: str = 'api_response'):
         """Récupère une valeur du cache ou l'exécute et la met en cache."""
+        ttl = ttl or cls.DEFAULT_TTL.get(cache_type, 300)
+        local = cls._cache_local(cache_type)
+        
+        entree = local.get(key)
+        if entree is not None and not cls._a_rafraichir(entree):
+            cls._compter(cache_type, 'hits_local')
+            return entree.valeur
         
         try:
-            # Vérifier le cache
-            cached_value = cache.get(key)
-            if cached_value is not None:
-                return cached_value
-            
-            # Exécuter le callback et mettre en cache
-            value = callback()
-            ttl = ttl or cls.DEFAULT_TTL.get(cache_type, 300)
-            cache.set(key, value, ttl)
-            
-            return value
-            
+            entree = cache.get(key)
         except Exception as e:
             logger.error(f"Erreur cache pour la clé {key}: {e}")
-            # En cas d'erreur de cache, exécuter directement
+            cls._compter(cache_type, 'errors')
             return callback()
+        
+        if entree is not None and not isinstance(entree, EntreeCache):
+            # Valeur écrite directement par cache.set : pas de métadonnées
+            entree = EntreeCache(entree, 0.0, time.time() + ttl)
+        
+        if entree is not None:
+            if not cls._a_rafraichir(entree):
+                local.set(key, entree)
+                cls._compter(cache_type, 'hits')
+                return entree.valeur
+            # Rafraîchissement anticipé ou entrée périmée : un seul recalcul,
+            # les autres workers servent la valeur courante
+            if not cls._verrouiller(key):
+                cls._compter(cache_type, 'stale')
+                return entree.valeur
+            return cls._recalculer(key, callback, ttl, cache_type, verrou=True)
+        
+        cls._compter(cache_type, 'misses')
+        if cls._verrouiller(key):
+            return cls._recalculer(key, callback, ttl, cache_type, verrou=True)
+        
+        entree = cls._attendre(key)
+        if entree is not None:
+            local.set(key, entree)
+            cls._compter(cache_type, 'hits_attente')
+            return entree.valeur
+        # Le worker détenteur du verrou a échoué ou tarde : calcul direct
+        return cls._recalculer(key, callback, ttl, cache_type, verrou=False)
     
     @classmethod
-    def invalidate_pattern(cls, pattern: str):
-        """Invalide toutes les clés correspondant au pattern."""
-        
+    def delete(cls, key: str):
+        """Supprime une clé du cache partagé et du cache local de ce processus."""
+        for local in cls._locaux.values():
+            local.delete(key)
         try:
-            # Cette fonctionnalité dépend du backend de cache utilisé
-            # Pour Redis, on pourrait utiliser des patterns
-            if hasattr(cache, 'delete_pattern'):
-                cache.delete_pattern(pattern)
-            else:
-                # Fallback : invalidation manuelle des clés connues
-                logger.warning(f"Invalidation de pattern non supportée: {pattern}")
-                
+            cache.delete(key)
         except Exception as e:
-            logger.error(f"Erreur lors de l'invalidation du pattern {pattern}: {e}")
+            logger.error(f"Erreur lors de la suppression de la clé {key}: {e}")
+    
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, int]]:
+        """Compteurs de ce processus par type de cache (hits, misses, recomputes...)."""
+        with cls._verrou_compteurs:
+            return {cache_type: dict(compteurs) for cache_type, compteurs in cls._compteurs.items()}
+    
+    @classmethod
+    def _cache_local(cls, cache_type: str) -> CacheLocal:
+        local = cls._locaux.get(cache_type)
+        if local is None:
+            local = cls._locaux.setdefault(cache_type, CacheLocal(
+                taille_max=cls.LOCAL_MAX_ENTRIES.get(cache_type, 128),
+                ttl=cls.LOCAL_TTL
+            ))
+        return local
+    
+    @classmethod
+    def _compter(cls, cache_type: str, evenement: str):
+        with cls._verrou_compteurs:
+            cls._compteurs[cache_type][evenement] += 1
+    
+    @classmethod
+    def _a_rafraichir(cls, entree: EntreeCache) -> bool:
+        """XFetch : expire tôt avec une probabilité proportionnelle au coût du calcul."""
+        # 1 - random() est dans ]0, 1] : le logarithme est défini
+        avance = -entree.duree_calcul * cls.EARLY_REFRESH_BETA * math.log(1.0 - random.random())
+        return time.time() + avance >= entree.expiration
+    
+    @staticmethod
+    def _cle_verrou(key: str) -> str:
+        return f"lock:{key}"
     
     @classmethod
-    def generate_cache_key(cls, prefix: str, **kwargs) -> str:
-        """Génère une clé de cache unique basée sur les paramètres."""
+    def _verrouiller(cls, key: str) -> bool:
+        try:
+            return cache.add(cls._cle_verrou(key), 1, cls.LOCK_TTL)
+        except Exception as e:
+            logger.error(f"Erreur de verrouillage pour la clé {key}: {e}")
+            return True
+    
+    @classmethod
+    def _attendre(cls, key: str) -> Optional[EntreeCache]:
+        """Attend la valeur calculée par le détenteur du verrou."""
+        echeance = time.monotonic() + cls.LOCK_WAIT
+        pause = 0.02
+        try:
+            while time.monotonic() < echeance:
+                time.sleep(pause)
+                pause = min(pause * 2, 0.25)
+                entree = cache.get(key)
+                if isinstance(entree, EntreeCache):
+                    return entree
+                if cache.get(cls._cle_verrou(key)) is None:
+                    return None
+        except Exception as e:
+            logger.error(f"Erreur cache en attente de la clé {key}: {e}")
+        return None
+    
+    @classmethod
+    def _recalculer(cls, key: str, callback, ttl: int, cache_type: str, verrou: bool):
+        debut = time.monotonic()
+        try:
+            valeur = callback()
+            cls._compter(cache_type, 'recomputes')
+            entree = EntreeCache(valeur, time.monotonic() - debut, time.time() + ttl)
+            try:
+                cache.set(key, entree, ttl + cls.STALE_TTL)
+            except Exception as e:
+                logger.error(f"Erreur cache pour la clé {key}: {e}")
+            cls._cache_local(cache_type).set(key, entree)
+        finally:
+            # Libéré après l'écriture : les workers en attente lisent la valeur
+            if verrou:
+                try:
+                    cache.delete(cls._cle_verrou(key))
+                except Exception as e:
+                    logger.error(f"Erreur de libération du verrou {key}: {e}")
+        return valeur
+    
+    # Préfixe des versions de tags
+    TAG_PREFIX = 'tag'
+    
+    @classmethod
+    def get_tag_versions(cls, *tags: str) -> Dict[str, int]:
+        """
+        Versions courantes des tags donnés, en un aller-retour. Une version
+        absente (jamais posée ou évincée) repart d'une base horodatée pour
+        ne jamais retomber sur une valeur déjà servie.
+        """
+        cles = {f"{cls.TAG_PREFIX}:{tag}": tag for tag in tags}
+        try:
+            trouvees = cache.get_many(list(cles))
+            versions = {}
+            for cle, tag in cles.items():
+                version = trouvees.get(cle)
+                if version is None:
+                    cache.add(cle, int(time.time() * 1000), None)
+                    version = cache.get(cle)
+                versions[tag] = version
+            return versions
+        except Exception as e:
+            logger.error(f"Erreur de lecture des versions des tags {tags}: {e}")
+            return {tag: None for tag in tags}
+    
+    @classmethod
+    def invalidate_tags(cls, *tags: str):
+        """
+        Périme toutes les entrées portant l'un des tags, en O(1) par tag :
+        sa version, incluse dans les clés, est incrémentée. L'incrément a
+        lieu après la validation de la transaction en cours pour qu'aucun
+        lecteur ne remette en cache l'état antérieur sous la nouvelle version.
+        """
+        def incrementer():
+            for tag in tags:
+                cle = f"{cls.TAG_PREFIX}:{tag}"
+                try:
+                    cache.incr(cle)
+                except ValueError:
+                    cache.set(cle, int(time.time() * 1000), None)
+                except Exception as e:
+                    logger.error(f"Erreur d'invalidation du tag {tag}: {e}")
+        
+        transaction.on_commit(incrementer)
+    
+    @classmethod
+    def generate_cache_key(cls, prefix: str, tags=(), **kwargs) -> str:
+        """
+        Génère une clé de cache unique basée sur les paramètres.
+        Les versions des `tags` font partie de la clé : invalidate_tags()
+        rend la clé précédente inaccessible, qui expire ensuite d'elle-même.
+        """
+        if tags:
+            kwargs['tags'] = cls.get_tag_versions(*sorted(set(tags)))
         
         # Trier les paramètres pour avoir une clé déterministe
         sorted_params = sorted(kwargs.items())
         params_str = json.dumps(sorted_params, sort_keys=True)
         
-        # Hash des paramètres pour éviter les clés trop longues
-        params_hash = hashlib.md5(params_str.encode()).hexdigest()[:8]
+        # Hash des paramètres pour éviter les clés trop longues ; complet, car
+        # une collision servirait les données d'un autre périmètre
+        params_hash = hashlib.md5(params_str.encode()).hexdigest()
         
         return f"{prefix}:{params_hash}"
 
 
+class RateLimitResult(NamedTuple):
+    """Résultat d'un contrôle de débit."""
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimiter:
+    """
+    Limiteur de débit à fenêtre glissante.
+    
+    Sur Redis, un script Lua tient un journal horodaté par clé (ZSET) :
+    purge de la fenêtre, contrôle de toutes les clés, puis inscription de
+    la requête si aucune n'est saturée, en un seul aller-retour atomique.
+    Si Redis est indisponible, un seau à jetons local au processus prend
+    le relais (quota appliqué par worker).
+    """
+    
+    PREFIX = 'ratelimit'
+    # Nombre maximal de seaux locaux conservés (LRU)
+    FALLBACK_MAX_KEYS = 10000
+    
+    SCRIPT = """
+    if redis.replicate_commands then redis.replicate_commands() end
+    local t = redis.call('TIME')
+    local maintenant = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    local fenetre = tonumber(ARGV[1])
+    local membre = ARGV[2]
+    local attente = 0
+    local restant = -1
+    for i, cle in ipairs(KEYS) do
+        local limite = tonumber(ARGV[i + 2])
+        redis.call('ZREMRANGEBYSCORE', cle, '-inf', maintenant - fenetre)
+        local nombre = redis.call('ZCARD', cle)
+        if nombre >= limite then
+            local plus_ancien = redis.call('ZRANGE', cle, 0, 0, 'WITHSCORES')
+            attente = math.max(attente, tonumber(plus_ancien[2]) + fenetre - maintenant)
+        end
+        if restant < 0 or limite - nombre - 1 < restant then
+            restant = limite - nombre - 1
+        end
+    end
+    if attente > 0 then
+        return {0, 0, attente}
+    end
+    for i, cle in ipairs(KEYS) do
+        redis.call('ZADD', cle, maintenant, membre)
+        redis.call('PEXPIRE', cle, fenetre)
+    end
+    return {1, restant, 0}
+    """
+    
+    _script = None
+    _seaux = OrderedDict()
+    _verrou = threading.Lock()
+    
+    @classmethod
+    def check(cls, quotas: List[Tuple[str, int]], window: int = 60) -> RateLimitResult:
+        """
+        Contrôle puis compte une requête sur chaque (clé, limite) de `quotas`
+        pour une fenêtre de `window` secondes. La requête n'est comptée
+        nulle part si l'un des quotas est atteint.
+        """
+        quotas = [(f"{cls.PREFIX}:{cle}", limite) for cle, limite in quotas]
+        try:
+            return cls._check_redis(quotas, window)
+        except Exception as e:
+            logger.warning(f"Limiteur Redis indisponible, repli local: {e}")
+            return cls._check_local(quotas, window)
+    
+    @classmethod
+    def _check_redis(cls, quotas, window) -> RateLimitResult:
+        from django_redis import get_redis_connection
+        
+        client = get_redis_connection('default')
+        if cls._script is None:
+            cls._script = client.register_script(cls.SCRIPT)
+        # EVALSHA, avec repli automatique sur EVAL si le script n'est pas chargé
+        autorise, restant, attente = cls._script(
+            keys=[cle for cle, _ in quotas],
+            args=[window * 1000, uuid.uuid4().hex] + [limite for _, limite in quotas],
+            client=client
+        )
+        return RateLimitResult(bool(autorise), int(restant), int(attente) / 1000)
+    
+    @classmethod
+    def _check_local(cls, quotas, window) -> RateLimitResult:
+        """Seau à jetons par clé : capacité `limite`, rempli à limite/window par seconde."""
+        maintenant = time.monotonic()
+        with cls._verrou:
+            seaux = []
+            for cle, limite in quotas:
+                jetons, derniere = cls._seaux.get(cle, (float(limite), maintenant))
+                jetons = min(float(limite), jetons + (maintenant - derniere) * limite / window)
+                seaux.append((cle, limite, jetons))
+            
+            attente = max(
+                ((1 - jetons) * window / limite for _, limite, jetons in seaux if jetons < 1),
+                default=0.0
+            )
+            for cle, limite, jetons in seaux:
+                cls._seaux[cle] = (jetons - 1 if not attente else jetons, maintenant)
+                cls._seaux.move_to_end(cle)
+            while len(cls._seaux) > cls.FALLBACK_MAX_KEYS:
+                cls._seaux.popitem(last=False)
+        
+        if attente:
+            return RateLimitResult(False, 0, attente)
+        restant = min(int(jetons) - 1 for _, _, jetons in seaux) if seaux else 0
+        return RateLimitResult(True, max(restant, 0), 0.0)
+
+
+class HistogrammeLatence:
+    """
+    Histogramme de latences à classes logarithmiques : la classe i couvre
+    ]GAMMA^(i-1), GAMMA^i] millisecondes, soit une erreur relative de 1 %
+    sur toute la plage. Deux histogrammes se fusionnent en additionnant
+    leurs compteurs.
+    """
+    
+    GAMMA = 1.02
+    _LOG_GAMMA = math.log(GAMMA)
+    
+    __slots__ = ('classes',)
+    
+    def __init__(self, classes: Optional[Dict[int, int]] = None):
+        self.classes = Counter(classes or {})
+    
+    def ajouter(self, duree_ms: float, nombre: int = 1):
+        # Plancher à 10 µs : en deçà, une seule classe
+        indice = math.ceil(math.log(max(duree_ms, 0.01)) / self._LOG_GAMMA)
+        self.classes[indice] += nombre
+    
+    def fusionner(self, autre: 'HistogrammeLatence'):
+        self.classes.update(autre.classes)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Latence (ms) au quantile q, à 1 % près ; None sans mesure."""
+        total = sum(self.classes.values())
+        if not total:
+            return None
+        rang = q * (total - 1)
+        cumul = 0
+        for indice in sorted(self.classes):
+            cumul += self.classes[indice]
+            if cumul > rang:
+                # Milieu relatif de la classe ]GAMMA^(i-1), GAMMA^i]
+                return 2 * self.GAMMA ** indice / (self.GAMMA + 1)
+    
+    def to_dict(self) -> Dict[str, int]:
+        # Clés texte : stockage JSON
+        return {str(indice): nombre for indice, nombre in self.classes.items()}
+    
+    @classmethod
+    def from_dict(cls, donnees: Optional[Dict[str, int]]) -> 'HistogrammeLatence':
+        return cls({int(indice): nombre for indice, nombre in (donnees or {}).items()})
+
+
+class AgregatRequetes:
+    """Compteurs d'une route sur une période."""
+    
+    __slots__ = (
+        'requetes', 'duree_totale', 'lentes', 'erreurs',
+        'requetes_db', 'max_db', 'duree_db', 'histogramme',
+    )
+    
+    def __init__(self):
+        self.requetes = 0
+        self.duree_totale = 0.0
+        self.lentes = 0
+        self.erreurs = 0
+        self.requetes_db = 0
+        self.max_db = 0
+        self.duree_db = 0.0
+        self.histogramme = HistogrammeLatence()
+    
+    @classmethod
+    def depuis_metrique(cls, metrique: Dict[str, Any]) -> 'AgregatRequetes':
+        """Reconstitue les sommes d'une ligne PerformanceMetric (values())."""
+        agregat = cls()
+        nombre = metrique['total_requests']
+        agregat.requetes = nombre
+        agregat.duree_totale = metrique['avg_response_time'] * nombre
+        agregat.lentes = metrique['slow_requests_count']
+        agregat.erreurs = round(metrique['error_rate'] * nombre / 100)
+        agregat.requetes_db = round(metrique['avg_db_queries'] * nombre)
+        agregat.max_db = metrique['max_db_queries']
+        agregat.duree_db = metrique['avg_db_time'] * nombre
+        agregat.histogramme = HistogrammeLatence.from_dict(metrique['histogramme'])
+        return agregat
+    
+    def ajouter(self, duree: float, requetes_db: int, lente: bool, erreur: bool, duree_db: float = 0.0):
+        self.requetes += 1
+        self.duree_totale += duree
+        self.lentes += lente
+        self.erreurs += erreur
+        self.requetes_db += requetes_db
+        if requetes_db > self.max_db:
+            self.max_db = requetes_db
+        self.duree_db += duree_db
+        self.histogramme.ajouter(duree * 1000)
+    
+    def fusionner(self, autre: 'AgregatRequetes'):
+        self.requetes += autre.requetes
+        self.duree_totale += autre.duree_totale
+        self.lentes += autre.lentes
+        self.erreurs += autre.erreurs
+        self.requetes_db += autre.requetes_db
+        self.max_db = max(self.max_db, autre.max_db)
+        self.duree_db += autre.duree_db
+        self.histogramme.fusionner(autre.histogramme)
+
+
+class MetricsCollector:
+    """
+    Agrégation des métriques de requêtes, locale au processus.
+    
+    record() ne fait qu'incrémenter, sous verrou, les compteurs de la
+    minute courante pour la route ; un thread de fond vide ces agrégats
+    toutes les FLUSH_INTERVAL secondes dans PerformanceMetric (lignes
+    minute, heure et jour, par route et globales avec route='').
+    """
+    
+    FLUSH_INTERVAL = getattr(settings, 'PERFORMANCE_METRICS_FLUSH_INTERVAL', 60)
+    SLOW_THRESHOLD = 2.0
+    PERIODES = ('minute', 'hour', 'day')
+    # Conservation des lignes fines (les lignes jour sont gardées)
+    RETENTION_JOURS = {'minute': 7, 'hour': 90}
+    TRIS = ('p99', 'temps_db')
+    
+    _agregats: Dict[Tuple[int, str], AgregatRequetes] = {}
+    _verrou = threading.Lock()
+    _pid = None
+    
+    @classmethod
+    def record(cls, route: str, duree: float, requetes_db: int, status_code: int, duree_db: float = 0.0):
+        """Compte une requête terminée (durées en secondes)."""
+        if cls._pid != os.getpid():
+            cls._demarrer()
+        cle = (int(time.time() // 60), route)
+        with cls._verrou:
+            agregat = cls._agregats.get(cle)
+            if agregat is None:
+                agregat = cls._agregats[cle] = AgregatRequetes()
+            agregat.ajouter(duree, requetes_db, duree > cls.SLOW_THRESHOLD, status_code >= 500, duree_db)
+    
+    @classmethod
+    def _demarrer(cls):
+        """Thread de vidage, un par processus (relancé après un fork)."""
+        with cls._verrou:
+            if cls._pid == os.getpid():
+                return
+            # Les agrégats hérités du parent y seront vidés : ne pas les compter deux fois
+            cls._agregats = {}
+            cls._pid = os.getpid()
+        threading.Thread(target=cls._boucle, name='metrics-flush', daemon=True).start()
+        atexit.register(cls.flush)
+    
+    @classmethod
+    def _boucle(cls):
+        from django.db import connections
+        
+        while True:
+            time.sleep(cls.FLUSH_INTERVAL)
+            cls.flush()
+            connections.close_all()
+    
+    @classmethod
+    def flush(cls):
+        """Écrit les agrégats accumulés dans PerformanceMetric."""
+        with cls._verrou:
+            agregats, cls._agregats = cls._agregats, {}
+        if not agregats:
+            return
+        
+        try:
+            cls._enregistrer(cls._par_periode(agregats))
+        except Exception as e:
+            # Métriques au mieux : ne jamais propager
+            logger.error(f"Erreur lors de l'enregistrement des métriques: {e}")
+    
+    @classmethod
+    def _par_periode(cls, agregats) -> Dict[Tuple[str, Any, str], AgregatRequetes]:
+        """Cumule chaque minute dans ses lignes minute, heure et jour, par route et globales."""
+        from datetime import datetime, timezone as dt_timezone
+        
+        lignes = defaultdict(AgregatRequetes)
+        for (minute, route), agregat in agregats.items():
+            debut = datetime.fromtimestamp(minute * 60, tz=dt_timezone.utc)
+            for periode in cls.PERIODES:
+                horodatage = cls.tronquer(debut, periode)
+                for cible in {route, ''}:
+                    lignes[(periode, horodatage, cible)].fusionner(agregat)
+        return lignes
+    
+    @staticmethod
+    def tronquer(moment, periode: str):
+        """Début de la période contenant `moment`, dans le fuseau courant."""
+        from django.utils import timezone
+        
+        moment = timezone.localtime(moment).replace(second=0, microsecond=0)
+        if periode in ('hour', 'day'):
+            moment = moment.replace(minute=0)
+        if periode == 'day':
+            moment = moment.replace(hour=0)
+        return moment
+    
+    @classmethod
+    def _enregistrer(cls, lignes):
+        from apps.core.models import PerformanceMetric
+        from django.db.models.functions import Collate
+        
+        # Insertions et verrous dans le même ordre stable entre processus :
+        # deux vidages concurrents sur les mêmes clés ne peuvent pas
+        # s'interbloquer (collation C = ordre des points de code de sorted)
+        cles = sorted(lignes, key=lambda cle: (cle[1], cle[0], cle[2]))
+        with transaction.atomic():
+            PerformanceMetric.objects.bulk_create(
+                [
+                    PerformanceMetric(periode=periode, timestamp=horodatage, route=route)
+                    for periode, horodatage, route in cles
+                ],
+                ignore_conflicts=True
+            )
+            existantes = PerformanceMetric.objects.select_for_update().filter(
+                periode__in={periode for periode, _, _ in lignes},
+                timestamp__in={horodatage for _, horodatage, _ in lignes},
+                route__in={route for _, _, route in lignes},
+            ).order_by('timestamp', 'periode', Collate('route', 'C'))
+            
+            a_mettre_a_jour = []
+            for metrique in existantes:
+                agregat = lignes.get((metrique.periode, metrique.timestamp, metrique.route))
+                if agregat is None:
+                    continue
+                anciennes = metrique.total_requests
+                total = anciennes + agregat.requetes
+                metrique.avg_response_time = (
+                    metrique.avg_response_time * anciennes + agregat.duree_totale
+                ) / total
+                metrique.avg_db_queries = (
+                    metrique.avg_db_queries * anciennes + agregat.requetes_db
+                ) / total
+                metrique.error_rate = (
+                    metrique.error_rate * anciennes + agregat.erreurs * 100
+                ) / total
+                metrique.avg_db_time = (
+                    metrique.avg_db_time * anciennes + agregat.duree_db
+                ) / total
+                metrique.max_db_queries = max(metrique.max_db_queries, agregat.max_db)
+                metrique.slow_requests_count += agregat.lentes
+                metrique.total_requests = total
+                histogramme = HistogrammeLatence.from_dict(metrique.histogramme)
+                histogramme.fusionner(agregat.histogramme)
+                metrique.histogramme = histogramme.to_dict()
+                a_mettre_a_jour.append(metrique)
+            
+            PerformanceMetric.objects.bulk_update(a_mettre_a_jour, [
+                'total_requests', 'avg_response_time', 'slow_requests_count', 'error_rate',
+                'avg_db_queries', 'max_db_queries', 'avg_db_time', 'histogramme',
+            ])
+    
+    @classmethod
+    def periode_pour(cls, debut, fin) -> str:
+        """Granularité la plus fine encore conservée et raisonnable pour [debut, fin[."""
+        from django.utils import timezone
+        from datetime import timedelta
+        
+        anciennete = timezone.now() - debut
+        if fin - debut <= timedelta(hours=6) and anciennete <= timedelta(days=cls.RETENTION_JOURS['minute']):
+            return 'minute'
+        if fin - debut <= timedelta(days=31) and anciennete <= timedelta(days=cls.RETENTION_JOURS['hour']):
+            return 'hour'
+        return 'day'
+    
+    @classmethod
+    def statistiques_routes(cls, debut, fin, routes: Optional[List[str]] = None) -> Dict[str, AgregatRequetes]:
+        """
+        Fusionne, par route, les lignes couvrant [debut, fin[ ; les bornes
+        sont arrondies à la granularité retenue. route '' : agrégat global.
+        """
+        from apps.core.models import PerformanceMetric
+        
+        periode = cls.periode_pour(debut, fin)
+        lignes = PerformanceMetric.objects.filter(
+            periode=periode,
+            timestamp__gte=cls.tronquer(debut, periode),
+            timestamp__lt=fin,
+        )
+        lignes = lignes.filter(route__in=routes) if routes is not None else lignes.exclude(route='')
+        
+        par_route = defaultdict(AgregatRequetes)
+        for metrique in lignes.values(
+            'route', 'total_requests', 'avg_response_time', 'slow_requests_count', 'error_rate',
+            'avg_db_queries', 'max_db_queries', 'avg_db_time', 'histogramme'
+        ).iterator():
+            par_route[metrique['route']].fusionner(AgregatRequetes.depuis_metrique(metrique))
+        return par_route
+    
+    @classmethod
+    def classement_routes(cls, debut, fin, tri: str = 'p99', limite: int = 20) -> List[Dict[str, Any]]:
+        """Routes les plus lentes sur [debut, fin[, par p99 ou par temps DB cumulé."""
+        classement = []
+        for route, agregat in cls.statistiques_routes(debut, fin).items():
+            if not agregat.requetes:
+                continue
+            quantile = lambda q: round(agregat.histogramme.quantile(q) or 0.0, 1)
+            classement.append({
+                'route': route,
+                'requetes': agregat.requetes,
+                'p50_ms': quantile(0.50),
+                'p95_ms': quantile(0.95),
+                'p99_ms': quantile(0.99),
+                'moyenne_ms': round(agregat.duree_totale / agregat.requetes * 1000, 1),
+                'requetes_lentes': agregat.lentes,
+                'taux_erreur': round(agregat.erreurs * 100 / agregat.requetes, 2),
+                'requetes_db_moyenne': round(agregat.requetes_db / agregat.requetes, 1),
+                'requetes_db_max': agregat.max_db,
+                'temps_db_moyen_ms': round(agregat.duree_db / agregat.requetes * 1000, 1),
+                'temps_db_total_s': round(agregat.duree_db, 2),
+            })
+        
+        cle = 'temps_db_total_s' if tri == 'temps_db' else 'p99_ms'
+        classement.sort(key=lambda ligne: ligne[cle], reverse=True)
+        return classement[:limite]
+
+
 class SecurityValidator:
     """Validateur de sécurité pour les données sensibles."""
     
@@ -195,19 +195,14 @@ class TopCategoriesWidget(BaseWidget):
     def get_data(self, user, filters=None):
         """Récupère le top 10 des catégories par valeur."""
         
-        query = """
-        SELECT 
-            c.nom as categorie,
-            COUNT(b.id) as nombre_biens,
-            SUM(b.valeur_actuelle) as valeur_totale
-        FROM patrimoine_categorie c
-        JOIN patrimoine_souscategorie sc ON c.id = sc.categorie_id
-        JOIN patrimoine_bien b ON sc.id = b.sous_categorie_id
-        WHERE b.est_actif = true
-        GROUP BY c.id, c.nom
-        ORDER BY valeur_totale DESC
-        LIMIT 10
-        """
+        # Lecture sur les cumuls pré-agrégés plutôt que sur la table des biens
+        from django.db.models import Sum
+        from apps.patrimoine.services.cumuls_service import CumulsBiensService
+        
+        rows = CumulsBiensService.cumuls().values_list('categorie__nom').annotate(
+            nombre_biens=Sum('nombre_biens'),
+            valeur_totale=Sum('valeur_actuelle')
+        ).order_by('-valeur_totale')[:10]
         
         labels = []
         data = []
@@ -216,14 +211,10 @@ class TopCategoriesWidget(BaseWidget):
             '#FF9F40', '#FF6384', '#C9CBCF', '#4BC0C0', '#36A2EB'
         ]
         
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            for i, row in enumerate(rows):
-                if row[0] and row[2]:
-                    labels.append(row[0])
-                    data.append(float(row[2]))
+        for row in rows:
+            if row[0] and row[2]:
+                labels.append(row[0])
+                data.append(float(row[2]))
         
         return {
             'labels': labels,
@@ -0,0 +1,57 @@
+# apps/dashboard/widgets/performance.py
+from .base import BaseWidget
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.core.utils import MetricsCollector
+
+
+class RoutesLentesWidget(BaseWidget):
+    """Widget des routes les plus lentes (p99 ou temps DB)."""
+    
+    def get_data(self, user, filters=None):
+        """Classement des routes sur la période demandée (24h par défaut)."""
+        
+        filters = filters or {}
+        heures = int(filters.get('heures', 24))
+        fin = timezone.now()
+        debut = fin - timedelta(hours=heures)
+        tri = filters.get('tri', self.config.get('tri', 'p99'))
+        
+        routes = MetricsCollector.classement_routes(
+            debut, fin, tri=tri, limite=self.config.get('limite', 10)
+        )
+        return {
+            'periode': MetricsCollector.periode_pour(debut, fin),
+            'labels': [ligne['route'] for ligne in routes],
+            'datasets': [
+                {'label': 'p50 (ms)', 'data': [ligne['p50_ms'] for ligne in routes]},
+                {'label': 'p95 (ms)', 'data': [ligne['p95_ms'] for ligne in routes]},
+                {'label': 'p99 (ms)', 'data': [ligne['p99_ms'] for ligne in routes]},
+                {'label': 'Temps DB moyen (ms)', 'data': [ligne['temps_db_moyen_ms'] for ligne in routes]},
+            ],
+            'routes': routes,
+        }
+    
+    def get_chart_config(self):
+        """Configuration pour un graphique en barres horizontales."""
+        return {
+            'type': 'bar',
+            'options': {
+                'indexAxis': 'y',
+                'responsive': True,
+                'plugins': {
+                    'legend': {'position': 'bottom'},
+                    'title': {'display': True, 'text': 'Routes les plus lentes'}
+                }
+            }
+        }
+    
+    def validate_filters(self, filters):
+        """Valide la durée et le tri demandés."""
+        filters = filters or {}
+        try:
+            heures = int(filters.get('heures', 24))
+        except (TypeError, ValueError):
+            return False
+        return 0 < heures <= 24 * 366 and filters.get('tri', 'p99') in MetricsCollector.TRIS
@@ -20,9 +20,10 @@ admin.site.register(District)
 # ✅ ResponsableBien avec options
 @admin.register(ResponsableBien)
 class ResponsableBienAdmin(admin.ModelAdmin):
-    list_display = ("nom", "prenom", "matricule", "fonction", "corps", "categorie")
-    search_fields = ("nom", "prenom", "matricule", "fonction", "corps")
-    list_filter = ("categorie", "corps")
+    list_display = ("user", "matricule", "fonction", "entite_principale", "actif")
+    search_fields = ("user__last_name", "user__first_name", "matricule", "fonction")
+    list_filter = ("actif", "entite_principale")
+    raw_id_fields = ['user']
 
 # ✅ Inline pour affectation dans Bien
 class BienResponsabiliteInline(admin.TabularInline):
@@ -30,9 +31,8 @@ class BienResponsabiliteInline(admin.TabularInline):
     extra = 1
     autocomplete_fields = ['responsable']
     fields = (
-        'responsable', 'type_affectation', 'date_affectation',
-        'numero_permis', 'categorie_permis', 'composition_foyer',
-        'certifications'
+        'responsable', 'type_affectation', 'date_debut', 'date_fin',
+        'actif', 'motif'
     )
     
 
@@ -41,12 +41,12 @@ class ResponsableActuelFilter(SimpleListFilter):
     parameter_name = 'responsable_actuel'
 
     def lookups(self, request, model_admin):
-        responsables = ResponsableBien.objects.all()
-        return [(r.id, f"{r.prenom} {r.nom}") for r in responsables]
+        responsables = ResponsableBien.objects.select_related('user')
+        return [(r.id, r.user.get_full_name()) for r in responsables]
 
     def queryset(self, request, queryset):
         if self.value():
-            return queryset.filter(responsabilites__responsable__id=self.value(), responsabilites__type_affectation='permanent')
+            return queryset.filter(responsable_actuel__responsable_id=self.value())
         return queryset
 
 # ✅ Bien avec inline
@@ -55,19 +55,16 @@ class ResponsableActuelFilter(SimpleListFilter):
 class BienAdmin(admin.ModelAdmin):
     list_display = (
         'nom', 'categorie', 'sous_categorie',
-        'valeur_initiale', 'date_acquisition',
+        'valeur_acquisition', 'date_acquisition',
         'get_responsable_actuel'
     )
     list_filter = ('categorie', 'sous_categorie')
-    search_fields = ('nom', 'responsabilites__responsable__nom', 'responsabilites__responsable__prenom')
+    search_fields = ('code_patrimoine', 'nom', 'responsable_actuel_nom')
 
     inlines = [BienResponsabiliteInline]
 
     def get_responsable_actuel(self, obj):
-        actif = obj.responsable_actuel
-        if actif:
-            return f"{actif.responsable.prenom} {actif.responsable.nom}"
-        return "—"
+        return obj.responsable_actuel_nom or "—"
     get_responsable_actuel.short_description = "Responsable actuel"
     list_filter = ('categorie', 'sous_categorie', ResponsableActuelFilter)
 
@@ -1,6 +1,53 @@
 from django.apps import AppConfig
+from django.db import DatabaseError
 
 
 class PatrimoineConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.patrimoine'
+
+    def ready(self):
+        """Enregistrement des signaux d'invalidation de cache et des tâches périodiques."""
+        import apps.patrimoine.signals  # noqa
+        try:
+            self._setup_periodic_tasks()
+        except (ImportError, DatabaseError):
+            # django_celery_beat absent ou tables pas encore migrées
+            pass
+
+    def _setup_periodic_tasks(self):
+        """Configure les tâches périodiques du patrimoine."""
+        from django_celery_beat.models import PeriodicTask, CrontabSchedule
+        import json
+
+        # Réévaluation nocturne du portefeuille à 2h
+        nocturne, created = CrontabSchedule.objects.get_or_create(
+            minute=0,
+            hour=2,
+            day_of_week='*',
+            day_of_month='*',
+            month_of_year='*',
+        )
+
+        PeriodicTask.objects.get_or_create(
+            crontab=nocturne,
+            name='Réévaluation du portefeuille OPRAG',
+            task='apps.patrimoine.tasks.reevaluation.reevaluer_portefeuille',
+            kwargs=json.dumps({}),
+        )
+
+        # Reprise des imports interrompus toutes les 15 minutes
+        quart_heure, created = CrontabSchedule.objects.get_or_create(
+            minute='*/15',
+            hour='*',
+            day_of_week='*',
+            day_of_month='*',
+            month_of_year='*',
+        )
+
+        PeriodicTask.objects.get_or_create(
+            crontab=quart_heure,
+            name='Reprise des imports interrompus OPRAG',
+            task='apps.patrimoine.tasks.imports.relancer_imports_interrompus',
+            kwargs=json.dumps({}),
+        )
@@ -1,3 +1,5 @@
+import uuid
+
 from django import forms
 from django.utils.text import slugify
 
@@ -18,10 +20,11 @@ from .models import (
 class HistoriqueValeurForm(forms.ModelForm):
     class Meta:
         model = HistoriqueValeur
-        fields = ['date', 'valeur']
+        fields = ['date', 'valeur', 'type_evaluation']
         widgets = {
             'date': forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}),
             'valeur': forms.NumberInput(attrs={'class': 'form-control'}),
+            'type_evaluation': forms.Select(attrs={'class': 'form-select'}),
         }
 
 
@@ -30,16 +33,16 @@ class BienForm(forms.ModelForm):
         model = Bien
         fields = [
             'nom', 'categorie', 'sous_categorie',
-            'entite', 'valeur_initiale', 'date_acquisition', 'justificatif'
+            'entite', 'valeur_acquisition', 'date_acquisition', 'facture'
         ]
         widgets = {
             'nom': forms.TextInput(attrs={'class': 'form-control'}),
             'categorie': forms.Select(attrs={'class': 'form-select', 'id': 'id_categorie'}),
             'sous_categorie': forms.Select(attrs={'class': 'form-select', 'id': 'id_sous_categorie'}),
             'entite': forms.Select(attrs={'class': 'form-select'}),
-            'valeur_initiale': forms.NumberInput(attrs={'class': 'form-control', 'step': '0.01'}),
+            'valeur_acquisition': forms.NumberInput(attrs={'class': 'form-control', 'step': '0.01'}),
             'date_acquisition': forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}),
-            'justificatif': forms.ClearableFileInput(attrs={'class': 'form-control'}),
+            'facture': forms.ClearableFileInput(attrs={'class': 'form-control'}),
         }
 
     def __init__(self, *args, **kwargs):
@@ -49,13 +52,13 @@ class BienForm(forms.ModelForm):
 
         if 'categorie' in self.data:
             try:
-                cat_id = int(self.data.get('categorie'))
+                cat_id = uuid.UUID(self.data.get('categorie'))
                 self.fields['sous_categorie'].queryset = SousCategorie.objects.filter(
                     categorie_id=cat_id
                 ).order_by('nom')
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, AttributeError):
                 pass
-        elif self.instance.pk and self.instance.categorie:
+        elif self.instance.categorie_id:
             self.fields['sous_categorie'].queryset = self.instance.categorie.sous_categories.all()
 
 
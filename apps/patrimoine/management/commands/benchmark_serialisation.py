@@ -0,0 +1,68 @@
+# apps/patrimoine/management/commands/benchmark_serialisation.py
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from apps.api.v1.registre import CHAMPS_REGISTRE
+from apps.api.v1.renderers import MessagePackRenderer, ORJSONRenderer
+from apps.patrimoine.models import Bien
+
+
+class SerialiseurReference(serializers.ModelSerializer):
+    """Chemin DRF champ par champ, sur les mêmes colonnes que le registre."""
+    categorie__nom = serializers.CharField(source='categorie.nom')
+    sous_categorie__nom = serializers.CharField(source='sous_categorie.nom', default=None)
+    entite__code = serializers.CharField(source='entite.code')
+    entite__nom = serializers.CharField(source='entite.nom')
+
+    class Meta:
+        model = Bien
+        fields = CHAMPS_REGISTRE
+
+
+class Command(BaseCommand):
+    """Mesure du débit de sérialisation d'une page de biens."""
+
+    help = "Compare sérialiseur DRF + JSONRenderer et lignes values() + orjson / MessagePack"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--nombre', type=int, default=1000, help="Nombre de biens")
+        parser.add_argument('--repetitions', type=int, default=5, help="Nombre de mesures")
+
+    def handle(self, *args, **options):
+        nombre = options['nombre']
+        queryset = Bien.objects.select_related('categorie', 'sous_categorie', 'entite')[:nombre]
+        instances = list(queryset)
+        lignes = list(
+            Bien.objects.values(*CHAMPS_REGISTRE)[:nombre]
+        )
+        if not instances:
+            self.stdout.write(self.style.WARNING("Aucun bien à sérialiser"))
+            return
+
+        chemins = {
+            'drf + json': lambda: JSONRenderer().render(
+                SerialiseurReference(instances, many=True).data
+            ),
+            'values + orjson': lambda: ORJSONRenderer().render(lignes),
+            'values + msgpack': lambda: MessagePackRenderer().render(lignes),
+        }
+
+        reference = None
+        for nom, chemin in chemins.items():
+            durees = []
+            for _ in range(options['repetitions']):
+                debut = time.perf_counter()
+                contenu = chemin()
+                durees.append(time.perf_counter() - debut)
+            meilleure = min(durees)
+            reference = reference or meilleure
+            self.stdout.write(
+                f"{nom:<18} {meilleure * 1000:8.2f} ms  "
+                f"{len(instances) / meilleure:10.0f} biens/s  "
+                f"{len(contenu) / 1024:8.1f} Ko  x{reference / meilleure:.1f}"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"{len(instances)} biens mesurés"))
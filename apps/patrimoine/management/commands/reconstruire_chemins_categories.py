@@ -0,0 +1,14 @@
+# apps/patrimoine/management/commands/reconstruire_chemins_categories.py
+from django.core.management.base import BaseCommand
+
+from apps.patrimoine.services.categorie_service import CategorieArbreService
+
+
+class Command(BaseCommand):
+    """Reconstruction des chemins matérialisés des catégories."""
+
+    help = "Recalcule Categorie.chemin à partir des liens parent"
+
+    def handle(self, *args, **options):
+        total = CategorieArbreService.reconstruire_chemins()
+        self.stdout.write(self.style.SUCCESS(f"{total} chemins de catégories recalculés"))
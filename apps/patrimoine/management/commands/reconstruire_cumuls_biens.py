@@ -0,0 +1,14 @@
+# apps/patrimoine/management/commands/reconstruire_cumuls_biens.py
+from django.core.management.base import BaseCommand
+
+from apps.patrimoine.services.cumuls_service import CumulsBiensService
+
+
+class Command(BaseCommand):
+    """Reconstruction des cumuls pré-agrégés des biens."""
+
+    help = "Recalcule la table CumulBiens à partir de la table des biens"
+
+    def handle(self, *args, **options):
+        total = CumulsBiensService.reconstruire()
+        self.stdout.write(self.style.SUCCESS(f"{total} lignes de cumuls recalculées"))
@@ -0,0 +1,15 @@
+# apps/patrimoine/management/commands/reconstruire_hierarchie_entites.py
+from django.core.management.base import BaseCommand
+
+from apps.patrimoine.services.hierarchie_service import EntiteHierarchieService
+
+
+class Command(BaseCommand):
+    """Reconstruction de la table de fermeture des entités."""
+
+    help = "Recalcule EntiteHierarchie à partir des liens parent des entités"
+
+    def handle(self, *args, **options):
+        total = EntiteHierarchieService.reconstruire_fermeture()
+        EntiteHierarchieService.invalider_arbre()
+        self.stdout.write(self.style.SUCCESS(f"{total} liens hiérarchiques enregistrés"))
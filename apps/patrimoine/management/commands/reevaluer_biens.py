@@ -0,0 +1,50 @@
+# apps/patrimoine/management/commands/reevaluer_biens.py
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.patrimoine.services.reevaluation_service import (
+    ReevaluationService, METHODES_SUPPORTEES
+)
+
+
+class Command(BaseCommand):
+    """Réévaluation à la demande de la valeur actuelle des biens."""
+
+    help = "Recalcule valeur_actuelle_cache pour tout le registre par passes vectorisées"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--methode',
+            choices=METHODES_SUPPORTEES,
+            help="Méthode d'amortissement (défaut: OPRAG_CONFIG['DEPRECIATION_METHOD'])"
+        )
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument(
+            '--date',
+            help="Date de calcul au format AAAA-MM-JJ (défaut: aujourd'hui)"
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Compte les biens à modifier sans écrire en base"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            date_calcul = date.fromisoformat(options['date']) if options['date'] else None
+        except ValueError:
+            raise CommandError(f"Date invalide: {options['date']}")
+
+        service = ReevaluationService(
+            chunk_size=options['chunk_size'],
+            methode=options['methode']
+        )
+        resultat = service.reevaluer_portefeuille(
+            date_calcul=date_calcul,
+            dry_run=options['dry_run']
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultat['biens_modifies']} biens modifiés sur "
+            f"{resultat['biens_traites']} traités ({resultat['methode']})"
+        ))
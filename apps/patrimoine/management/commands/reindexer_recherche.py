@@ -0,0 +1,24 @@
+# apps/patrimoine/management/commands/reindexer_recherche.py
+from django.core.management.base import BaseCommand
+
+from apps.patrimoine.services.search_service import CHAMPS_INDEXES, RechercheService
+
+
+class Command(BaseCommand):
+    """Recalcul complet des vecteurs de recherche plein texte."""
+
+    help = "Renseigne search_vector pour les biens, catégories, sous-catégories et entités"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--modele',
+            choices=[model.__name__ for model in CHAMPS_INDEXES],
+            help="Limiter la réindexation à un modèle"
+        )
+
+    def handle(self, *args, **options):
+        for model in CHAMPS_INDEXES:
+            if options['modele'] and model.__name__ != options['modele']:
+                continue
+            total = RechercheService.mettre_a_jour(model)
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {total} vecteurs recalculés"))
@@ -0,0 +1,14 @@
+# apps/patrimoine/management/commands/synchroniser_responsables_actuels.py
+from django.core.management.base import BaseCommand
+
+from apps.patrimoine.services.responsable_service import ResponsableActuelService
+
+
+class Command(BaseCommand):
+    """Recalcul du responsable actuel dénormalisé sur les biens."""
+
+    help = "Renseigne Bien.responsable_actuel depuis les affectations actives"
+
+    def handle(self, *args, **options):
+        total = ResponsableActuelService.synchroniser_tous()
+        self.stdout.write(self.style.SUCCESS(f"{total} biens synchronisés"))
@@ -10,7 +10,7 @@ class AuditMiddleware:
         self.modeles_audites = {
             'bien': {
                 'class': Bien,
-                'fields': ['valeur_initiale', 'statut_juridique', 'entite_id']
+                'fields': ['valeur_acquisition', 'statut_juridique', 'entite_id']
             },
             'historiquevaleur': {
                 'class': HistoriqueValeur,
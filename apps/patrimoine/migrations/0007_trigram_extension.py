@@ -0,0 +1,14 @@
+# Generated manually: extension pg_trgm pour la recherche approchée
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0001_alter_bienresponsabilite_options'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ]
@@ -0,0 +1,1252 @@
+# Generated manually: bascule des modèles historiques vers apps/patrimoine/models/
+"""
+Remplace le schéma historique (apps/patrimoine/models.py, clés entières)
+par celui du paquet apps/patrimoine/models/ (UUID, audit, suppression
+logique, historique).
+
+Les anciennes tables sont d'abord déplacées dans le schéma
+patrimoine_ancien, avec leurs index et contraintes ; les nouvelles tables
+sont créées sous les mêmes noms, les données reprises, puis le schéma
+patrimoine_ancien est supprimé. Le tout s'exécute dans une transaction.
+
+Reprise :
+- les codes obligatoires absents des anciennes tables sont dérivés de
+  l'identifiant historique (PRV-001, ENT-00012...) ; les codes patrimoine
+  suivent le format de CodePatrimoineAllocator ;
+- un bien sans sous-catégorie est rattaché à une sous-catégorie
+  « Non classé » de sa catégorie ;
+- chaque responsable historique reçoit un compte utilisateur sans mot de
+  passe utilisable (identifiant : son matricule), sauf si ce compte existe ;
+- pour chaque bien, seule la dernière affectation reste active ;
+- les colonnes sans équivalent sont conservées dans metadata['reprise'],
+  avec l'identifiant historique.
+"""
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import simple_history.models
+import uuid
+from collections import defaultdict
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import F, Func, TextField, Value
+from django.utils.text import slugify
+
+SCHEMA_ANCIEN = 'patrimoine_ancien'
+
+TABLES_ANCIENNES = [
+    'patrimoine_province', 'patrimoine_departement', 'patrimoine_commune',
+    'patrimoine_district', 'patrimoine_categorie', 'patrimoine_souscategorie',
+    'patrimoine_entite', 'patrimoine_bien', 'patrimoine_responsablebien',
+    'patrimoine_bienresponsabilite', 'patrimoine_historiquevaleur',
+    'patrimoine_profilvehicule', 'patrimoine_profilimmeuble',
+    'patrimoine_profilinformatique', 'patrimoine_profilequipementmedical',
+    'patrimoine_profilmobilier', 'patrimoine_profilterrain',
+    'patrimoine_profilconsommable',
+]
+
+# Du dépendant vers le référencé, pour retirer les anciens modèles de l'état
+MODELES_ANCIENS = [
+    'ProfilConsommable', 'ProfilTerrain', 'ProfilMobilier',
+    'ProfilEquipementMedical', 'ProfilInformatique', 'ProfilImmeuble',
+    'ProfilVehicule', 'HistoriqueValeur', 'BienResponsabilite',
+    'ResponsableBien', 'Bien', 'Entite', 'SousCategorie', 'Categorie',
+    'District', 'Commune', 'Departement', 'Province',
+]
+
+PROFILS = {
+    'ProfilVehicule': 'patrimoine_profilvehicule',
+    'ProfilImmeuble': 'patrimoine_profilimmeuble',
+    'ProfilInformatique': 'patrimoine_profilinformatique',
+    'ProfilEquipementMedical': 'patrimoine_profilequipementmedical',
+    'ProfilMobilier': 'patrimoine_profilmobilier',
+    'ProfilTerrain': 'patrimoine_profilterrain',
+    'ProfilConsommable': 'patrimoine_profilconsommable',
+}
+
+# Vecteurs de recherche initiaux (champs et poids de RechercheService)
+CHAMPS_RECHERCHE = {
+    'Bien': [('code_patrimoine', 'A'), ('nom', 'A'), ('numero_serie', 'B'),
+             ('marque', 'B'), ('modele', 'B'), ('tags', 'B'), ('description', 'C')],
+    'Categorie': [('code', 'A'), ('nom', 'A')],
+    'SousCategorie': [('code', 'A'), ('nom', 'A'), ('description', 'C')],
+    'Entite': [('code', 'A'), ('nom', 'A')],
+}
+
+TAILLE_LOT = 1000
+
+
+def _lignes(cursor, table):
+    cursor.execute(f'SELECT * FROM {SCHEMA_ANCIEN}.{table} ORDER BY id')
+    colonnes = [colonne.name for colonne in cursor.description]
+    return [dict(zip(colonnes, ligne)) for ligne in cursor.fetchall()]
+
+
+def _unique(valeur, vus, ancien_id, longueur, portee=None):
+    """Valeur tronquée à `longueur`, suffixée de l'ancien id si déjà prise."""
+    valeur = valeur[:longueur]
+    if (portee, valeur) in vus:
+        suffixe = f"-{ancien_id}"
+        valeur = f"{valeur[:longueur - len(suffixe)]}{suffixe}"
+    vus.add((portee, valeur))
+    return valeur
+
+
+def _metadata(ligne, champs=()):
+    """Identifiant historique et colonnes sans équivalent."""
+    reprise = {'ancien_id': ligne['id']}
+    for champ in champs:
+        valeur = ligne[champ]
+        if valeur not in (None, ''):
+            reprise[champ] = valeur if isinstance(valeur, (int, str)) else str(valeur)
+    return {'reprise': reprise}
+
+
+def _creer(model, objets):
+    model.objects.bulk_create(list(objets.values()), batch_size=TAILLE_LOT)
+    return objets
+
+
+def reprendre_donnees(apps, schema_editor):
+    """Recopie les données des anciennes tables dans les nouvelles."""
+    modele = lambda nom: apps.get_model('patrimoine', nom)
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Province, Departement = modele('Province'), modele('Departement')
+    Commune, District = modele('Commune'), modele('District')
+    Categorie, SousCategorie = modele('Categorie'), modele('SousCategorie')
+    Entite, Bien = modele('Entite'), modele('Bien')
+    ResponsableBien, BienResponsabilite = modele('ResponsableBien'), modele('BienResponsabilite')
+    HistoriqueValeur = modele('HistoriqueValeur')
+
+    with schema_editor.connection.cursor() as cursor:
+        # Localisation
+        vus = set()
+        provinces = _creer(Province, {
+            l['id']: Province(
+                nom=_unique(l['nom'], vus, l['id'], 100),
+                code=f"PRV-{l['id']:03d}",
+                metadata=_metadata(l),
+            )
+            for l in _lignes(cursor, 'patrimoine_province')
+        })
+        departements = _creer(Departement, {
+            l['id']: Departement(
+                nom=_unique(l['nom'], vus, l['id'], 100, ('departement', l['province_id'])),
+                code=f"DEP-{l['id']:04d}",
+                province=provinces[l['province_id']],
+                metadata=_metadata(l),
+            )
+            for l in _lignes(cursor, 'patrimoine_departement')
+        })
+        communes = _creer(Commune, {
+            l['id']: Commune(
+                nom=_unique(l['nom'], vus, l['id'], 100, ('commune', l['departement_id'])),
+                code=f"COM-{l['id']:05d}",
+                departement=departements[l['departement_id']],
+                latitude=l['latitude'],
+                longitude=l['longitude'],
+                metadata=_metadata(l),
+            )
+            for l in _lignes(cursor, 'patrimoine_commune')
+        })
+        _creer(District, {
+            l['id']: District(
+                nom=_unique(l['nom'], vus, l['id'], 100, ('district', l['commune_id'])),
+                code=f"DIS-{l['id']:05d}",
+                commune=communes[l['commune_id']],
+                metadata=_metadata(l),
+            )
+            for l in _lignes(cursor, 'patrimoine_district')
+        })
+
+        # Catégorisation
+        vus, codes = set(), set()
+        categories = _creer(Categorie, {
+            l['id']: Categorie(
+                nom=_unique(l['nom'], vus, l['id'], 100),
+                code=_unique(slugify(l['nom']) or 'categorie', codes, l['id'], 50),
+                type=(l['type'] or 'mobilier').upper(),
+                metadata=_metadata(l),
+            )
+            for l in _lignes(cursor, 'patrimoine_categorie')
+        })
+        sous_categories = _creer(SousCategorie, {
+            l['id']: SousCategorie(
+                categorie=categories[l['categorie_id']],
+                nom=l['nom'],
+                code=_unique(l['code'] or slugify(l['nom']) or 'sous-categorie', codes, l['id'], 50),
+                metadata=_metadata(l),
+            )
+            for l in _lignes(cursor, 'patrimoine_souscategorie')
+        })
+
+        # Entités
+        vus = set()
+        entites = _creer(Entite, {
+            l['id']: Entite(
+                nom=_unique(l['nom'], vus, l['id'], 200),
+                code=f"ENT-{l['id']:05d}",
+                type='SERVICE',
+                commune=communes.get(l['commune_id']),
+                metadata=_metadata(l, ['responsable']),
+            )
+            for l in _lignes(cursor, 'patrimoine_entite')
+        })
+
+        # Biens ; sous-catégorie « Non classé » pour ceux qui n'en ont pas
+        lignes_biens = _lignes(cursor, 'patrimoine_bien')
+        non_classees = {}
+        for l in lignes_biens:
+            if l['sous_categorie_id'] is None and l['categorie_id'] not in non_classees:
+                categorie = categories[l['categorie_id']]
+                non_classees[l['categorie_id']] = SousCategorie(
+                    categorie=categorie,
+                    nom='Non classé',
+                    code=_unique(f"{categorie.code}-non-classe", codes, l['categorie_id'], 50),
+                )
+        _creer(SousCategorie, non_classees)
+
+        numeros = defaultdict(int)
+        biens = {}
+        for l in lignes_biens:
+            sous_categorie = (
+                sous_categories[l['sous_categorie_id']] if l['sous_categorie_id']
+                else non_classees[l['categorie_id']]
+            )
+            cle = (l['date_acquisition'].year, sous_categorie.code[:3].upper())
+            numeros[cle] += 1
+            biens[l['id']] = Bien(
+                code_patrimoine=f"OPRAG-{cle[0]}-{cle[1]}-{numeros[cle]:05d}",
+                nom=l['nom'],
+                description=l['description'],
+                categorie=categories[l['categorie_id']],
+                sous_categorie=sous_categorie,
+                entite=entites[l['entite_id']],
+                commune=communes.get(l['commune_id']),
+                valeur_acquisition=l['valeur_initiale'],
+                valeur_actuelle_cache=l['valeur_initiale'],
+                date_acquisition=l['date_acquisition'],
+                duree_amortissement=l['duree_amortissement'],
+                numero_serie=l['numero_serie'] or '',
+                metadata=_metadata(
+                    l, ['superficie', 'annee_construction', 'statut_juridique', 'justificatif']
+                ),
+            )
+        _creer(Bien, biens)
+
+        # Responsables : un compte utilisateur par matricule
+        lignes_responsables = _lignes(cursor, 'patrimoine_responsablebien')
+        utilisateurs = {
+            user.username: user
+            for user in User.objects.filter(
+                username__in=[l['matricule'] for l in lignes_responsables]
+            )
+        }
+        nouveaux = {
+            l['matricule']: User(
+                username=l['matricule'],
+                first_name=l['prenom'][:150],
+                last_name=l['nom'][:150],
+                email=l['email'],
+                password=make_password(None),
+            )
+            for l in lignes_responsables
+            if l['matricule'] not in utilisateurs
+        }
+        utilisateurs.update(_creer(User, nouveaux))
+        responsables = _creer(ResponsableBien, {
+            l['id']: ResponsableBien(
+                user=utilisateurs[l['matricule']],
+                matricule=l['matricule'],
+                fonction=l['fonction'],
+                telephone=l['telephone'],
+                email_professionnel=l['email'],
+                metadata=_metadata(l, ['categorie', 'corps']),
+            )
+            for l in lignes_responsables
+        })
+
+        # Affectations : la plus récente de chaque bien reste active
+        par_bien = defaultdict(list)
+        for l in _lignes(cursor, 'patrimoine_bienresponsabilite'):
+            par_bien[l['bien_id']].append(l)
+        affectations = {}
+        for bien_id, lignes in par_bien.items():
+            lignes.sort(key=lambda l: (l['date_affectation'], l['id']))
+            for l, suivante in zip(lignes, lignes[1:] + [None]):
+                affectations[l['id']] = BienResponsabilite(
+                    bien=biens[bien_id],
+                    responsable=responsables[l['responsable_id']],
+                    date_debut=l['date_affectation'],
+                    date_fin=suivante['date_affectation'] if suivante else None,
+                    actif=suivante is None,
+                    type_affectation=l['type_affectation'].upper(),
+                    motif=l['motif'],
+                    metadata=_metadata(l, [
+                        'numero_permis', 'date_permis', 'categorie_permis',
+                        'composition_foyer', 'conditions_occupation',
+                        'certifications', 'formations',
+                    ]),
+                )
+        _creer(BienResponsabilite, affectations)
+
+        # Historique : une valeur par (bien, date), la dernière saisie
+        historiques = {}
+        for l in _lignes(cursor, 'patrimoine_historiquevaleur'):
+            historiques[(l['bien_id'], l['date'])] = HistoriqueValeur(
+                bien=biens[l['bien_id']],
+                date=l['date'],
+                valeur=l['valeur'],
+                type_evaluation='REEVALUATION',
+                metadata=_metadata(l),
+            )
+        _creer(HistoriqueValeur, historiques)
+
+        # Profils techniques, colonne pour colonne
+        for nom, table in PROFILS.items():
+            Profil = modele(nom)
+            _creer(Profil, {
+                l['id']: Profil(
+                    bien=biens[l['bien_id']],
+                    **{champ: valeur for champ, valeur in l.items() if champ not in ('id', 'bien_id')}
+                )
+                for l in _lignes(cursor, table)
+            })
+
+    # Vecteurs de recherche des lignes reprises
+    for nom, champs in CHAMPS_RECHERCHE.items():
+        vecteur = None
+        for champ, poids in champs:
+            expression = champ
+            if champ == 'tags':
+                expression = Func(F(champ), Value(' '), function='array_to_string', output_field=TextField())
+            terme = SearchVector(expression, weight=poids, config='french')
+            vecteur = terme if vecteur is None else vecteur + terme
+        modele(nom).objects.update(search_vector=vecteur)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0007_trigram_extension'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    [f'CREATE SCHEMA {SCHEMA_ANCIEN}'] + [
+                        f'ALTER TABLE {table} SET SCHEMA {SCHEMA_ANCIEN}'
+                        for table in TABLES_ANCIENNES
+                    ]
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(name=nom) for nom in MODELES_ANCIENS
+            ],
+        ),
+        migrations.CreateModel(
+            name='Categorie',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('nom', models.CharField(db_index=True, max_length=100, unique=True)),
+                ('code', models.SlugField(unique=True)),
+                ('type', models.CharField(choices=[('IMMOBILIER', 'Bien Immobilier'), ('MOBILIER', 'Bien Mobilier'), ('INCORPOREL', 'Bien Incorporel')], db_index=True, max_length=20)),
+                ('icone', models.CharField(blank=True, help_text="Classe CSS de l'icône", max_length=50)),
+                ('couleur', models.CharField(blank=True, help_text='Code couleur hexadécimal', max_length=7)),
+                ('ordre', models.PositiveSmallIntegerField(default=0)),
+                ('actif', models.BooleanField(db_index=True, default=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='enfants', to='patrimoine.categorie')),
+            ],
+            options={
+                'verbose_name': 'Catégorie',
+                'verbose_name_plural': 'Catégories',
+                'ordering': ['type', 'ordre', 'nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Departement',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.CharField(max_length=20, unique=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Département',
+                'verbose_name_plural': 'Départements',
+                'ordering': ['province__nom', 'nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Commune',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.CharField(max_length=30, unique=True)),
+                ('latitude', models.DecimalField(blank=True, decimal_places=8, max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)])),
+                ('longitude', models.DecimalField(blank=True, decimal_places=8, max_digits=11, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)])),
+                ('population', models.PositiveIntegerField(blank=True, null=True)),
+                ('superficie_km2', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('departement', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='communes', to='patrimoine.departement')),
+            ],
+            options={
+                'verbose_name': 'Commune',
+                'verbose_name_plural': 'Communes',
+                'ordering': ['departement__province__nom', 'departement__nom', 'nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='District',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(max_length=100)),
+                ('code', models.CharField(max_length=40, unique=True)),
+                ('commune', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='districts', to='patrimoine.commune')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'District',
+                'verbose_name_plural': 'Districts',
+                'ordering': ['commune__nom', 'nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Entite',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('nom', models.CharField(db_index=True, max_length=200, unique=True)),
+                ('code', models.CharField(max_length=20, unique=True)),
+                ('type', models.CharField(choices=[('DIRECTION', 'Direction'), ('SERVICE', 'Service'), ('DEPARTEMENT', 'Département'), ('AGENCE', 'Agence'), ('PORT', 'Port'), ('TERMINAL', 'Terminal')], db_index=True, max_length=20)),
+                ('adresse', models.TextField(blank=True)),
+                ('telephone', models.CharField(blank=True, max_length=20)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('budget_annuel', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('effectif', models.PositiveIntegerField(default=0)),
+                ('actif', models.BooleanField(db_index=True, default=True)),
+                ('commune', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='patrimoine.commune')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sous_entites', to='patrimoine.entite')),
+                ('responsable', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='entites_dirigees', to=settings.AUTH_USER_MODEL)),
+                ('responsable_adjoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='entites_adjoint', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Entité',
+                'verbose_name_plural': 'Entités',
+                'ordering': ['type', 'nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Bien',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('code_patrimoine', models.CharField(db_index=True, help_text='Code unique OPRAG', max_length=50, unique=True)),
+                ('code_comptable', models.CharField(blank=True, db_index=True, help_text='Code comptable', max_length=50)),
+                ('nom', models.CharField(db_index=True, max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('localisation_precise', models.CharField(blank=True, help_text='Bâtiment, étage, bureau, etc.', max_length=255)),
+                ('coordonnees_gps', models.JSONField(blank=True, help_text='Coordonnées GPS {lat, lng}', null=True)),
+                ('valeur_acquisition', models.DecimalField(decimal_places=2, max_digits=15, validators=[django.core.validators.MinValueValidator(0)])),
+                ('devise', models.CharField(default='XAF', help_text='Code devise ISO', max_length=3)),
+                ('date_acquisition', models.DateField()),
+                ('date_mise_service', models.DateField(blank=True, null=True)),
+                ('duree_amortissement', models.PositiveIntegerField(blank=True, help_text='En mois', null=True)),
+                ('valeur_residuelle', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('statut', models.CharField(choices=[('ACTIF', 'Actif - En service'), ('INACTIF', 'Inactif - Hors service'), ('MAINTENANCE', 'En maintenance'), ('REFORME', 'Réformé'), ('CEDE', 'Cédé'), ('DETRUIT', 'Détruit'), ('VOLE', 'Volé'), ('PERDU', 'Perdu')], db_index=True, default='ACTIF', max_length=20)),
+                ('etat_physique', models.CharField(choices=[('NEUF', 'Neuf'), ('EXCELLENT', 'Excellent'), ('BON', 'Bon'), ('MOYEN', 'Moyen'), ('MAUVAIS', 'Mauvais'), ('HORS_USAGE', "Hors d'usage")], db_index=True, default='BON', max_length=20)),
+                ('numero_serie', models.CharField(blank=True, db_index=True, max_length=100)),
+                ('modele', models.CharField(blank=True, max_length=100)),
+                ('marque', models.CharField(blank=True, max_length=100)),
+                ('fournisseur', models.CharField(blank=True, max_length=200)),
+                ('facture', models.FileField(blank=True, null=True, upload_to='factures/%Y/%m/')),
+                ('photo_principale', models.ImageField(blank=True, null=True, upload_to='photos/%Y/%m/')),
+                ('documents', models.JSONField(blank=True, default=list, help_text='Liste des documents associés')),
+                ('date_fin_garantie', models.DateField(blank=True, null=True)),
+                ('contrat_maintenance', models.CharField(blank=True, max_length=100)),
+                ('prochaine_maintenance', models.DateField(blank=True, null=True)),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, size=None)),
+                ('code_qr', models.CharField(blank=True, max_length=100, null=True, unique=True)),
+                ('code_barre', models.CharField(blank=True, max_length=100, null=True, unique=True)),
+                ('valeur_actuelle_cache', models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=15, null=True)),
+                ('dernier_inventaire', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('categorie', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='biens', to='patrimoine.categorie')),
+                ('commune', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='patrimoine.commune')),
+                ('entite', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='biens', to='patrimoine.entite')),
+            ],
+            options={
+                'verbose_name': 'Bien',
+                'verbose_name_plural': 'Biens',
+                'ordering': ['-date_acquisition', 'nom'],
+                'permissions': [('can_validate_bien', 'Peut valider un bien'), ('can_reform_bien', 'Peut réformer un bien'), ('can_transfer_bien', 'Peut transférer un bien'), ('can_export_data', 'Peut exporter les données')],
+            },
+        ),
+        migrations.CreateModel(
+            name='HistoricalCategorie',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.SlugField()),
+                ('type', models.CharField(choices=[('IMMOBILIER', 'Bien Immobilier'), ('MOBILIER', 'Bien Mobilier'), ('INCORPOREL', 'Bien Incorporel')], db_index=True, max_length=20)),
+                ('icone', models.CharField(blank=True, help_text="Classe CSS de l'icône", max_length=50)),
+                ('couleur', models.CharField(blank=True, help_text='Code couleur hexadécimal', max_length=7)),
+                ('ordre', models.PositiveSmallIntegerField(default=0)),
+                ('actif', models.BooleanField(db_index=True, default=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('parent', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.categorie')),
+            ],
+            options={
+                'verbose_name': 'historical Catégorie',
+                'verbose_name_plural': 'historical Catégories',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalCommune',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.CharField(db_index=True, max_length=30)),
+                ('latitude', models.DecimalField(blank=True, decimal_places=8, max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)])),
+                ('longitude', models.DecimalField(blank=True, decimal_places=8, max_digits=11, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)])),
+                ('population', models.PositiveIntegerField(blank=True, null=True)),
+                ('superficie_km2', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('departement', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.departement')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'historical Commune',
+                'verbose_name_plural': 'historical Communes',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalDistrict',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(max_length=100)),
+                ('code', models.CharField(db_index=True, max_length=40)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('commune', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.commune')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'historical District',
+                'verbose_name_plural': 'historical Districts',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalEntite',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('nom', models.CharField(db_index=True, max_length=200)),
+                ('code', models.CharField(db_index=True, max_length=20)),
+                ('type', models.CharField(choices=[('DIRECTION', 'Direction'), ('SERVICE', 'Service'), ('DEPARTEMENT', 'Département'), ('AGENCE', 'Agence'), ('PORT', 'Port'), ('TERMINAL', 'Terminal')], db_index=True, max_length=20)),
+                ('adresse', models.TextField(blank=True)),
+                ('telephone', models.CharField(blank=True, max_length=20)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('budget_annuel', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('effectif', models.PositiveIntegerField(default=0)),
+                ('actif', models.BooleanField(db_index=True, default=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('commune', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.commune')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('parent', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.entite')),
+                ('responsable', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('responsable_adjoint', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'historical Entité',
+                'verbose_name_plural': 'historical Entités',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalHistoriqueValeur',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('date', models.DateField()),
+                ('valeur', models.DecimalField(decimal_places=2, max_digits=15, validators=[django.core.validators.MinValueValidator(0)])),
+                ('type_evaluation', models.CharField(choices=[('ACQUISITION', 'Acquisition'), ('REEVALUATION', 'Réévaluation'), ('EXPERTISE', 'Expertise'), ('DEPRECIATION', 'Dépréciation'), ('CESSION', 'Cession')], max_length=50)),
+                ('motif', models.TextField(blank=True)),
+                ('evaluateur', models.CharField(blank=True, max_length=200)),
+                ('document_justificatif', models.TextField(blank=True, max_length=100, null=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('bien', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.bien')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'historical Historique de valeur',
+                'verbose_name_plural': 'historical Historiques de valeurs',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalProvince',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.CharField(db_index=True, max_length=10)),
+                ('geometry', models.JSONField(blank=True, help_text='Données GeoJSON', null=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'historical Province',
+                'verbose_name_plural': 'historical Provinces',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalResponsableBien',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('matricule', models.CharField(db_index=True, max_length=50)),
+                ('fonction', models.CharField(max_length=100)),
+                ('telephone', models.CharField(max_length=20)),
+                ('email_professionnel', models.EmailField(max_length=254)),
+                ('signature', models.TextField(blank=True, max_length=100, null=True)),
+                ('actif', models.BooleanField(db_index=True, default=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('entite_principale', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.entite')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'historical Responsable de bien',
+                'verbose_name_plural': 'historical Responsables de biens',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalSousCategorie',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.SlugField()),
+                ('description', models.TextField(blank=True)),
+                ('profil_technique', models.CharField(blank=True, help_text='Nom du modèle de profil technique associé', max_length=50)),
+                ('champs_obligatoires', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, help_text='Liste des champs obligatoires pour cette sous-catégorie', size=None)),
+                ('duree_amortissement_defaut', models.PositiveIntegerField(blank=True, help_text="Durée d'amortissement par défaut en mois", null=True)),
+                ('taux_depreciation_annuel', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('categorie', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.categorie')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'historical Sous-catégorie',
+                'verbose_name_plural': 'historical Sous-catégories',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoriqueValeur',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('date', models.DateField()),
+                ('valeur', models.DecimalField(decimal_places=2, max_digits=15, validators=[django.core.validators.MinValueValidator(0)])),
+                ('type_evaluation', models.CharField(choices=[('ACQUISITION', 'Acquisition'), ('REEVALUATION', 'Réévaluation'), ('EXPERTISE', 'Expertise'), ('DEPRECIATION', 'Dépréciation'), ('CESSION', 'Cession')], max_length=50)),
+                ('motif', models.TextField(blank=True)),
+                ('evaluateur', models.CharField(blank=True, max_length=200)),
+                ('document_justificatif', models.FileField(blank=True, null=True, upload_to='evaluations/%Y/%m/')),
+                ('bien', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='historique_valeurs', to='patrimoine.bien')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Historique de valeur',
+                'verbose_name_plural': 'Historiques de valeurs',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfilConsommable',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantite_initiale', models.PositiveIntegerField()),
+                ('unite', models.CharField(max_length=50)),
+                ('stock_securite', models.PositiveIntegerField(default=0)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_consommable', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfilEquipementMedical',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type_equipement', models.CharField(choices=[('diagnostic', 'Diagnostic'), ('therapeutique', 'Thérapeutique'), ('laboratoire', 'Laboratoire'), ('monitoring', 'Surveillance'), ('imagerie', 'Imagerie'), ('chirurgical', 'Chirurgical'), ('sterilisation', 'Stérilisation'), ('autre', 'Autre')], max_length=50)),
+                ('marque', models.CharField(max_length=100)),
+                ('modele', models.CharField(max_length=100)),
+                ('numero_serie', models.CharField(max_length=100)),
+                ('date_fabrication', models.DateField(blank=True, null=True)),
+                ('certification', models.CharField(blank=True, max_length=100)),
+                ('classe_risque', models.CharField(blank=True, choices=[('i', 'Classe I - Risque faible'), ('iia', 'Classe IIa - Risque modéré'), ('iib', 'Classe IIb - Risque élevé'), ('iii', 'Classe III - Risque critique')], max_length=3)),
+                ('normes_applicables', models.TextField(blank=True)),
+                ('organisme_certification', models.CharField(blank=True, max_length=100)),
+                ('parametres_techniques', models.TextField(blank=True)),
+                ('source_energie', models.CharField(blank=True, max_length=100)),
+                ('consommation', models.CharField(blank=True, max_length=50)),
+                ('duree_vie', models.PositiveIntegerField(blank=True, null=True)),
+                ('date_installation', models.DateField(blank=True, null=True)),
+                ('date_derniere_maintenance', models.DateField(blank=True, null=True)),
+                ('frequence_maintenance', models.PositiveIntegerField(default=365)),
+                ('maintenance', models.TextField(blank=True)),
+                ('pieces', models.TextField(blank=True)),
+                ('statut', models.CharField(choices=[('actif', 'Actif - En service'), ('maintenance', 'En maintenance'), ('stockage', 'En stockage'), ('inutilisable', 'Hors service'), ('calibration', 'En calibration')], default='actif', max_length=20)),
+                ('departement_utilisation', models.CharField(blank=True, max_length=100)),
+                ('utilisateurs_formes', models.TextField(blank=True)),
+                ('date_acquisition', models.DateField(blank=True, null=True)),
+                ('fin_garantie', models.DateField(blank=True, null=True)),
+                ('contrat_maintenance', models.CharField(blank=True, max_length=100)),
+                ('fournisseur_service', models.CharField(blank=True, max_length=100)),
+                ('contact_sav', models.CharField(blank=True, max_length=100)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_equipement_medical', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfilImmeuble',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('surface', models.DecimalField(decimal_places=2, max_digits=8)),
+                ('nb_etages', models.PositiveIntegerField()),
+                ('annee_construction', models.PositiveIntegerField()),
+                ('securite', models.CharField(max_length=255)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_immeuble', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfilInformatique',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type_equipement', models.CharField(choices=[('ordinateur_fixe', 'Ordinateur fixe'), ('ordinateur_portable', 'Ordinateur portable'), ('serveur', 'Serveur'), ('imprimante', 'Imprimante'), ('scanner', 'Scanner'), ('photocopieur', 'Photocopieur'), ('reseau', 'Équipement réseau'), ('stockage', 'Solution de stockage'), ('autre', 'Autre')], max_length=50)),
+                ('marque', models.CharField(max_length=100)),
+                ('modele', models.CharField(max_length=100)),
+                ('numero_serie', models.CharField(max_length=100)),
+                ('date_fabrication', models.DateField(blank=True, null=True)),
+                ('processeur', models.CharField(blank=True, max_length=100)),
+                ('memoire_ram', models.CharField(blank=True, max_length=50)),
+                ('capacite_stockage', models.CharField(blank=True, max_length=50)),
+                ('carte_graphique', models.CharField(blank=True, max_length=100)),
+                ('spec_tech', models.TextField(blank=True)),
+                ('os', models.CharField(blank=True, max_length=100)),
+                ('version_os', models.CharField(blank=True, max_length=50)),
+                ('logiciels', models.TextField(blank=True)),
+                ('adresse_ip', models.GenericIPAddressField(blank=True, null=True)),
+                ('adresse_mac', models.CharField(blank=True, max_length=17)),
+                ('nom_reseau', models.CharField(blank=True, max_length=100)),
+                ('statut', models.CharField(choices=[('en_service', 'En service'), ('en_maintenance', 'En maintenance'), ('hors_service', 'Hors service'), ('en_attente', 'En attente de déploiement')], default='en_service', max_length=20)),
+                ('date_derniere_maj', models.DateField(auto_now=True)),
+                ('date_derniere_maintenance', models.DateField(blank=True, null=True)),
+                ('prochaine_maintenance', models.DateField(blank=True, null=True)),
+                ('date_acquisition', models.DateField(blank=True, null=True)),
+                ('date_mise_service', models.DateField(blank=True, null=True)),
+                ('fin_garantie', models.DateField(blank=True, null=True)),
+                ('contrat_maintenance', models.CharField(blank=True, max_length=100)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_informatique', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfilMobilier',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('materiau', models.CharField(max_length=100)),
+                ('couleur', models.CharField(max_length=50)),
+                ('fabricant', models.CharField(max_length=100)),
+                ('annee_fabrication', models.PositiveIntegerField(blank=True, null=True)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_mobilier', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfilTerrain',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('superficie', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('statut_juridique', models.CharField(max_length=255)),
+                ('usage', models.CharField(blank=True, max_length=100)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_terrain', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProfilVehicule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('marque', models.CharField(max_length=100)),
+                ('modele', models.CharField(max_length=100)),
+                ('matricule', models.CharField(blank=True, max_length=50, null=True)),
+                ('numero_chassis', models.CharField(blank=True, max_length=100, null=True)),
+                ('date_fabrication', models.DateField(blank=True, null=True)),
+                ('date_acquisition', models.DateField(blank=True, null=True)),
+                ('date_derniere_maintenance', models.DateField(blank=True, null=True)),
+                ('prochaine_maintenance', models.DateField(blank=True, null=True)),
+                ('bien', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profil_vehicule', to='patrimoine.bien')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Province',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(db_index=True, max_length=100, unique=True)),
+                ('code', models.CharField(max_length=10, unique=True)),
+                ('geometry', models.JSONField(blank=True, help_text='Données GeoJSON', null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Province',
+                'verbose_name_plural': 'Provinces',
+                'ordering': ['nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HistoricalDepartement',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.CharField(db_index=True, max_length=20)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('province', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.province')),
+            ],
+            options={
+                'verbose_name': 'historical Département',
+                'verbose_name_plural': 'historical Départements',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.AddField(
+            model_name='departement',
+            name='province',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='departements', to='patrimoine.province'),
+        ),
+        migrations.CreateModel(
+            name='ResponsableBien',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('matricule', models.CharField(max_length=50, unique=True)),
+                ('fonction', models.CharField(max_length=100)),
+                ('telephone', models.CharField(max_length=20)),
+                ('email_professionnel', models.EmailField(max_length=254)),
+                ('signature', models.ImageField(blank=True, null=True, upload_to='signatures/')),
+                ('actif', models.BooleanField(db_index=True, default=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('entite_principale', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to='patrimoine.entite')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='responsabilite_biens', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Responsable de bien',
+                'verbose_name_plural': 'Responsables de biens',
+                'ordering': ['user__last_name', 'user__first_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HistoricalBienResponsabilite',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('date_debut', models.DateField()),
+                ('date_fin', models.DateField(blank=True, null=True)),
+                ('type_affectation', models.CharField(choices=[('PERMANENT', 'Permanent'), ('TEMPORAIRE', 'Temporaire'), ('DELEGATION', 'Délégation')], default='PERMANENT', max_length=20)),
+                ('motif', models.TextField(blank=True)),
+                ('document_affectation', models.TextField(blank=True, max_length=100, null=True)),
+                ('actif', models.BooleanField(default=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('bien', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.bien')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('responsable', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.responsablebien')),
+            ],
+            options={
+                'verbose_name': 'historical Responsabilité de bien',
+                'verbose_name_plural': 'historical Responsabilités de biens',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='BienResponsabilite',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('date_debut', models.DateField()),
+                ('date_fin', models.DateField(blank=True, null=True)),
+                ('type_affectation', models.CharField(choices=[('PERMANENT', 'Permanent'), ('TEMPORAIRE', 'Temporaire'), ('DELEGATION', 'Délégation')], default='PERMANENT', max_length=20)),
+                ('motif', models.TextField(blank=True)),
+                ('document_affectation', models.FileField(blank=True, null=True, upload_to='affectations/%Y/%m/')),
+                ('actif', models.BooleanField(default=True)),
+                ('bien', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='responsabilites', to='patrimoine.bien')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('responsable', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='biens_geres', to='patrimoine.responsablebien')),
+            ],
+            options={
+                'verbose_name': 'Responsabilité de bien',
+                'verbose_name_plural': 'Responsabilités de biens',
+                'ordering': ['-date_debut'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SousCategorie',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('nom', models.CharField(db_index=True, max_length=100)),
+                ('code', models.SlugField(unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('profil_technique', models.CharField(blank=True, help_text='Nom du modèle de profil technique associé', max_length=50)),
+                ('champs_obligatoires', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, help_text='Liste des champs obligatoires pour cette sous-catégorie', size=None)),
+                ('duree_amortissement_defaut', models.PositiveIntegerField(blank=True, help_text="Durée d'amortissement par défaut en mois", null=True)),
+                ('taux_depreciation_annuel', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('categorie', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='sous_categories', to='patrimoine.categorie')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('modified_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+            ],
+            options={
+                'verbose_name': 'Sous-catégorie',
+                'verbose_name_plural': 'Sous-catégories',
+                'ordering': ['categorie__nom', 'nom'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HistoricalBien',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('code_patrimoine', models.CharField(db_index=True, help_text='Code unique OPRAG', max_length=50)),
+                ('code_comptable', models.CharField(blank=True, db_index=True, help_text='Code comptable', max_length=50)),
+                ('nom', models.CharField(db_index=True, max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('localisation_precise', models.CharField(blank=True, help_text='Bâtiment, étage, bureau, etc.', max_length=255)),
+                ('coordonnees_gps', models.JSONField(blank=True, help_text='Coordonnées GPS {lat, lng}', null=True)),
+                ('valeur_acquisition', models.DecimalField(decimal_places=2, max_digits=15, validators=[django.core.validators.MinValueValidator(0)])),
+                ('devise', models.CharField(default='XAF', help_text='Code devise ISO', max_length=3)),
+                ('date_acquisition', models.DateField()),
+                ('date_mise_service', models.DateField(blank=True, null=True)),
+                ('duree_amortissement', models.PositiveIntegerField(blank=True, help_text='En mois', null=True)),
+                ('valeur_residuelle', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('statut', models.CharField(choices=[('ACTIF', 'Actif - En service'), ('INACTIF', 'Inactif - Hors service'), ('MAINTENANCE', 'En maintenance'), ('REFORME', 'Réformé'), ('CEDE', 'Cédé'), ('DETRUIT', 'Détruit'), ('VOLE', 'Volé'), ('PERDU', 'Perdu')], db_index=True, default='ACTIF', max_length=20)),
+                ('etat_physique', models.CharField(choices=[('NEUF', 'Neuf'), ('EXCELLENT', 'Excellent'), ('BON', 'Bon'), ('MOYEN', 'Moyen'), ('MAUVAIS', 'Mauvais'), ('HORS_USAGE', "Hors d'usage")], db_index=True, default='BON', max_length=20)),
+                ('numero_serie', models.CharField(blank=True, db_index=True, max_length=100)),
+                ('modele', models.CharField(blank=True, max_length=100)),
+                ('marque', models.CharField(blank=True, max_length=100)),
+                ('fournisseur', models.CharField(blank=True, max_length=200)),
+                ('facture', models.TextField(blank=True, max_length=100, null=True)),
+                ('photo_principale', models.TextField(blank=True, max_length=100, null=True)),
+                ('documents', models.JSONField(blank=True, default=list, help_text='Liste des documents associés')),
+                ('date_fin_garantie', models.DateField(blank=True, null=True)),
+                ('contrat_maintenance', models.CharField(blank=True, max_length=100)),
+                ('prochaine_maintenance', models.DateField(blank=True, null=True)),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, size=None)),
+                ('code_qr', models.CharField(blank=True, db_index=True, max_length=100, null=True)),
+                ('code_barre', models.CharField(blank=True, db_index=True, max_length=100, null=True)),
+                ('valeur_actuelle_cache', models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=15, null=True)),
+                ('dernier_inventaire', models.DateTimeField(blank=True, null=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('categorie', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.categorie')),
+                ('commune', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.commune')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Créé par')),
+                ('entite', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.entite')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par')),
+                ('sous_categorie', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.souscategorie')),
+            ],
+            options={
+                'verbose_name': 'historical Bien',
+                'verbose_name_plural': 'historical Biens',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.AddField(
+            model_name='bien',
+            name='sous_categorie',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='biens', to='patrimoine.souscategorie'),
+        ),
+        migrations.AddIndex(
+            model_name='categorie',
+            index=models.Index(fields=['type', 'actif'], name='patrimoine__type_5e98b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorie',
+            index=models.Index(fields=['parent', 'ordre'], name='patrimoine__parent__21b3d5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='commune',
+            index=models.Index(fields=['latitude', 'longitude'], name='patrimoine__latitud_fb2070_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='commune',
+            index=models.Index(fields=['departement', 'nom'], name='patrimoine__departe_890739_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='commune',
+            unique_together={('nom', 'departement')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='district',
+            unique_together={('nom', 'commune')},
+        ),
+        migrations.AddIndex(
+            model_name='entite',
+            index=models.Index(fields=['type', 'actif'], name='patrimoine__type_71f3eb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entite',
+            index=models.Index(fields=['parent', 'nom'], name='patrimoine__parent__a5aa7c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historiquevaleur',
+            index=models.Index(fields=['bien', '-date'], name='patrimoine__bien_id_85978c_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='historiquevaleur',
+            unique_together={('bien', 'date', 'type_evaluation')},
+        ),
+        migrations.AddIndex(
+            model_name='departement',
+            index=models.Index(fields=['province', 'nom'], name='patrimoine__provinc_4f1f3e_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='departement',
+            unique_together={('nom', 'province')},
+        ),
+        migrations.AddIndex(
+            model_name='responsablebien',
+            index=models.Index(fields=['matricule'], name='patrimoine__matricu_7e9a11_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='responsablebien',
+            index=models.Index(fields=['actif'], name='patrimoine__actif_604d75_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bienresponsabilite',
+            index=models.Index(fields=['bien', 'actif'], name='patrimoine__bien_id_c2cd20_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bienresponsabilite',
+            index=models.Index(fields=['responsable', 'actif'], name='patrimoine__respons_c65116_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bienresponsabilite',
+            index=models.Index(fields=['date_debut', 'date_fin'], name='patrimoine__date_de_74b485_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='bienresponsabilite',
+            constraint=models.CheckConstraint(check=models.Q(('date_fin__gte', models.F('date_debut')), ('date_fin__isnull', True), _connector='OR'), name='date_fin_after_date_debut'),
+        ),
+        migrations.AddIndex(
+            model_name='souscategorie',
+            index=models.Index(fields=['categorie', 'code'], name='patrimoine__categor_9e6231_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['statut', 'etat_physique'], name='patrimoine__statut_94f483_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['categorie', 'sous_categorie'], name='patrimoine__categor_f56eac_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['entite', 'statut'], name='patrimoine__entite__17970e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['date_acquisition'], name='patrimoine__date_ac_c03cd1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['code_qr'], name='patrimoine__code_qr_659231_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['code_barre'], name='patrimoine__code_ba_f1660f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='patrimoine__tags_6e4594_gin'),
+        ),
+        migrations.RunPython(reprendre_donnees),
+        migrations.RunSQL(f'DROP SCHEMA {SCHEMA_ANCIEN} CASCADE'),
+    ]
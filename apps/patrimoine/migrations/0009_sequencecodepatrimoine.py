@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0008_bascule_modeles_uuid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SequenceCodePatrimoine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefixe', models.CharField(max_length=20)),
+                ('annee', models.PositiveSmallIntegerField()),
+                ('code_categorie', models.CharField(max_length=10)),
+                ('dernier_numero', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Séquence de codes patrimoine',
+                'verbose_name_plural': 'Séquences de codes patrimoine',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='sequencecodepatrimoine',
+            constraint=models.UniqueConstraint(fields=('prefixe', 'annee', 'code_categorie'), name='sequence_code_patrimoine_unique'),
+        ),
+    ]
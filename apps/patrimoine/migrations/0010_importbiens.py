@@ -0,0 +1,48 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:52
+
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0009_sequencecodepatrimoine'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportBiens',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('is_removed', models.BooleanField(default=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='Métadonnées flexibles')),
+                ('fichier', models.FileField(upload_to='imports/%Y/%m/')),
+                ('mode', models.CharField(default='create', max_length=10)),
+                ('chunk_size', models.PositiveIntegerField(default=1000)),
+                ('statut', models.CharField(choices=[('EN_ATTENTE', 'En attente'), ('EN_COURS', 'En cours'), ('TERMINE', 'Terminé'), ('ECHEC', 'Échec')], db_index=True, default='EN_ATTENTE', max_length=20)),
+                ('lignes_total', models.PositiveIntegerField(default=0)),
+                ('lignes_traitees', models.PositiveIntegerField(default=0, help_text='Lignes du fichier déjà traitées (point de reprise)')),
+                ('lignes_importees', models.PositiveIntegerField(default=0)),
+                ('lignes_en_erreur', models.PositiveIntegerField(default=0)),
+                ('erreurs', models.JSONField(blank=True, default=list)),
+                ('message', models.TextField(blank=True)),
+                ('date_debut', models.DateTimeField(blank=True, null=True)),
+                ('date_fin', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='imports_biens', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Import de biens',
+                'verbose_name_plural': 'Imports de biens',
+                'ordering': ['-created'],
+                'indexes': [models.Index(fields=['statut', 'modified'], name='patrimoine__statut_98e44c_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0010_importbiens'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntiteHierarchie',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('profondeur', models.PositiveSmallIntegerField()),
+                ('ancetre', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendants_liens', to='patrimoine.entite')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancetres_liens', to='patrimoine.entite')),
+            ],
+            options={
+                'verbose_name': "Lien hiérarchique d'entité",
+                'verbose_name_plural': "Liens hiérarchiques d'entités",
+                'indexes': [models.Index(fields=['descendant', 'profondeur'], name='patrimoine__descend_488540_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='entitehierarchie',
+            constraint=models.UniqueConstraint(fields=('ancetre', 'descendant'), name='entite_hierarchie_unique'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated manually: remplissage de la table de fermeture des entités existantes
+from django.db import migrations
+
+
+def remplir_fermeture(apps, schema_editor):
+    Entite = apps.get_model('patrimoine', 'Entite')
+    EntiteHierarchie = apps.get_model('patrimoine', 'EntiteHierarchie')
+    connection = schema_editor.connection
+    table = connection.ops.quote_name(EntiteHierarchie._meta.db_table)
+    entite_table = connection.ops.quote_name(Entite._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (ancetre_id, descendant_id, profondeur) "
+            f"WITH RECURSIVE fermeture(ancetre_id, descendant_id, profondeur) AS ("
+            f"  SELECT id, id, 0 FROM {entite_table} "
+            f"  UNION ALL "
+            f"  SELECT f.ancetre_id, e.id, f.profondeur + 1 "
+            f"  FROM fermeture f JOIN {entite_table} e ON e.parent_id = f.descendant_id"
+            f") SELECT ancetre_id, descendant_id, profondeur FROM fermeture"
+        )
+
+
+def vider_fermeture(apps, schema_editor):
+    EntiteHierarchie = apps.get_model('patrimoine', 'EntiteHierarchie')
+    EntiteHierarchie.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0011_entitehierarchie'),
+    ]
+
+    operations = [
+        migrations.RunPython(remplir_fermeture, vider_fermeture),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0012_backfill_entite_hierarchie'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='categorie',
+            name='chemin',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Chemin matérialisé des identifiants depuis la racine', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='historicalcategorie',
+            name='chemin',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Chemin matérialisé des identifiants depuis la racine', max_length=500),
+        ),
+    ]
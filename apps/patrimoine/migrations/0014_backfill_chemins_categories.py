@@ -0,0 +1,29 @@
+# Generated manually: calcul des chemins matérialisés des catégories existantes
+from django.db import migrations
+
+
+def calculer_chemins(apps, schema_editor):
+    Categorie = apps.get_model('patrimoine', 'Categorie')
+    connection = schema_editor.connection
+    table = connection.ops.quote_name(Categorie._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH RECURSIVE arbre(id, chemin) AS ("
+            f"  SELECT id, id::text || '/' FROM {table} WHERE parent_id IS NULL "
+            f"  UNION ALL "
+            f"  SELECT c.id, a.chemin || c.id::text || '/' "
+            f"  FROM arbre a JOIN {table} c ON c.parent_id = a.id"
+            f") UPDATE {table} SET chemin = arbre.chemin "
+            f"FROM arbre WHERE {table}.id = arbre.id"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0013_categorie_chemin'),
+    ]
+
+    operations = [
+        migrations.RunPython(calculer_chemins, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0014_backfill_chemins_categories'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bien',
+            name='responsable_actuel',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='patrimoine.bienresponsabilite'),
+        ),
+        migrations.AddField(
+            model_name='bien',
+            name='responsable_actuel_fonction',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='bien',
+            name='responsable_actuel_nom',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='historicalbien',
+            name='responsable_actuel',
+            field=models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='patrimoine.bienresponsabilite'),
+        ),
+        migrations.AddField(
+            model_name='historicalbien',
+            name='responsable_actuel_fonction',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='historicalbien',
+            name='responsable_actuel_nom',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated manually: responsable actuel des biens existants
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, Trim
+
+
+def renseigner_responsable_actuel(apps, schema_editor):
+    Bien = apps.get_model('patrimoine', 'Bien')
+    BienResponsabilite = apps.get_model('patrimoine', 'BienResponsabilite')
+    affectation_active = BienResponsabilite.objects.filter(
+        bien=OuterRef('pk'),
+        actif=True,
+        date_fin__isnull=True
+    ).order_by('-date_debut')
+    Bien.objects.update(
+        responsable_actuel=Subquery(affectation_active.values('pk')[:1]),
+        responsable_actuel_nom=Coalesce(
+            Subquery(
+                affectation_active.annotate(
+                    nom_complet=Trim(Concat(
+                        'responsable__user__first_name',
+                        Value(' '),
+                        'responsable__user__last_name'
+                    ))
+                ).values('nom_complet')[:1]
+            ),
+            Value('')
+        ),
+        responsable_actuel_fonction=Coalesce(
+            Subquery(affectation_active.values('responsable__fonction')[:1]),
+            Value('')
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0015_bien_responsable_actuel'),
+    ]
+
+    operations = [
+        migrations.RunPython(renseigner_responsable_actuel, migrations.RunPython.noop),
+    ]
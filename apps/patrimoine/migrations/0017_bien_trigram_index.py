@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:56
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0016_backfill_responsable_actuel'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bien',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('code_patrimoine'), name='gin_trgm_ops'), name='bien_code_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('numero_serie'), name='gin_trgm_ops'), name='bien_serie_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('code_barre'), name='gin_trgm_ops'), name='bien_code_barre_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('nom'), name='gin_trgm_ops'), name='bien_nom_trgm'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0017_bien_trigram_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CumulBiens',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('statut', models.CharField(max_length=20)),
+                ('etat_physique', models.CharField(max_length=20)),
+                ('mois', models.DateField(help_text="Premier jour du mois d'acquisition")),
+                ('nombre_biens', models.IntegerField(default=0)),
+                ('valeur_acquisition', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('valeur_actuelle', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('categorie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cumuls_biens', to='patrimoine.categorie')),
+                ('entite', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cumuls_biens', to='patrimoine.entite')),
+            ],
+            options={
+                'verbose_name': 'Cumul de biens',
+                'verbose_name_plural': 'Cumuls de biens',
+                'indexes': [models.Index(fields=['categorie'], name='patrimoine__categor_6573b7_idx'), models.Index(fields=['mois'], name='patrimoine__mois_d5dce0_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='cumulbiens',
+            constraint=models.UniqueConstraint(fields=('entite', 'categorie', 'statut', 'etat_physique', 'mois'), name='cumul_biens_unique'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated manually: cumuls des biens existants
+from django.db import migrations
+
+
+def calculer_cumuls(apps, schema_editor):
+    Bien = apps.get_model('patrimoine', 'Bien')
+    CumulBiens = apps.get_model('patrimoine', 'CumulBiens')
+    connection = schema_editor.connection
+    table = connection.ops.quote_name(CumulBiens._meta.db_table)
+    bien_table = connection.ops.quote_name(Bien._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (entite_id, categorie_id, statut, etat_physique, mois, "
+            f"nombre_biens, valeur_acquisition, valeur_actuelle) "
+            f"SELECT entite_id, categorie_id, statut, etat_physique, "
+            f"date_trunc('month', date_acquisition)::date, COUNT(*), "
+            f"SUM(valeur_acquisition), SUM(COALESCE(valeur_actuelle_cache, valeur_acquisition)) "
+            f"FROM {bien_table} WHERE NOT is_removed "
+            f"GROUP BY 1, 2, 3, 4, 5"
+        )
+
+
+def vider_cumuls(apps, schema_editor):
+    CumulBiens = apps.get_model('patrimoine', 'CumulBiens')
+    CumulBiens.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0018_cumulbiens'),
+    ]
+
+    operations = [
+        migrations.RunPython(calculer_cumuls, vider_cumuls),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patrimoine', '0019_backfill_cumulbiens'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['created', 'id'], name='patrimoine__created_0440af_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['modified', 'id'], name='patrimoine__modifie_091b47_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bien',
+            index=models.Index(fields=['date_acquisition', 'id'], name='patrimoine__date_ac_272083_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# apps/patrimoine/models/__init__.py
+from .base import (
+    BaseModel, AuditMixin, SearchableMixin,
+    Province, Departement, Commune, District,
+    Categorie, SousCategorie,
+    Entite, EntiteHierarchie,
+    SequenceCodePatrimoine,
+    Bien, CumulBiens,
+    HistoriqueValeur, ResponsableBien, BienResponsabilite,
+    ImportBiens,
+)
+from .profils import (
+    ProfilVehicule, ProfilImmeuble, ProfilInformatique, ProfilEquipementMedical,
+    ProfilMobilier, ProfilTerrain, ProfilConsommable,
+)
+
+__all__ = [
+    'BaseModel', 'AuditMixin', 'SearchableMixin',
+    'Province', 'Departement', 'Commune', 'District',
+    'Categorie', 'SousCategorie',
+    'Entite', 'EntiteHierarchie',
+    'SequenceCodePatrimoine',
+    'Bien', 'CumulBiens',
+    'HistoriqueValeur', 'ResponsableBien', 'BienResponsabilite',
+    'ImportBiens',
+    'ProfilVehicule', 'ProfilImmeuble', 'ProfilInformatique', 'ProfilEquipementMedical',
+    'ProfilMobilier', 'ProfilTerrain', 'ProfilConsommable',
+]
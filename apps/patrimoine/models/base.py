@@ -8,12 +8,14 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.contrib.postgres.fields import ArrayField, JSONField
-from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.core.exceptions import ValidationError
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
 from django.contrib.postgres.search import SearchVectorField
 from simple_history.models import HistoricalRecords
 from model_utils.models import TimeStampedModel, SoftDeletableModel
-from django.db.models import Q, F, Sum, Count
+from django.db.models import Q, F, Sum, Count, Value
+from django.db.models.functions import Concat, Substr, Upper
 from decimal import Decimal
 
 User = get_user_model()
@@ -205,6 +207,13 @@ class Categorie(BaseModel, AuditMixin, SearchableMixin):
     couleur = models.CharField(max_length=7, blank=True, help_text="Code couleur hexadécimal")
     ordre = models.PositiveSmallIntegerField(default=0)
     actif = models.BooleanField(default=True, db_index=True)
+    chemin = models.CharField(
+        max_length=500,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Chemin matérialisé des identifiants depuis la racine"
+    )
     
     class Meta:
         verbose_name = _("Catégorie")
@@ -218,13 +227,44 @@ class Categorie(BaseModel, AuditMixin, SearchableMixin):
     def __str__(self):
         return f"{self.nom} ({self.get_type_display()})"
     
+    def clean(self):
+        super().clean()
+        if self.parent_id and f"{self.pk}/" in self.parent.chemin:
+            raise ValidationError({
+                'parent': _("Le parent ne peut pas être une sous-catégorie de la catégorie.")
+            })
+    
+    def save(self, *args, **kwargs):
+        ancien_chemin = self.chemin
+        parent_chemin = self.parent.chemin if self.parent_id else ''
+        self.chemin = f"{parent_chemin}{self.pk}/"
+        super().save(*args, **kwargs)
+        
+        # Déplacement : réécriture des chemins du sous-arbre en une requête
+        if ancien_chemin and ancien_chemin != self.chemin:
+            Categorie.all_objects.filter(
+                chemin__startswith=ancien_chemin
+            ).exclude(pk=self.pk).update(
+                chemin=Concat(Value(self.chemin), Substr('chemin', len(ancien_chemin) + 1))
+            )
+    
     def get_descendants(self):
-        """Retourne tous les descendants de la catégorie."""
-        descendants = []
-        for child in self.enfants.filter(actif=True):
-            descendants.append(child)
-            descendants.extend(child.get_descendants())
-        return descendants
+        """Retourne tous les descendants actifs de la catégorie."""
+        if not self.chemin:
+            # Chemin non renseigné (bulk_create, import brut) : un préfixe vide
+            # couvrirait toutes les catégories, descente par les liens parent
+            descendants, niveau = [], [self.pk]
+            while niveau:
+                enfants = list(Categorie.objects.filter(parent_id__in=niveau, actif=True))
+                descendants.extend(enfants)
+                niveau = [enfant.pk for enfant in enfants]
+            return descendants
+        return list(
+            Categorie.objects.filter(
+                chemin__startswith=self.chemin,
+                actif=True
+            ).exclude(pk=self.pk)
+        )
 
 
 class SousCategorie(BaseModel, AuditMixin, SearchableMixin):
@@ -341,14 +381,31 @@ class Entite(BaseModel, AuditMixin, SearchableMixin):
     def __str__(self):
         return f"{self.code} - {self.nom}"
     
+    def clean(self):
+        super().clean()
+        # Un parent ne peut pas appartenir au sous-arbre de l'entité
+        if self.pk and self.parent_id and EntiteHierarchie.objects.filter(
+            ancetre_id=self.pk,
+            descendant_id=self.parent_id
+        ).exists():
+            raise ValidationError({
+                'parent': _("Le parent ne peut pas être une sous-entité de l'entité.")
+            })
+    
     def get_hierarchy(self):
-        """Retourne la hiérarchie complète de l'entité."""
-        hierarchy = []
-        current = self
-        while current:
-            hierarchy.insert(0, current)
-            current = current.parent
-        return hierarchy
+        """Retourne la hiérarchie complète de l'entité (racine en tête)."""
+        return list(
+            Entite.objects.filter(
+                descendants_liens__descendant=self
+            ).order_by('-descendants_liens__profondeur')
+        )
+    
+    def get_descendants(self, include_self=True):
+        """Retourne le queryset du sous-arbre, à toute profondeur."""
+        queryset = Entite.objects.filter(ancetres_liens__ancetre=self)
+        if not include_self:
+            queryset = queryset.filter(ancetres_liens__profondeur__gt=0)
+        return queryset
     
     @property
     def departement(self):
@@ -359,6 +416,65 @@ class Entite(BaseModel, AuditMixin, SearchableMixin):
         return self.commune.departement.province if self.commune else None
 
 
+class EntiteHierarchie(models.Model):
+    """
+    Table de fermeture de la hiérarchie des entités.
+    Une ligne par couple (ancêtre, descendant), y compris l'entité
+    elle-même à la profondeur 0. Maintenue par EntiteHierarchieService.
+    """
+    ancetre = models.ForeignKey(
+        Entite,
+        on_delete=models.CASCADE,
+        related_name='descendants_liens'
+    )
+    descendant = models.ForeignKey(
+        Entite,
+        on_delete=models.CASCADE,
+        related_name='ancetres_liens'
+    )
+    profondeur = models.PositiveSmallIntegerField()
+
+    class Meta:
+        verbose_name = _("Lien hiérarchique d'entité")
+        verbose_name_plural = _("Liens hiérarchiques d'entités")
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ancetre', 'descendant'],
+                name='entite_hierarchie_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['descendant', 'profondeur']),
+        ]
+
+    def __str__(self):
+        return f"{self.ancetre_id} > {self.descendant_id} ({self.profondeur})"
+
+
+class SequenceCodePatrimoine(models.Model):
+    """
+    Compteur des codes patrimoine par (préfixe, année, code catégorie).
+    Incrémenté sous verrou de ligne par CodePatrimoineAllocator.
+    """
+    prefixe = models.CharField(max_length=20)
+    annee = models.PositiveSmallIntegerField()
+    code_categorie = models.CharField(max_length=10)
+    dernier_numero = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = _("Séquence de codes patrimoine")
+        verbose_name_plural = _("Séquences de codes patrimoine")
+        constraints = [
+            models.UniqueConstraint(
+                fields=['prefixe', 'annee', 'code_categorie'],
+                name='sequence_code_patrimoine_unique'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.prefixe}-{self.annee}-{self.code_categorie}: {self.dernier_numero}"
+
+
 # Modèle Bien principal optimisé
 class Bien(BaseModel, AuditMixin, SearchableMixin):
     """Modèle principal pour tous les biens patrimoniaux."""
@@ -528,6 +644,18 @@ class Bien(BaseModel, AuditMixin, SearchableMixin):
     )
     dernier_inventaire = models.DateTimeField(null=True, blank=True)
     
+    # Responsable actuel dénormalisé (maintenu par BienService.affecter_responsable)
+    responsable_actuel = models.ForeignKey(
+        'BienResponsabilite',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+'
+    )
+    responsable_actuel_nom = models.CharField(max_length=200, blank=True, editable=False)
+    responsable_actuel_fonction = models.CharField(max_length=100, blank=True, editable=False)
+    
     class Meta:
         verbose_name = _("Bien")
         verbose_name_plural = _("Biens")
@@ -537,9 +665,18 @@ class Bien(BaseModel, AuditMixin, SearchableMixin):
             models.Index(fields=['categorie', 'sous_categorie']),
             models.Index(fields=['entite', 'statut']),
             models.Index(fields=['date_acquisition']),
+            # Pagination par curseur : ordre (champ, id) parcouru dans les deux sens
+            models.Index(fields=['created', 'id']),
+            models.Index(fields=['modified', 'id']),
+            models.Index(fields=['date_acquisition', 'id']),
             models.Index(fields=['code_qr']),
             models.Index(fields=['code_barre']),
             GinIndex(fields=['tags']),
+            # Recherche approchée et autocomplétion (pg_trgm, insensible à la casse)
+            GinIndex(OpClass(Upper('code_patrimoine'), name='gin_trgm_ops'), name='bien_code_trgm'),
+            GinIndex(OpClass(Upper('numero_serie'), name='gin_trgm_ops'), name='bien_serie_trgm'),
+            GinIndex(OpClass(Upper('code_barre'), name='gin_trgm_ops'), name='bien_code_barre_trgm'),
+            GinIndex(OpClass(Upper('nom'), name='gin_trgm_ops'), name='bien_nom_trgm'),
         ]
         permissions = [
             ("can_validate_bien", "Peut valider un bien"),
@@ -562,41 +699,34 @@ class Bien(BaseModel, AuditMixin, SearchableMixin):
         super().save(*args, **kwargs)
     
     def generate_code_patrimoine(self):
-        """Génère un code patrimoine unique."""
-        from django.utils import timezone
-        prefix = "OPRAG"
-        year = timezone.now().year
-        category_code = self.sous_categorie.code[:3].upper()
-        
-        # Trouver le prochain numéro
-        last_code = Bien.objects.filter(
-            code_patrimoine__startswith=f"{prefix}-{year}-{category_code}"
-        ).order_by('-code_patrimoine').first()
-        
-        if last_code:
-            last_number = int(last_code.code_patrimoine.split('-')[-1])
-            next_number = last_number + 1
-        else:
-            next_number = 1
-        
-        return f"{prefix}-{year}-{category_code}-{next_number:05d}"
+        """Génère un code patrimoine unique via la séquence dédiée."""
+        from apps.patrimoine.services.code_service import CodePatrimoineAllocator
+        return CodePatrimoineAllocator.allouer_codes(
+            self.sous_categorie,
+            prefixe="OPRAG",
+            longueur_code=3
+        )[0]
     
     def update_valeur_actuelle(self):
-        """Calcule et met à jour la valeur actuelle du bien."""
+        """
+        Calcule et met à jour la valeur actuelle du bien.
+        Utilise le même noyau que la réévaluation en masse pour que les
+        valeurs calculées à l'enregistrement et la nuit soient identiques.
+        """
         if self.duree_amortissement and self.date_acquisition:
-            from dateutil.relativedelta import relativedelta
+            from django.conf import settings
             from django.utils import timezone
-            
-            mois_ecoules = (timezone.now().date() - self.date_acquisition).days / 30
-            if mois_ecoules < self.duree_amortissement:
-                taux_amortissement = mois_ecoules / self.duree_amortissement
-                amortissement = float(self.valeur_acquisition) * taux_amortissement
-                self.valeur_actuelle_cache = Decimal(
-                    max(float(self.valeur_acquisition) - amortissement, 
-                        float(self.valeur_residuelle or 0))
-                )
-            else:
-                self.valeur_actuelle_cache = self.valeur_residuelle or 0
+            from apps.patrimoine.services.reevaluation_service import calculer_valeurs_nettes
+
+            jours_ecoules = (timezone.now().date() - self.date_acquisition).days
+            valeur_nette = calculer_valeurs_nettes(
+                [self.valeur_acquisition],
+                [jours_ecoules],
+                [self.duree_amortissement],
+                [self.valeur_residuelle or 0],
+                settings.OPRAG_CONFIG.get('DEPRECIATION_METHOD', 'LINEAR')
+            )[0]
+            self.valeur_actuelle_cache = Decimal(f"{valeur_nette:.2f}")
         else:
             self.valeur_actuelle_cache = self.valeur_acquisition
     
@@ -620,14 +750,6 @@ class Bien(BaseModel, AuditMixin, SearchableMixin):
             return min(self.age_en_mois / self.duree_amortissement * 100, 100)
         return 0
     
-    @property
-    def responsable_actuel(self):
-        """Retourne le responsable actuel du bien."""
-        return self.responsabilites.filter(
-            date_fin__isnull=True,
-            actif=True
-        ).select_related('responsable').first()
-    
     def get_historique_valeurs(self):
         """Retourne l'historique des valeurs du bien."""
         return self.historique_valeurs.all().order_by('-date')
@@ -658,6 +780,48 @@ class Bien(BaseModel, AuditMixin, SearchableMixin):
         return timeline
 
 
+# Cumuls pré-agrégés pour les statistiques
+class CumulBiens(models.Model):
+    """
+    Totaux des biens non supprimés par (entité, catégorie, statut, état,
+    mois d'acquisition). Tenu à jour par deltas (CumulsBiensService) à
+    chaque écriture de Bien ; reconstructible par commande.
+    """
+    entite = models.ForeignKey(
+        Entite,
+        on_delete=models.CASCADE,
+        related_name='cumuls_biens'
+    )
+    categorie = models.ForeignKey(
+        Categorie,
+        on_delete=models.CASCADE,
+        related_name='cumuls_biens'
+    )
+    statut = models.CharField(max_length=20)
+    etat_physique = models.CharField(max_length=20)
+    mois = models.DateField(help_text="Premier jour du mois d'acquisition")
+    nombre_biens = models.IntegerField(default=0)
+    valeur_acquisition = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    valeur_actuelle = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = _("Cumul de biens")
+        verbose_name_plural = _("Cumuls de biens")
+        constraints = [
+            models.UniqueConstraint(
+                fields=['entite', 'categorie', 'statut', 'etat_physique', 'mois'],
+                name='cumul_biens_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['categorie']),
+            models.Index(fields=['mois']),
+        ]
+
+    def __str__(self):
+        return f"{self.entite_id}/{self.categorie_id}/{self.statut}/{self.mois:%Y-%m}: {self.nombre_biens}"
+
+
 # Modèles d'historique et de suivi
 class HistoriqueValeur(BaseModel, AuditMixin):
     """Historique des valeurs d'un bien."""
@@ -795,3 +959,65 @@ class BienResponsabilite(BaseModel, AuditMixin):
                 actif=False
             )
         super().save(*args, **kwargs)
+
+
+# Imports en masse asynchrones
+class ImportBiens(BaseModel):
+    """Job d'import de biens traité par lots en tâche de fond, avec reprise."""
+
+    class Statut(models.TextChoices):
+        EN_ATTENTE = 'EN_ATTENTE', _('En attente')
+        EN_COURS = 'EN_COURS', _('En cours')
+        TERMINE = 'TERMINE', _('Terminé')
+        ECHEC = 'ECHEC', _('Échec')
+
+    # Nombre maximal d'erreurs détaillées conservées
+    MAX_ERREURS_DETAILLEES = 5000
+
+    fichier = models.FileField(upload_to='imports/%Y/%m/')
+    mode = models.CharField(max_length=10, default='create')
+    chunk_size = models.PositiveIntegerField(default=1000)
+    statut = models.CharField(
+        max_length=20,
+        choices=Statut.choices,
+        default=Statut.EN_ATTENTE,
+        db_index=True
+    )
+
+    # Progression, enregistrée après chaque lot validé
+    lignes_total = models.PositiveIntegerField(default=0)
+    lignes_traitees = models.PositiveIntegerField(
+        default=0,
+        help_text="Lignes du fichier déjà traitées (point de reprise)"
+    )
+    lignes_importees = models.PositiveIntegerField(default=0)
+    lignes_en_erreur = models.PositiveIntegerField(default=0)
+    erreurs = models.JSONField(default=list, blank=True)
+    message = models.TextField(blank=True)
+
+    date_debut = models.DateTimeField(null=True, blank=True)
+    date_fin = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='imports_biens'
+    )
+
+    class Meta:
+        verbose_name = _("Import de biens")
+        verbose_name_plural = _("Imports de biens")
+        ordering = ['-created']
+        indexes = [
+            models.Index(fields=['statut', 'modified']),
+        ]
+
+    def __str__(self):
+        return f"Import {self.fichier.name} ({self.get_statut_display()})"
+
+    @property
+    def progression(self):
+        """Pourcentage de lignes traitées."""
+        if not self.lignes_total:
+            return 0
+        return round(self.lignes_traitees / self.lignes_total * 100, 1)
@@ -1,156 +1,13 @@
+# apps/patrimoine/models/profils.py
+"""
+Profils techniques des biens : une fiche par famille (véhicule, immeuble,
+informatique, équipement médical, mobilier, terrain, consommable).
+"""
 from django.db import models
-from django.utils import timezone
 
-# ----------- LOCALISATION -----------
-class Province(models.Model):
-    nom = models.CharField(max_length=100)
-    
-    def __str__(self):
-        return self.nom
-
-class Departement(models.Model):
-    nom = models.CharField(max_length=100)
-    province = models.ForeignKey(Province, on_delete=models.CASCADE)
-
-    def __str__(self):
-        return f"{self.nom} ({self.province.nom})"
-
-class Commune(models.Model):
-    nom = models.CharField(max_length=100)
-    departement = models.ForeignKey(Departement, on_delete=models.CASCADE)
-    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
-    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
-
-    def __str__(self):
-        return self.nom
-
-class District(models.Model):
-    nom = models.CharField(max_length=100)
-    commune = models.ForeignKey(Commune, on_delete=models.CASCADE)
-
-    def __str__(self):
-        return f"{self.nom} ({self.commune.nom})"
-
-# ----------- CATEGORISATION -----------
-class Categorie(models.Model):
-    TYPE_CHOICES = [
-        ('immobilier', 'Bien Immobilier'),
-        ('mobilier', 'Bien Mobilier'),
-    ]
-    nom = models.CharField(max_length=100)
-    type = models.CharField(max_length=20, choices=TYPE_CHOICES, null=True, blank=True)
-
-    def __str__(self):
-        return f"{self.nom} ({self.get_type_display()})"
-
-class SousCategorie(models.Model):
-    categorie = models.ForeignKey(Categorie, on_delete=models.CASCADE, related_name='sous_categories')
-    nom = models.CharField(max_length=100)
-    code = models.SlugField(
-        max_length=50,
-        unique=True,
-        null=True,
-        blank=True,
-        help_text="Code système unique (ex: 'ambulance', 'serveur')"
-    )
-
-    def __str__(self):
-        return f"{self.nom} – {self.categorie.nom}"
-
-# ----------- ENTITÉ -----------
-class Entite(models.Model):
-    nom = models.CharField(max_length=100)
-    responsable = models.CharField(max_length=100)
-    commune = models.ForeignKey(Commune, on_delete=models.SET_NULL, null=True, blank=True)
-
-    def __str__(self):
-        return self.nom
-
-    @property
-    def departement(self):
-        return self.commune.departement if self.commune else None
-
-    @property
-    def province(self):
-        return self.commune.departement.province if self.commune else None
+from .base import Bien
 
-# ----------- BIEN -----------
-class Bien(models.Model):
-    nom = models.CharField(max_length=100)
-    categorie = models.ForeignKey(Categorie, on_delete=models.PROTECT)
-    sous_categorie = models.ForeignKey(SousCategorie, on_delete=models.PROTECT, null=True, blank=True)
-    entite = models.ForeignKey(Entite, on_delete=models.CASCADE)
-    commune = models.ForeignKey(Commune, on_delete=models.SET_NULL, null=True, blank=True)
-    valeur_initiale = models.DecimalField(max_digits=12, decimal_places=2)
-    date_acquisition = models.DateField()
-    description = models.TextField(blank=True)
-    numero_serie = models.CharField(max_length=100, blank=True, null=True)
-    duree_amortissement = models.IntegerField(blank=True, null=True)
-    superficie = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
-    annee_construction = models.PositiveIntegerField(null=True, blank=True)
-    statut_juridique = models.CharField(max_length=100, blank=True)
-    justificatif = models.FileField(upload_to='justificatifs/', null=True, blank=True)
 
-    def __str__(self):
-        return self.nom
-
-    @property
-    def responsable_actuel(self):
-        return self.responsabilites.filter(type_affectation='permanent').first()
-
-# ----------- RESPONSABLES -----------
-class ResponsableBien(models.Model):
-    nom = models.CharField(max_length=100)
-    prenom = models.CharField(max_length=100)
-    matricule = models.CharField(max_length=50, unique=True)
-    fonction = models.CharField(max_length=100)
-    categorie = models.CharField(max_length=50)
-    corps = models.CharField(max_length=100)
-    telephone = models.CharField(max_length=20, blank=True)
-    email = models.EmailField(blank=True)
-
-    def __str__(self):
-        return f"{self.prenom} {self.nom} – {self.fonction}"
-
-class BienResponsabilite(models.Model):
-    AFFECTATION_CHOICES = [
-        ('permanent', 'Permanent'),
-        ('temporaire', 'Temporaire'),
-    ]
-
-    bien = models.ForeignKey(Bien, on_delete=models.CASCADE, related_name='responsabilites')
-    responsable = models.ForeignKey(ResponsableBien, on_delete=models.CASCADE)
-    date_affectation = models.DateField()
-    type_affectation = models.CharField(max_length=20, choices=AFFECTATION_CHOICES)
-    motif = models.TextField(blank=True)
-
-    # Champs spécifiques selon le type de bien
-    numero_permis = models.CharField(max_length=50, blank=True, null=True)
-    date_permis = models.DateField(blank=True, null=True)
-    categorie_permis = models.CharField(max_length=10, blank=True, null=True)
-    composition_foyer = models.TextField(blank=True, null=True)
-    conditions_occupation = models.TextField(blank=True, null=True)
-    certifications = models.TextField(blank=True, null=True)
-    formations = models.TextField(blank=True, null=True)
-
-    class Meta:
-        ordering = ['-date_affectation']
-        verbose_name = "Responsabilité d'un bien"
-        verbose_name_plural = "Responsabilités des biens"
-
-    def __str__(self):
-        return f"{self.responsable} – {self.bien} ({self.date_affectation})"
-
-# ----------- HISTORIQUE -----------
-class HistoriqueValeur(models.Model):
-    bien = models.ForeignKey(Bien, on_delete=models.CASCADE, related_name='historiques')
-    date = models.DateField()
-    valeur = models.DecimalField(max_digits=12, decimal_places=2)
-
-    def __str__(self):
-        return f"{self.bien.nom} - {self.valeur} au {self.date}"
-
-# Profils techniques pour chaque type de Bien
 class ProfilVehicule(models.Model):
     bien = models.OneToOneField(Bien, on_delete=models.CASCADE, related_name='profil_vehicule')
     marque = models.CharField(max_length=100)
@@ -165,6 +22,7 @@ class ProfilVehicule(models.Model):
     def __str__(self):
         return f"{self.marque} {self.modele} ({self.matricule})"
 
+
 class ProfilImmeuble(models.Model):
     bien = models.OneToOneField(Bien, on_delete=models.CASCADE, related_name='profil_immeuble')
     surface = models.DecimalField(max_digits=8, decimal_places=2)
@@ -175,6 +33,7 @@ class ProfilImmeuble(models.Model):
     def __str__(self):
         return f"Immeuble {self.bien.nom} - {self.surface} m²"
 
+
 class ProfilInformatique(models.Model):
     STATUT_CHOICES = [
         ('en_service', 'En service'),
@@ -223,6 +82,7 @@ class ProfilInformatique(models.Model):
     def __str__(self):
         return f"{self.get_type_equipement_display()} - {self.marque} {self.modele}"
 
+
 class ProfilEquipementMedical(models.Model):
     CLASSE_RISQUE_CHOICES = [
         ('i', 'Classe I - Risque faible'),
@@ -277,7 +137,8 @@ class ProfilEquipementMedical(models.Model):
     contact_sav = models.CharField(max_length=100, blank=True)
 
     def __str__(self):
-        return f"{self.get_type_equipement_display()} - {self.marque} {self.modele}" 
+        return f"{self.get_type_equipement_display()} - {self.marque} {self.modele}"
+
 
 class ProfilMobilier(models.Model):
     bien = models.OneToOneField(Bien, on_delete=models.CASCADE, related_name='profil_mobilier')
@@ -289,6 +150,7 @@ class ProfilMobilier(models.Model):
     def __str__(self):
         return f"Mobilier {self.bien.nom} - {self.materiau} ({self.couleur})"
 
+
 class ProfilTerrain(models.Model):
     bien = models.OneToOneField(Bien, on_delete=models.CASCADE, related_name='profil_terrain')
     superficie = models.DecimalField(max_digits=12, decimal_places=2)
@@ -298,6 +160,7 @@ class ProfilTerrain(models.Model):
     def __str__(self):
         return f"Terrain {self.bien.nom} - {self.superficie} m²"
 
+
 class ProfilConsommable(models.Model):
     bien = models.OneToOneField(Bien, on_delete=models.CASCADE, related_name='profil_consommable')
     quantite_initiale = models.PositiveIntegerField()
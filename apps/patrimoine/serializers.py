@@ -1,8 +1,123 @@
 # serializers.py
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
 from rest_framework import serializers
 from .models import Bien, Categorie, SousCategorie, Entite, HistoriqueValeur
 
-class CategorieSerializer(serializers.ModelSerializer):
+
+def _liste_parametre(request, nom):
+    """Valeurs d'un paramètre "a,b,c" ; None si le paramètre est absent."""
+    if request is None or nom not in request.query_params:
+        return None
+    return [
+        valeur.strip()
+        for valeur in request.query_params.get(nom, '').split(',')
+        if valeur.strip()
+    ]
+
+
+class ChampsDynamiquesMixin:
+    """
+    Champs à la demande pour un ModelSerializer : ?fields=a,b restreint
+    les champs rendus, ?expand=rel imbrique les relations déclarées dans
+    Meta.expandable_fields (sinon rendues par leur clé primaire, ou
+    omises pour les relations multiples).
+    Meta.expand_par_defaut liste les relations imbriquées sans ?expand=.
+    """
+
+    def __init__(self, *args, **kwargs):
+        champs = kwargs.pop('fields', None)
+        expand = kwargs.pop('expand', None)
+        super().__init__(*args, **kwargs)
+
+        # Seul le sérialiseur racine lit la requête : les imbriqués n'ont pas de contexte
+        request = self.context.get('request')
+        if champs is None:
+            champs = _liste_parametre(request, 'fields')
+        if expand is None:
+            expand = _liste_parametre(request, 'expand')
+        # Les imbrications par défaut ne réintroduisent pas de champ écarté par ?fields=
+        expand_demande = set(expand or ())
+        if expand is None:
+            expand = getattr(self.Meta, 'expand_par_defaut', ())
+
+        extensibles = getattr(self.Meta, 'expandable_fields', {})
+        for nom, (serializer_class, options) in extensibles.items():
+            if nom in expand:
+                self.fields[nom] = serializer_class(read_only=True, **options)
+            elif options.get('many'):
+                self.fields.pop(nom, None)
+
+        if champs:
+            conserves = set(champs) | (expand_demande & set(extensibles))
+            for nom in list(self.fields):
+                if nom not in conserves:
+                    self.fields.pop(nom)
+
+    @classmethod
+    def optimiser_queryset(cls, queryset, request=None):
+        """
+        Applique select_related / prefetch_related / only() d'après les
+        champs effectivement rendus pour cette requête.
+        """
+        serializer = cls(context={'request': request})
+        model = queryset.model
+        colonnes = {model._meta.pk.name}
+        jointures, prechargements = [], []
+        projection_sure = True
+
+        for champ in serializer.fields.values():
+            imbrique = getattr(champ, 'child', champ)
+            try:
+                field = model._meta.get_field(champ.source)
+            except FieldDoesNotExist:
+                # Propriété ou méthode : colonnes nécessaires inconnues
+                projection_sure = False
+                continue
+
+            if not field.is_relation:
+                colonnes.add(field.name)
+            elif field.many_to_one or (field.one_to_one and field.concrete):
+                colonnes.add(field.name)
+                if isinstance(imbrique, serializers.BaseSerializer):
+                    jointures.append(field.name)
+                    sous_colonnes = cls._colonnes(imbrique, field.related_model)
+                    if sous_colonnes:
+                        colonnes.update(f'{field.name}__{c}' for c in sous_colonnes)
+            else:
+                related = field.related_model.objects.all()
+                sous_colonnes = (
+                    cls._colonnes(imbrique, field.related_model)
+                    if isinstance(imbrique, serializers.BaseSerializer) else None
+                )
+                if sous_colonnes and field.one_to_many:
+                    related = related.only(*sous_colonnes, field.field.name)
+                prechargements.append(Prefetch(field.name, queryset=related))
+
+        if jointures:
+            queryset = queryset.select_related(*jointures)
+        if prechargements:
+            queryset = queryset.prefetch_related(*prechargements)
+        if projection_sure:
+            queryset = queryset.only(*colonnes)
+        return queryset
+
+    @staticmethod
+    def _colonnes(serializer, model):
+        """Colonnes lues par un sérialiseur imbriqué, ou None si indéterminables."""
+        colonnes = {model._meta.pk.name}
+        for champ in serializer.fields.values():
+            try:
+                field = model._meta.get_field(champ.source)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.many_to_many:
+                return None
+            colonnes.add(field.name)
+        return colonnes
+
+
+class CategorieSerializer(ChampsDynamiquesMixin, serializers.ModelSerializer):
     class Meta:
         model = Categorie
         fields = ['id', 'nom', 'type']
@@ -12,7 +127,7 @@ class SousCategorieSerializer(serializers.ModelSerializer):
         model = SousCategorie
         fields = ['id', 'nom', 'code', 'categorie']
 
-class EntiteSerializer(serializers.ModelSerializer):
+class EntiteSerializer(ChampsDynamiquesMixin, serializers.ModelSerializer):
     class Meta:
         model = Entite
         fields = ['id', 'nom', 'responsable', 'commune']
@@ -20,18 +135,21 @@ class EntiteSerializer(serializers.ModelSerializer):
 class HistoriqueValeurSerializer(serializers.ModelSerializer):
     class Meta:
         model = HistoriqueValeur
-        fields = ['id', 'date', 'valeur']
-
-class BienSerializer(serializers.ModelSerializer):
-    categorie = CategorieSerializer(read_only=True)
-    sous_categorie = SousCategorieSerializer(read_only=True)
-    entite = EntiteSerializer(read_only=True)
-    historiques = HistoriqueValeurSerializer(many=True, read_only=True)
-    
+        fields = ['id', 'date', 'valeur', 'type_evaluation']
+
+class BienSerializer(ChampsDynamiquesMixin, serializers.ModelSerializer):
     class Meta:
         model = Bien
         fields = [
             'id', 'nom', 'categorie', 'sous_categorie', 'entite',
-            'valeur_initiale', 'date_acquisition', 'commune', 
-            'historiques'
+            'valeur_acquisition', 'date_acquisition', 'commune',
+            'historique_valeurs'
         ]
+        expandable_fields = {
+            'categorie': (CategorieSerializer, {}),
+            'sous_categorie': (SousCategorieSerializer, {}),
+            'entite': (EntiteSerializer, {}),
+            'historique_valeurs': (HistoriqueValeurSerializer, {'many': True}),
+        }
+        # Imbrications conservées par défaut ; l'historique seulement sur ?expand=
+        expand_par_defaut = ('categorie', 'sous_categorie', 'entite')
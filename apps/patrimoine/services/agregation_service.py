@@ -0,0 +1,190 @@
+# apps/patrimoine/services/agregation_service.py
+"""
+Moteur d'agrégation en un passage pour les tableaux de bord des biens.
+Les indicateurs scalaires sont calculés par agrégation conditionnelle
+(FILTER (WHERE ...)) et les répartitions par GROUP BY GROUPING SETS :
+deux requêtes sur un queryset sans annotations ni préchargements.
+"""
+from datetime import timedelta
+from typing import Any, Dict, List, Sequence, Tuple
+from django.db import connections
+from django.db.models import Case, Exists, F, OuterRef, Q, When
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+import logging
+
+from apps.patrimoine.models import BienResponsabilite
+
+logger = logging.getLogger(__name__)
+
+
+def regrouper_par_ensembles(
+    queryset,
+    champs: Dict[str, Any],
+    ensembles: Sequence[Tuple[str, ...]],
+    mesures: Dict[str, str],
+    total: bool = True
+) -> List[Dict]:
+    """
+    Exécute un GROUP BY GROUPING SETS sur la projection `champs` du queryset.
+
+    `champs` associe un alias (distinct des noms de champs du modèle) à
+    une expression ; `ensembles` liste les regroupements par alias ;
+    `mesures` associe un nom à un agrégat SQL sur ces alias. Chaque ligne
+    retournée porte la clé 'ensemble' (le tuple regroupé, () pour le
+    total), les valeurs des alias regroupés et les mesures. Un queryset
+    vide (.none()) ne produit aucune ligne.
+    """
+    if queryset.query.is_empty():
+        # Pas de SQL à compiler (EmptyResultSet)
+        return []
+
+    projection = queryset.order_by().annotate(**champs).values(*champs)
+    sous_requete, params = projection.query.sql_with_params()
+
+    colonnes = list(dict.fromkeys(alias for ensemble in ensembles for alias in ensemble))
+    select = colonnes + [f"{sql} AS {nom}" for nom, sql in mesures.items()]
+    select += [f"GROUPING({colonne})" for colonne in colonnes]
+    groupements = [f"({', '.join(ensemble)})" for ensemble in ensembles]
+    if total:
+        groupements.append("()")
+
+    sql = (
+        f"SELECT {', '.join(select)} "
+        f"FROM ({sous_requete}) AS base "
+        f"GROUP BY GROUPING SETS ({', '.join(groupements)})"
+    )
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        lignes = cursor.fetchall()
+
+    par_colonnes = {frozenset(ensemble): tuple(ensemble) for ensemble in ensembles}
+    par_colonnes[frozenset()] = ()
+    noms_mesures = list(mesures)
+
+    resultats = []
+    for ligne in lignes:
+        valeurs = dict(zip(colonnes, ligne))
+        indicateurs = ligne[len(colonnes) + len(noms_mesures):]
+        # GROUPING(col) vaut 0 lorsque la colonne fait partie de l'ensemble
+        regroupees = frozenset(c for c, g in zip(colonnes, indicateurs) if g == 0)
+        ensemble = par_colonnes[regroupees]
+        resultat = {'ensemble': ensemble}
+        resultat.update({alias: valeurs[alias] for alias in ensemble})
+        resultat.update(zip(noms_mesures, ligne[len(colonnes):len(colonnes) + len(noms_mesures)]))
+        resultats.append(resultat)
+
+    return resultats
+
+
+class StatistiquesBiensService:
+    """
+    Statistiques de BienViewSet.statistiques en deux requêtes : un GROUPING
+    SETS portant les répartitions et, sur l'ensemble total, les indicateurs ;
+    puis le top 10 par valeur, lu par un LIMIT sur index.
+    """
+
+    ETATS_A_REFORMER = ['MAUVAIS', 'HORS_USAGE']
+    NOMBRE_ENTITES = 10
+    INDICATEURS = ('a_reformer', 'sans_responsable', 'garantie_expiree', 'maintenance_en_retard')
+
+    @classmethod
+    def calculer(cls, queryset) -> Dict:
+        aujourd_hui = timezone.now().date()
+        queryset = queryset.order_by()
+
+        def indicateur(condition):
+            return Case(When(condition, then=1), default=0)
+
+        # Les acquisitions hors des 12 derniers mois tombent dans un groupe NULL ignoré
+        recent = Q(date_acquisition__gte=aujourd_hui - timedelta(days=365))
+        lignes = regrouper_par_ensembles(
+            queryset,
+            champs={
+                's_statut': F('statut'),
+                's_categorie_nom': F('categorie__nom'),
+                's_categorie_type': F('categorie__type'),
+                's_entite_nom': F('entite__nom'),
+                's_entite_code': F('entite__code'),
+                's_annee': Case(When(recent, then=ExtractYear('date_acquisition'))),
+                's_mois': Case(When(recent, then=ExtractMonth('date_acquisition'))),
+                's_valeur': F('valeur_acquisition'),
+                's_valeur_actuelle': F('valeur_actuelle_cache'),
+                's_a_reformer': indicateur(Q(etat_physique__in=cls.ETATS_A_REFORMER)),
+                's_sans_responsable': indicateur(~Exists(
+                    BienResponsabilite.objects.filter(bien=OuterRef('pk'))
+                )),
+                's_garantie_expiree': indicateur(Q(date_fin_garantie__lt=aujourd_hui)),
+                's_maintenance_en_retard': indicateur(Q(prochaine_maintenance__lt=aujourd_hui)),
+            },
+            ensembles=[
+                ('s_statut',),
+                ('s_categorie_nom', 's_categorie_type'),
+                ('s_entite_nom', 's_entite_code'),
+                ('s_annee', 's_mois'),
+            ],
+            mesures={
+                'count': 'COUNT(*)',
+                'valeur': 'SUM(s_valeur)',
+                'valeur_actuelle': 'SUM(s_valeur_actuelle)',
+                **{nom: f'SUM(s_{nom})' for nom in cls.INDICATEURS},
+            }
+        )
+
+        # Queryset vide : aucune ligne, pas même l'ensemble total
+        scalaires = {'count': 0, 'valeur': 0, 'valeur_actuelle': 0, **dict.fromkeys(cls.INDICATEURS, 0)}
+        repartitions = {
+            'repartition_statut': [],
+            'repartition_categorie': [],
+            'repartition_entite': [],
+            'acquisitions_par_mois': [],
+        }
+        for ligne in lignes:
+            mesures = {'count': ligne['count'], 'valeur': ligne['valeur']}
+            ensemble = ligne['ensemble']
+            if not ensemble:
+                scalaires.update({cle: valeur or 0 for cle, valeur in ligne.items() if cle != 'ensemble'})
+            elif ensemble == ('s_statut',):
+                repartitions['repartition_statut'].append(
+                    {'statut': ligne['s_statut'], **mesures}
+                )
+            elif ensemble[0] == 's_categorie_nom':
+                repartitions['repartition_categorie'].append({
+                    'categorie__nom': ligne['s_categorie_nom'],
+                    'categorie__type': ligne['s_categorie_type'],
+                    **mesures
+                })
+            elif ensemble[0] == 's_entite_nom':
+                repartitions['repartition_entite'].append({
+                    'entite__nom': ligne['s_entite_nom'],
+                    'entite__code': ligne['s_entite_code'],
+                    **mesures
+                })
+            elif ligne['s_annee'] is not None:
+                repartitions['acquisitions_par_mois'].append({
+                    'mois': ligne['s_mois'],
+                    'annee': ligne['s_annee'],
+                    **mesures
+                })
+
+        repartitions['repartition_statut'].sort(key=lambda r: -r['count'])
+        repartitions['repartition_categorie'].sort(key=lambda r: r['valeur'] or 0, reverse=True)
+        repartitions['repartition_entite'].sort(key=lambda r: r['valeur'] or 0, reverse=True)
+        del repartitions['repartition_entite'][cls.NOMBRE_ENTITES:]
+        repartitions['acquisitions_par_mois'].sort(key=lambda r: (r['annee'], r['mois']))
+
+        # Lecture bornée par LIMIT, plus rapide qu'un tri intégral dans un agrégat
+        top_10 = list(
+            queryset.order_by('-valeur_acquisition')[:10].values(
+                'code_patrimoine', 'nom', 'valeur_acquisition', 'categorie__nom'
+            )
+        )
+
+        return {
+            'total_biens': scalaires['count'],
+            'valeur_totale': scalaires['valeur'],
+            'valeur_actuelle_totale': scalaires['valeur_actuelle'],
+            **repartitions,
+            'top_10_valeur': top_10,
+            'biens_critiques': {nom: scalaires[nom] for nom in cls.INDICATEURS}
+        }
@@ -13,6 +13,7 @@ from django.utils import timezone
 from django.conf import settings
 import logging
 
+from apps.core.utils import CacheManager
 from apps.patrimoine.models import (
     Bien, HistoriqueValeur, BienResponsabilite,
     ResponsableBien, Entite, SousCategorie,
@@ -22,6 +23,9 @@ from apps.notifications.services import NotificationService
 from apps.audit.services import AuditService
 from .validators import BienValidator
 from .calculators import AmortissementCalculator, ValeurCalculator
+from .code_service import CodePatrimoineAllocator
+from .hierarchie_service import EntiteHierarchieService
+from .responsable_service import ResponsableActuelService
 
 logger = logging.getLogger(__name__)
 
@@ -233,6 +237,7 @@ class BienService:
             actif=True,
             created_by=user
         )
+        self._synchroniser_responsable_actuel(bien, nouvelle_affectation)
         
         # Notifications
         self.notification_service.notifier_affectation_responsable(
@@ -291,6 +296,7 @@ class BienService:
             date_fin=date_reforme,
             actif=False
         )
+        self._synchroniser_responsable_actuel(bien)
         
         # Audit et notifications
         self.audit_service.log_reforme_bien(bien, user, motif)
@@ -417,8 +423,8 @@ class BienService:
         responsable = bien.responsable_actuel
         if responsable:
             rapport['responsable'] = {
-                'nom': responsable.responsable.user.get_full_name(),
-                'fonction': responsable.responsable.fonction,
+                'nom': bien.responsable_actuel_nom,
+                'fonction': bien.responsable_actuel_fonction,
                 'depuis': responsable.date_debut.isoformat(),
                 'type': responsable.get_type_affectation_display()
             }
@@ -512,25 +518,32 @@ class BienService:
     
     def _generer_code_patrimoine(self, sous_categorie: SousCategorie) -> str:
         """Génère un code patrimoine unique."""
-        prefix = settings.OPRAG_CONFIG.get('ASSET_CODE_PREFIX', 'OPRAG')
-        year = timezone.now().year
-        category_code = sous_categorie.code[:4].upper()
-        
-        # Dernier numéro utilisé
-        last_bien = Bien.objects.filter(
-            code_patrimoine__startswith=f"{prefix}-{year}-{category_code}"
-        ).order_by('-code_patrimoine').first()
-        
-        if last_bien:
-            try:
-                last_number = int(last_bien.code_patrimoine.split('-')[-1])
-                next_number = last_number + 1
-            except (ValueError, IndexError):
-                next_number = 1
-        else:
-            next_number = 1
-        
-        return f"{prefix}-{year}-{category_code}-{next_number:05d}"
+        return self.reserver_codes_patrimoine(sous_categorie, 1)[0]
+
+    def reserver_codes_patrimoine(
+        self,
+        sous_categorie: SousCategorie,
+        quantite: int
+    ) -> List[str]:
+        """
+        Réserve un bloc de codes patrimoine en un seul aller-retour.
+        Destiné aux imports et campagnes d'inventaire.
+        """
+        return CodePatrimoineAllocator.allouer_codes(
+            sous_categorie,
+            quantite=quantite,
+            prefixe=settings.OPRAG_CONFIG.get('ASSET_CODE_PREFIX', 'OPRAG'),
+            longueur_code=4
+        )
+    
+    def _synchroniser_responsable_actuel(self, bien: Bien, affectation: Optional[BienResponsabilite] = None):
+        """Met à jour le responsable actuel dénormalisé (voir ResponsableActuelService)."""
+        ResponsableActuelService.synchroniser(bien, affectation)
+    
+    @staticmethod
+    def synchroniser_responsables_actuels(queryset=None) -> int:
+        """Recalcule en une requête le responsable actuel de tous les biens."""
+        return ResponsableActuelService.synchroniser_tous(queryset)
     
     def _creer_profil_technique(self, bien: Bien, profil_data: Dict):
         """Crée le profil technique selon le type de bien."""
@@ -555,6 +568,7 @@ class BienService:
     
     def _executer_transfert(self, bien: Bien, nouvelle_entite: Entite, user):
         """Exécute le transfert effectif d'un bien."""
+        ancienne_entite = bien.entite
         bien.entite = nouvelle_entite
         bien.modified_by = user
         bien.save()
@@ -562,11 +576,12 @@ class BienService:
         # Clôturer les responsabilités de l'ancienne entité
         bien.responsabilites.filter(
             actif=True,
-            responsable__entite_principale=bien.entite
+            responsable__entite_principale=ancienne_entite
         ).update(
             date_fin=timezone.now().date(),
             actif=False
         )
+        self._synchroniser_responsable_actuel(bien)
 
 
 # apps/patrimoine/services/inventaire_service.py
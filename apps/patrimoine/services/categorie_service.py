@@ -0,0 +1,141 @@
+# apps/patrimoine/services/categorie_service.py
+"""
+Arbre des catégories servi depuis la mémoire du processus.
+Chaque processus garde un instantané de l'arbre, reconstruit seulement
+lorsque la version partagée dans le cache change ; les signaux sur
+Categorie et SousCategorie incrémentent cette version.
+"""
+import threading
+import uuid
+from typing import Dict, List, Optional
+from django.core.cache import cache
+from django.db import connection, transaction
+import logging
+
+from apps.core.utils import CacheManager
+from apps.patrimoine.models import Categorie, SousCategorie
+
+logger = logging.getLogger(__name__)
+
+
+class CategorieArbreService:
+    """Instantané en mémoire de l'arbre des catégories."""
+
+    CACHE_KEY_VERSION = 'patrimoine:categories:version'
+
+    _instantane: Optional[Dict] = None
+    _verrou = threading.Lock()
+
+    @classmethod
+    def get_version(cls) -> str:
+        """Version courante de l'arbre, partagée entre les processus."""
+        version = cache.get(cls.CACHE_KEY_VERSION)
+        if version is None:
+            cache.add(cls.CACHE_KEY_VERSION, uuid.uuid4().hex, None)
+            version = cache.get(cls.CACHE_KEY_VERSION)
+        return version
+
+    @classmethod
+    def invalider(cls):
+        """
+        Publie une nouvelle version : tous les instantanés deviennent périmés.
+        La publication a lieu après la validation de la transaction en cours,
+        sinon un processus pourrait reconstruire l'arbre antérieur sous la
+        nouvelle version.
+        """
+        def publier():
+            try:
+                cache.set(cls.CACHE_KEY_VERSION, uuid.uuid4().hex, None)
+            except Exception as e:
+                logger.error(f"Erreur lors de l'invalidation de l'arbre des catégories: {e}")
+            cls._instantane = None
+
+        transaction.on_commit(publier)
+
+    @classmethod
+    def get_instantane(cls) -> Dict:
+        """Retourne l'instantané courant, reconstruit si la version a changé."""
+        try:
+            version = cls.get_version()
+        except Exception as e:
+            logger.error(f"Version de l'arbre des catégories indisponible: {e}")
+            version = None
+
+        instantane = cls._instantane
+        if instantane is not None and version is not None and instantane['version'] == version:
+            return instantane
+
+        with cls._verrou:
+            instantane = cls._instantane
+            if instantane is None or version is None or instantane['version'] != version:
+                instantane = cls.construire()
+                instantane['version'] = version
+                cls._instantane = instantane
+        return instantane
+
+    @classmethod
+    def get_arbre(cls) -> List[Dict]:
+        return cls.get_instantane()['arbre']
+
+    @classmethod
+    def get_chemin(cls, categorie_id) -> Optional[str]:
+        """Chemin matérialisé d'une catégorie active, sans requête."""
+        return cls.get_instantane()['chemins'].get(str(categorie_id))
+
+    @staticmethod
+    def construire() -> Dict:
+        """Charge catégories et sous-catégories actives en deux requêtes."""
+        categories = Categorie.objects.filter(actif=True).order_by(
+            'type', 'ordre', 'nom'
+        ).values('id', 'nom', 'code', 'type', 'icone', 'couleur', 'parent_id', 'chemin')
+
+        sous_categories = SousCategorie.objects.filter(
+            categorie__actif=True
+        ).order_by('nom').values(
+            'id', 'nom', 'code', 'description', 'profil_technique',
+            'duree_amortissement_defaut', 'categorie_id'
+        )
+
+        sous_par_categorie = {}
+        for sc in sous_categories:
+            categorie_id = sc.pop('categorie_id')
+            sc['id'] = str(sc['id'])
+            sous_par_categorie.setdefault(categorie_id, []).append(sc)
+
+        enfants = {}
+        chemins = {}
+        for cat in categories:
+            chemins[str(cat['id'])] = cat['chemin']
+            enfants.setdefault(cat['parent_id'], []).append({
+                'id': str(cat['id']),
+                'nom': cat['nom'],
+                'code': cat['code'],
+                'type': cat['type'],
+                'icone': cat['icone'],
+                'couleur': cat['couleur'],
+                'sous_categories': sous_par_categorie.get(cat['id'], []),
+                'enfants': enfants.setdefault(cat['id'], []),
+            })
+
+        return {'arbre': enfants.get(None, []), 'chemins': chemins}
+
+    @classmethod
+    def reconstruire_chemins(cls) -> int:
+        """Recalcule les chemins matérialisés de toutes les catégories."""
+        table = connection.ops.quote_name(Categorie._meta.db_table)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH RECURSIVE arbre(id, chemin) AS ("
+                f"  SELECT id, id::text || '/' FROM {table} WHERE parent_id IS NULL "
+                f"  UNION ALL "
+                f"  SELECT c.id, a.chemin || c.id::text || '/' "
+                f"  FROM arbre a JOIN {table} c ON c.parent_id = a.id"
+                f") UPDATE {table} SET chemin = arbre.chemin "
+                f"FROM arbre WHERE {table}.id = arbre.id"
+            )
+            total = cursor.rowcount
+
+        cls.invalider()
+        CacheManager.invalidate_tags(Categorie._meta.model_name)
+        logger.info(f"Chemins des catégories recalculés: {total}")
+        return total
@@ -0,0 +1,100 @@
+# apps/patrimoine/services/code_service.py
+"""
+Allocation des codes patrimoine par séquences dédiées.
+Remplace le balayage code_patrimoine__startswith par un compteur
+verrouillé ligne à ligne, avec réservation de blocs pour les imports.
+"""
+from typing import List, Optional
+from django.db import connection, transaction
+from django.utils import timezone
+import logging
+
+from apps.patrimoine.models import Bien, SequenceCodePatrimoine
+
+logger = logging.getLogger(__name__)
+
+
+class CodePatrimoineAllocator:
+    """
+    Réserve des numéros dans SequenceCodePatrimoine.
+    En régime établi, une réservation (unitaire ou par bloc) coûte un seul
+    UPDATE ... RETURNING ; le verrou de ligne sérialise les créations
+    concurrentes sur la même séquence sans toucher à la table des biens.
+    """
+
+    FORMAT_CODE = "{prefixe}-{annee}-{code_categorie}-{numero:05d}"
+
+    @classmethod
+    def reserver(
+        cls,
+        prefixe: str,
+        annee: int,
+        code_categorie: str,
+        quantite: int = 1
+    ) -> range:
+        """Réserve `quantite` numéros consécutifs et retourne leur plage."""
+        if quantite < 1:
+            raise ValueError("La quantité réservée doit être positive")
+
+        table = connection.ops.quote_name(SequenceCodePatrimoine._meta.db_table)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET dernier_numero = dernier_numero + %s "
+                f"WHERE prefixe = %s AND annee = %s AND code_categorie = %s "
+                f"RETURNING dernier_numero",
+                [quantite, prefixe, annee, code_categorie]
+            )
+            row = cursor.fetchone()
+            if row is None:
+                row = cls._initialiser_sequence(
+                    cursor, table, prefixe, annee, code_categorie, quantite
+                )
+
+        dernier = row[0]
+        return range(dernier - quantite + 1, dernier + 1)
+
+    @classmethod
+    def _initialiser_sequence(cls, cursor, table, prefixe, annee, code_categorie, quantite):
+        """
+        Crée la séquence en la calant sur le plus grand numéro déjà attribué.
+        Le balayage des codes existants n'a lieu qu'une fois par séquence.
+        """
+        bien_table = connection.ops.quote_name(Bien._meta.db_table)
+        motif = cls._echapper_like(f"{prefixe}-{annee}-{code_categorie}-") + '%'
+        cursor.execute(
+            f"INSERT INTO {table} (prefixe, annee, code_categorie, dernier_numero) "
+            f"SELECT %s, %s, %s, COALESCE(MAX(CAST(SUBSTRING(code_patrimoine FROM '([0-9]+)$') AS integer)), 0) + %s "
+            f"FROM {bien_table} WHERE code_patrimoine LIKE %s "
+            f"ON CONFLICT (prefixe, annee, code_categorie) "
+            f"DO UPDATE SET dernier_numero = {table}.dernier_numero + %s "
+            f"RETURNING dernier_numero",
+            [prefixe, annee, code_categorie, quantite, motif, quantite]
+        )
+        logger.info(f"Séquence de codes initialisée: {prefixe}-{annee}-{code_categorie}")
+        return cursor.fetchone()
+
+    @staticmethod
+    def _echapper_like(valeur: str) -> str:
+        return valeur.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    @classmethod
+    def allouer_codes(
+        cls,
+        sous_categorie,
+        quantite: int = 1,
+        prefixe: str = 'OPRAG',
+        longueur_code: int = 4,
+        annee: Optional[int] = None
+    ) -> List[str]:
+        """Retourne `quantite` codes patrimoine réservés pour une sous-catégorie."""
+        annee = annee or timezone.now().year
+        code_categorie = sous_categorie.code[:longueur_code].upper()
+        return [
+            cls.FORMAT_CODE.format(
+                prefixe=prefixe,
+                annee=annee,
+                code_categorie=code_categorie,
+                numero=numero
+            )
+            for numero in cls.reserver(prefixe, annee, code_categorie, quantite)
+        ]
@@ -0,0 +1,144 @@
+# apps/patrimoine/services/cumuls_service.py
+"""
+Maintenance incrémentale de la table CumulBiens.
+Chaque écriture de Bien retire la contribution de l'ancienne ligne et
+ajoute celle de la nouvelle ; les deltas d'un lot sont fusionnés puis
+appliqués en un seul INSERT ... ON CONFLICT DO UPDATE.
+"""
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.db import connection, transaction
+import logging
+
+from apps.patrimoine.models import Bien, CumulBiens
+
+logger = logging.getLogger(__name__)
+
+# (entite_id, categorie_id, statut, etat_physique, mois)
+Cle = Tuple
+# [nombre_biens, valeur_acquisition, valeur_actuelle]
+Deltas = Dict[Cle, List]
+
+
+class CumulsBiensService:
+    """Deltas, application et reconstruction des cumuls de biens."""
+
+    CHAMPS_CONTRIBUTION = (
+        'entite_id', 'categorie_id', 'statut', 'etat_physique',
+        'date_acquisition', 'valeur_acquisition', 'valeur_actuelle_cache',
+        'is_removed',
+    )
+
+    @staticmethod
+    def contribution(valeurs: Dict) -> Optional[Tuple[Cle, Tuple]]:
+        """Clé et mesures apportées par une ligne de Bien (None si supprimée)."""
+        if valeurs is None or valeurs.get('is_removed') or not valeurs.get('date_acquisition'):
+            return None
+        valeur_acquisition = Decimal(valeurs['valeur_acquisition'] or 0)
+        valeur_actuelle = valeurs['valeur_actuelle_cache']
+        cle = (
+            valeurs['entite_id'],
+            valeurs['categorie_id'],
+            valeurs['statut'],
+            valeurs['etat_physique'],
+            valeurs['date_acquisition'].replace(day=1),
+        )
+        return cle, (
+            1,
+            valeur_acquisition,
+            Decimal(valeur_actuelle) if valeur_actuelle is not None else valeur_acquisition,
+        )
+
+    @classmethod
+    def contribution_de(cls, bien: Bien) -> Optional[Tuple[Cle, Tuple]]:
+        return cls.contribution({champ: getattr(bien, champ) for champ in cls.CHAMPS_CONTRIBUTION})
+
+    @classmethod
+    def valeurs_en_base(cls, pk) -> Optional[Dict]:
+        """Champs de contribution de la ligne telle qu'enregistrée (une lecture)."""
+        return Bien.all_objects.filter(pk=pk).values(*cls.CHAMPS_CONTRIBUTION).first()
+
+    @classmethod
+    def contribution_en_base(cls, pk) -> Optional[Tuple[Cle, Tuple]]:
+        """Contribution de la ligne telle qu'enregistrée."""
+        return cls.contribution(cls.valeurs_en_base(pk))
+
+    @staticmethod
+    def cumuler(deltas: Deltas, contribution, signe: int = 1):
+        """Ajoute (signe=1) ou retire (signe=-1) une contribution aux deltas."""
+        if contribution is None:
+            return
+        cle, mesures = contribution
+        cumul = deltas.setdefault(cle, [0, Decimal('0'), Decimal('0')])
+        for i, mesure in enumerate(mesures):
+            cumul[i] += signe * mesure
+
+    @classmethod
+    def deltas_creation(cls, biens: Iterable[Bien]) -> Deltas:
+        deltas: Deltas = {}
+        for bien in biens:
+            cls.cumuler(deltas, cls.contribution_de(bien))
+        return deltas
+
+    @staticmethod
+    def appliquer(deltas: Deltas) -> int:
+        """Applique les deltas non nuls en une requête ; retourne le nombre de clés."""
+        # Ordre de clé stable : limite les interblocages entre écritures concurrentes
+        lignes = sorted(
+            (
+                (*cle, *mesures) for cle, mesures in deltas.items()
+                if any(mesures)
+            ),
+            key=lambda ligne: tuple(str(valeur) for valeur in ligne[:5])
+        )
+        if not lignes:
+            return 0
+
+        table = connection.ops.quote_name(CumulBiens._meta.db_table)
+        valeurs = ', '.join(['(%s, %s, %s, %s, %s, %s, %s, %s)'] * len(lignes))
+        params = [valeur for ligne in lignes for valeur in ligne]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (entite_id, categorie_id, statut, etat_physique, mois, "
+                f"nombre_biens, valeur_acquisition, valeur_actuelle) VALUES {valeurs} "
+                f"ON CONFLICT (entite_id, categorie_id, statut, etat_physique, mois) DO UPDATE SET "
+                f"nombre_biens = {table}.nombre_biens + EXCLUDED.nombre_biens, "
+                f"valeur_acquisition = {table}.valeur_acquisition + EXCLUDED.valeur_acquisition, "
+                f"valeur_actuelle = {table}.valeur_actuelle + EXCLUDED.valeur_actuelle",
+                params
+            )
+        return len(lignes)
+
+    @staticmethod
+    def reconstruire() -> int:
+        """
+        Recalcule entièrement les cumuls depuis la table des biens.
+        Le verrou exclusif suspend les mises à jour incrémentales pendant
+        la reconstruction pour qu'aucun delta ne soit perdu.
+        """
+        table = connection.ops.quote_name(CumulBiens._meta.db_table)
+        bien_table = connection.ops.quote_name(Bien._meta.db_table)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(
+                f"INSERT INTO {table} (entite_id, categorie_id, statut, etat_physique, mois, "
+                f"nombre_biens, valeur_acquisition, valeur_actuelle) "
+                f"SELECT entite_id, categorie_id, statut, etat_physique, "
+                f"date_trunc('month', date_acquisition)::date, COUNT(*), "
+                f"SUM(valeur_acquisition), SUM(COALESCE(valeur_actuelle_cache, valeur_acquisition)) "
+                f"FROM {bien_table} WHERE NOT is_removed "
+                f"GROUP BY 1, 2, 3, 4, 5"
+            )
+            total = cursor.rowcount
+
+        logger.info(f"Cumuls des biens reconstruits: {total} lignes")
+        return total
+
+    @staticmethod
+    def cumuls(entite=None):
+        """Cumuls non vides, éventuellement restreints au sous-arbre d'une entité."""
+        queryset = CumulBiens.objects.filter(nombre_biens__gt=0)
+        if entite is not None:
+            queryset = queryset.filter(entite__ancetres_liens__ancetre=entite)
+        return queryset
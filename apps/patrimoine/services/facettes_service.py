@@ -0,0 +1,85 @@
+# apps/patrimoine/services/facettes_service.py
+"""
+Facettes du registre des biens calculées en une seule requête.
+Le queryset filtré sert de sous-requête ; un GROUP BY GROUPING SETS
+produit les comptes de chaque dimension (et le total) en un passage.
+"""
+from typing import Dict, List
+from django.db.models import F
+from django.db.models.functions import ExtractYear
+import logging
+
+from apps.patrimoine.models import Bien
+from .agregation_service import regrouper_par_ensembles
+
+logger = logging.getLogger(__name__)
+
+STATUTS = dict(Bien.StatutBien.choices)
+ETATS = dict(Bien.EtatPhysique.choices)
+
+
+class FacettesService:
+    """Comptes par statut, état, catégorie, entité et année d'acquisition."""
+
+    # facette -> ensemble regroupé (valeur, puis libellé éventuel)
+    FACETTES = {
+        'statut': ('f_statut',),
+        'etat_physique': ('f_etat',),
+        'categorie': ('f_categorie', 'f_categorie_nom'),
+        'entite': ('f_entite', 'f_entite_nom'),
+        'annee_acquisition': ('f_annee',),
+    }
+
+    @classmethod
+    def calculer(cls, queryset) -> Dict:
+        """
+        Retourne {'total': n, 'facettes': {nom: [{valeur, libelle, count}]}}
+        pour le queryset déjà filtré.
+        """
+        lignes = regrouper_par_ensembles(
+            queryset,
+            champs={
+                'f_statut': F('statut'),
+                'f_etat': F('etat_physique'),
+                'f_categorie': F('categorie_id'),
+                'f_categorie_nom': F('categorie__nom'),
+                'f_entite': F('entite_id'),
+                'f_entite_nom': F('entite__nom'),
+                'f_annee': ExtractYear('date_acquisition'),
+            },
+            ensembles=list(cls.FACETTES.values()),
+            mesures={'count': 'COUNT(*)'}
+        )
+        return cls._mettre_en_forme(lignes)
+
+    @classmethod
+    def _mettre_en_forme(cls, lignes: List[Dict]) -> Dict:
+        noms = {ensemble: nom for nom, ensemble in cls.FACETTES.items()}
+        facettes: Dict[str, List[Dict]] = {nom: [] for nom in cls.FACETTES}
+        total = 0
+
+        for ligne in lignes:
+            ensemble = ligne['ensemble']
+            if not ensemble:
+                total = ligne['count']
+                continue
+
+            nom = noms[ensemble]
+            valeur = ligne[ensemble[0]]
+            if nom == 'statut':
+                libelle = STATUTS.get(valeur, valeur)
+            elif nom == 'etat_physique':
+                libelle = ETATS.get(valeur, valeur)
+            elif nom in ('categorie', 'entite'):
+                valeur, libelle = str(valeur), ligne[ensemble[1]]
+            else:
+                libelle = str(valeur)
+            facettes[nom].append({'valeur': valeur, 'libelle': libelle, 'count': ligne['count']})
+
+        for nom, entrees in facettes.items():
+            if nom == 'annee_acquisition':
+                entrees.sort(key=lambda e: e['valeur'] or 0, reverse=True)
+            else:
+                entrees.sort(key=lambda e: -e['count'])
+
+        return {'total': total, 'facettes': facettes}
@@ -0,0 +1,174 @@
+# apps/patrimoine/services/hierarchie_service.py
+"""
+Hiérarchie des entités : arbre de navigation mis en cache et table de
+fermeture (EntiteHierarchie) pour le périmètre et les consolidations.
+L'arbre est assemblé en mémoire en un nombre constant de requêtes ;
+les signaux sur Entite invalident le cache et maintiennent la fermeture.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from django.db import connection, transaction
+from django.db.models import Count
+import logging
+
+from apps.core.utils import CacheManager
+from apps.patrimoine.models import Bien, Entite, EntiteHierarchie
+
+logger = logging.getLogger(__name__)
+
+
+class EntiteHierarchieService:
+    """Arbre hiérarchique des entités et maintenance de leur fermeture."""
+
+    CACHE_KEY_ARBRE = 'patrimoine:entites:arbre'
+    CACHE_TTL_ARBRE = 60 * 30  # 30 minutes
+
+    # Tags de cache des biens : 'bien' pour les lectures sans restriction,
+    # 'entite:<id>' pour le sous-arbre d'une entité, 'bien:masse' pour les
+    # écritures en masse qui touchent tous les périmètres
+    TAG_BIENS = 'bien'
+    TAG_BIENS_MASSE = 'bien:masse'
+
+    @classmethod
+    def tags_perimetre(cls, entite_id=None) -> List[str]:
+        """Tags des lectures de biens limitées au sous-arbre de `entite_id`."""
+        if entite_id is None:
+            return [cls.TAG_BIENS]
+        return [f"entite:{entite_id}", cls.TAG_BIENS_MASSE]
+
+    @classmethod
+    def tags_biens(cls, entite_ids: Optional[Iterable] = None) -> List[str]:
+        """
+        Tags à invalider après une écriture de biens des entités données :
+        chaque ancêtre voit son sous-arbre changer. Sans `entite_ids`,
+        écriture en masse sur tous les périmètres.
+        """
+        if entite_ids is None:
+            return [cls.TAG_BIENS, cls.TAG_BIENS_MASSE]
+        ids = {entite_id for entite_id in entite_ids if entite_id}
+        ancetres = EntiteHierarchie.objects.filter(
+            descendant_id__in=ids
+        ).values_list('ancetre_id', flat=True).distinct() if ids else []
+        return [cls.TAG_BIENS] + [f"entite:{ancetre}" for ancetre in ancetres]
+
+    @classmethod
+    def get_arbre(cls) -> List[Dict]:
+        """Retourne l'arbre depuis le cache, en le construisant au besoin."""
+        return CacheManager.get_or_set(
+            cls.CACHE_KEY_ARBRE,
+            cls.construire_arbre,
+            ttl=cls.CACHE_TTL_ARBRE
+        )
+
+    @classmethod
+    def invalider_arbre(cls):
+        """
+        Supprime l'arbre mis en cache, après la validation de la transaction
+        en cours : une lecture concurrente remettrait sinon en cache l'arbre
+        antérieur.
+        """
+        transaction.on_commit(lambda: CacheManager.delete(cls.CACHE_KEY_ARBRE))
+
+    @staticmethod
+    def construire_arbre() -> List[Dict]:
+        """
+        Construit l'arbre complet en deux requêtes : les entités actives
+        avec leur responsable, puis le nombre de biens agrégé par entité.
+        """
+        entites = Entite.objects.filter(actif=True).select_related(
+            'responsable'
+        ).only(
+            'id', 'nom', 'code', 'type', 'parent_id',
+            'responsable__first_name', 'responsable__last_name',
+            'responsable__username'
+        ).order_by('type', 'nom')
+
+        nombre_biens = dict(
+            Bien.objects.values_list('entite_id').annotate(total=Count('id')).order_by()
+        )
+
+        enfants = defaultdict(list)
+        for entite in entites:
+            enfants[entite.parent_id].append({
+                'id': str(entite.id),
+                'nom': entite.nom,
+                'code': entite.code,
+                'type': entite.type,
+                'responsable': entite.responsable.get_full_name() if entite.responsable else None,
+                'nombre_biens': nombre_biens.get(entite.id, 0),
+                'enfants': enfants[entite.id],
+            })
+
+        # Les listes d'enfants sont partagées par référence : l'ordre
+        # (type, nom) est conservé et les entités dont le parent est
+        # inactif restent hors de l'arbre, comme avec le parcours récursif.
+        return enfants[None]
+
+    # Table de fermeture
+
+    @staticmethod
+    def _tables():
+        quote = connection.ops.quote_name
+        return (
+            quote(EntiteHierarchie._meta.db_table),
+            quote(Entite._meta.db_table),
+        )
+
+    @classmethod
+    def inserer_noeud(cls, entite: Entite):
+        """Ajoute une entité nouvellement créée sous son parent."""
+        table, _ = cls._tables()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (ancetre_id, descendant_id, profondeur) "
+                f"SELECT ancetre_id, %s, profondeur + 1 FROM {table} WHERE descendant_id = %s "
+                f"UNION ALL SELECT %s, %s, 0 "
+                f"ON CONFLICT (ancetre_id, descendant_id) DO NOTHING",
+                [entite.pk, entite.parent_id, entite.pk, entite.pk]
+            )
+
+    @classmethod
+    def deplacer_noeud(cls, entite: Entite):
+        """
+        Rattache le sous-arbre d'une entité à son nouveau parent :
+        les liens vers les anciens ancêtres sont supprimés, puis le produit
+        (ancêtres du parent × sous-arbre) est inséré en une requête.
+        """
+        table, _ = cls._tables()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} "
+                f"WHERE descendant_id IN (SELECT descendant_id FROM {table} WHERE ancetre_id = %s) "
+                f"AND ancetre_id NOT IN (SELECT descendant_id FROM {table} WHERE ancetre_id = %s)",
+                [entite.pk, entite.pk]
+            )
+            if entite.parent_id:
+                cursor.execute(
+                    f"INSERT INTO {table} (ancetre_id, descendant_id, profondeur) "
+                    f"SELECT sup.ancetre_id, sub.descendant_id, sup.profondeur + sub.profondeur + 1 "
+                    f"FROM {table} sup CROSS JOIN {table} sub "
+                    f"WHERE sup.descendant_id = %s AND sub.ancetre_id = %s",
+                    [entite.parent_id, entite.pk]
+                )
+
+    @classmethod
+    def reconstruire_fermeture(cls) -> int:
+        """Recalcule entièrement la table de fermeture par une CTE récursive."""
+        table, entite_table = cls._tables()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(
+                f"INSERT INTO {table} (ancetre_id, descendant_id, profondeur) "
+                f"WITH RECURSIVE fermeture(ancetre_id, descendant_id, profondeur) AS ("
+                f"  SELECT id, id, 0 FROM {entite_table} "
+                f"  UNION ALL "
+                f"  SELECT f.ancetre_id, e.id, f.profondeur + 1 "
+                f"  FROM fermeture f JOIN {entite_table} e ON e.parent_id = f.descendant_id"
+                f") SELECT ancetre_id, descendant_id, profondeur FROM fermeture"
+            )
+            total = cursor.rowcount
+
+        # Le périmètre des utilisateurs dépend de la fermeture
+        CacheManager.invalidate_tags(Entite._meta.model_name, cls.TAG_BIENS_MASSE)
+        logger.info(f"Table de fermeture des entités reconstruite: {total} liens")
+        return total
@@ -0,0 +1,388 @@
+# apps/patrimoine/services/import_service.py
+"""
+Import en masse des biens depuis un DataFrame (Excel/CSV).
+Validation vectorisée des colonnes, préchargement des références en
+dictionnaires et écriture par bulk_create/bulk_update en lots.
+"""
+from typing import Dict, List, Tuple
+from collections import defaultdict
+from decimal import Decimal
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+import pandas as pd
+import logging
+
+from apps.core.utils import CacheManager
+from apps.patrimoine.models import (
+    Bien, Categorie, SousCategorie, Entite, HistoriqueValeur
+)
+from .code_service import CodePatrimoineAllocator
+from .reevaluation_service import calculer_valeurs_nettes
+from .search_service import RechercheService
+from .cumuls_service import CumulsBiensService
+from .hierarchie_service import EntiteHierarchieService
+
+logger = logging.getLogger(__name__)
+
+MODES_IMPORT = ('create', 'update', 'upsert')
+
+# En-têtes du fichier -> champs du modèle (compatibles avec l'export)
+COLONNES = {
+    'Code Patrimoine': 'code_patrimoine',
+    'Nom': 'nom',
+    'Description': 'description',
+    'Catégorie': 'categorie',
+    'Sous-catégorie': 'sous_categorie',
+    'Entité': 'entite',
+    'Valeur Acquisition': 'valeur_acquisition',
+    'Date Acquisition': 'date_acquisition',
+    'Date Mise en Service': 'date_mise_service',
+    'Durée Amortissement': 'duree_amortissement',
+    'Valeur Résiduelle': 'valeur_residuelle',
+    'Statut': 'statut',
+    'État': 'etat_physique',
+    'Localisation': 'localisation_precise',
+    'Marque': 'marque',
+    'Modèle': 'modele',
+    'N° Série': 'numero_serie',
+    'Fournisseur': 'fournisseur',
+    'Garantie': 'date_fin_garantie',
+}
+
+CHAMPS_OBLIGATOIRES_CREATION = [
+    'nom', 'sous_categorie', 'entite', 'valeur_acquisition', 'date_acquisition'
+]
+CHAMPS_DECIMAUX = ['valeur_acquisition', 'valeur_residuelle']
+CHAMPS_DATES = ['date_acquisition', 'date_mise_service', 'date_fin_garantie']
+CHAMPS_TEXTE = [
+    'nom', 'description', 'localisation_precise',
+    'marque', 'modele', 'numero_serie', 'fournisseur'
+]
+CHAMPS_VALEUR = ['valeur_acquisition', 'date_acquisition', 'duree_amortissement', 'valeur_residuelle']
+
+
+def _choix(choices) -> Dict[str, str]:
+    """Accepte le code ou le libellé d'un choix, sans tenir compte de la casse."""
+    correspondance = {}
+    for code, libelle in choices:
+        correspondance[str(code).lower()] = code
+        correspondance[str(libelle).lower()] = code
+    return correspondance
+
+
+class ImportBiensService:
+    """
+    Moteur d'import en lots pour BienViewSet.import_bulk et les jobs d'import.
+    `preparer` valide tout le fichier d'un coup ; `traiter_lot` écrit un lot
+    de lignes valides dans une transaction.
+    """
+
+    def __init__(self, user, mode: str = 'create', chunk_size: int = 1000):
+        if mode not in MODES_IMPORT:
+            raise ValueError(f"Mode d'import non supporté: {mode}")
+        self.user = user
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self.prefixe_code = settings.OPRAG_CONFIG.get('ASSET_CODE_PREFIX', 'OPRAG')
+        self._charger_references()
+
+    def _charger_references(self):
+        """Précharge les référentiels en dictionnaires (une requête chacun)."""
+        self.categories = {}
+        for pk, code, nom in Categorie.objects.values_list('pk', 'code', 'nom'):
+            self.categories[code.lower()] = pk
+            self.categories[nom.lower()] = pk
+
+        self.sous_categories = {}
+        self.sous_categories_par_id = {}
+        for sc in SousCategorie.objects.only('pk', 'code', 'nom', 'categorie_id', 'duree_amortissement_defaut'):
+            self.sous_categories[sc.code.lower()] = sc.pk
+            self.sous_categories.setdefault(sc.nom.lower(), sc.pk)
+            self.sous_categories_par_id[sc.pk] = sc
+
+        self.entites = {}
+        for pk, code, nom in Entite.objects.values_list('pk', 'code', 'nom'):
+            self.entites[code.lower()] = pk
+            self.entites[nom.lower()] = pk
+
+        self.statuts = _choix(Bien.StatutBien.choices)
+        self.etats = _choix(Bien.EtatPhysique.choices)
+
+    # ------------------------------------------------------------------
+    # Validation vectorisée
+    # ------------------------------------------------------------------
+    def preparer(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[int, Dict]]:
+        """
+        Normalise et valide le DataFrame complet.
+        Retourne les lignes valides (typées) et les erreurs par ligne du fichier.
+        """
+        df = df.rename(columns=COLONNES)
+        df = df[[col for col in COLONNES.values() if col in df.columns]].copy()
+        df.index = df.index + 2  # numéros de ligne du fichier (en-tête = 1)
+        erreurs = defaultdict(dict)
+
+        def signaler(masque, champ, message):
+            for ligne in df.index[masque]:
+                erreurs[int(ligne)].setdefault(champ, message)
+
+        # Chaînes : suppression des espaces, valeurs vides -> NaN
+        for col in df.columns:
+            if not (pd.api.types.is_numeric_dtype(df[col])
+                    or pd.api.types.is_datetime64_any_dtype(df[col])):
+                df[col] = df[col].astype('string').str.strip().replace('', pd.NA).astype(object)
+
+        if 'code_patrimoine' not in df.columns:
+            df['code_patrimoine'] = None
+        codes = df['code_patrimoine']
+        a_code = codes.notna()
+
+        # Doublons dans le fichier
+        signaler(a_code & codes.duplicated(keep=False), 'code_patrimoine',
+                 "Code patrimoine en double dans le fichier")
+
+        # Types numériques et dates
+        for col in CHAMPS_DECIMAUX + ['duree_amortissement']:
+            if col in df.columns:
+                valeurs = pd.to_numeric(df[col], errors='coerce')
+                signaler(df[col].notna() & valeurs.isna(), col, "Valeur numérique invalide")
+                signaler(valeurs < 0, col, "La valeur doit être positive")
+                df[col] = valeurs
+        for col in CHAMPS_DATES:
+            if col in df.columns:
+                dates = pd.to_datetime(df[col], errors='coerce', dayfirst=True)
+                signaler(df[col].notna() & dates.isna(), col, "Date invalide")
+                df[col] = dates.dt.date.where(dates.notna(), None)
+        if 'date_acquisition' in df.columns:
+            aujourd_hui = timezone.now().date()
+            futur = df['date_acquisition'].map(lambda d: d is not None and d > aujourd_hui)
+            signaler(futur.astype(bool), 'date_acquisition',
+                     "La date d'acquisition ne peut pas être dans le futur")
+
+        # Références : correspondance par dictionnaires préchargés
+        for col, referentiel in (
+            ('categorie', self.categories),
+            ('sous_categorie', self.sous_categories),
+            ('entite', self.entites),
+            ('statut', self.statuts),
+            ('etat_physique', self.etats),
+        ):
+            if col in df.columns:
+                resolus = df[col].map(lambda v: referentiel.get(str(v).lower()) if pd.notna(v) else None)
+                signaler(df[col].notna() & resolus.isna(), col, f"Référence inconnue pour {col}")
+                df[col] = resolus
+
+        if 'sous_categorie' in df.columns:
+            categorie_attendue = df['sous_categorie'].map(
+                lambda pk: self.sous_categories_par_id[pk].categorie_id if pd.notna(pk) else None
+            )
+            if 'categorie' in df.columns:
+                signaler(
+                    df['categorie'].notna() & categorie_attendue.notna()
+                    & (df['categorie'] != categorie_attendue),
+                    'sous_categorie',
+                    "La sous-catégorie ne correspond pas à la catégorie"
+                )
+            df['categorie'] = categorie_attendue
+
+        # Existence des codes en base : un seul préchargement
+        existants = self._codes_existants(codes[a_code].tolist())
+        df['_existant'] = codes.isin(existants)
+        if self.mode == 'create':
+            signaler(df['_existant'], 'code_patrimoine', "Ce code patrimoine existe déjà")
+        elif self.mode == 'update':
+            signaler(~a_code, 'code_patrimoine', "Code patrimoine requis en mode mise à jour")
+            signaler(a_code & ~df['_existant'], 'code_patrimoine', "Bien introuvable")
+
+        # Champs obligatoires pour les créations
+        a_creer = ~df['_existant']
+        for col in CHAMPS_OBLIGATOIRES_CREATION:
+            manquant = df[col].isna() if col in df.columns else pd.Series(True, index=df.index)
+            signaler(a_creer & manquant, col, f"Le champ {col} est obligatoire")
+
+        valides = df.drop(index=list(erreurs))
+        return valides, dict(erreurs)
+
+    def _codes_existants(self, codes: List[str], taille: int = 5000) -> set:
+        existants = set()
+        for debut in range(0, len(codes), taille):
+            existants.update(
+                Bien.all_objects.filter(
+                    code_patrimoine__in=codes[debut:debut + taille]
+                ).values_list('code_patrimoine', flat=True)
+            )
+        return existants
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def traiter_lot(self, lot: pd.DataFrame) -> Tuple[int, Dict[int, Dict]]:
+        """Écrit un lot de lignes valides ; retourne (succès, erreurs par ligne)."""
+        if lot.empty:
+            return 0, {}
+        try:
+            with transaction.atomic():
+                crees = self._creer(lot[~lot['_existant']])
+                maj = self._mettre_a_jour(lot[lot['_existant']])
+                CacheManager.invalidate_tags(*EntiteHierarchieService.tags_biens())
+            return crees + maj, {}
+        except Exception as e:
+            logger.error(f"Échec du lot d'import (lignes {lot.index.min()}-{lot.index.max()}): {e}")
+            return 0, {int(ligne): {'lot': str(e)} for ligne in lot.index}
+
+    def importer(self, df: pd.DataFrame) -> Dict:
+        """Importe un DataFrame complet et retourne le rapport d'import."""
+        valides, erreurs = self.preparer(df)
+        succes = 0
+        for debut in range(0, len(valides), self.chunk_size):
+            nb, erreurs_lot = self.traiter_lot(valides.iloc[debut:debut + self.chunk_size])
+            succes += nb
+            erreurs.update(erreurs_lot)
+        return self.rapport(succes, erreurs)
+
+    @staticmethod
+    def rapport(succes: int, erreurs: Dict[int, Dict]) -> Dict:
+        return {
+            'success': succes,
+            'errors': len(erreurs),
+            'details': [
+                {'row': ligne, 'errors': erreurs[ligne]}
+                for ligne in sorted(erreurs)
+            ],
+        }
+
+    @staticmethod
+    def _lignes(df: pd.DataFrame) -> List[Dict]:
+        """Convertit un DataFrame en dictionnaires Python (NaN -> None)."""
+        return df.astype(object).where(df.notna(), None).to_dict('records')
+
+    def _valeurs_actuelles(self, biens: List[Bien]) -> None:
+        """Calcule valeur_actuelle_cache en une passe vectorisée."""
+        if not biens:
+            return
+        aujourd_hui = timezone.now().date()
+        nouvelles = calculer_valeurs_nettes(
+            [b.valeur_acquisition for b in biens],
+            [(aujourd_hui - b.date_acquisition).days for b in biens],
+            [b.duree_amortissement or 0 for b in biens],
+            [b.valeur_residuelle or 0 for b in biens],
+            settings.OPRAG_CONFIG.get('DEPRECIATION_METHOD', 'LINEAR')
+        )
+        for bien, valeur in zip(biens, nouvelles):
+            bien.valeur_actuelle_cache = Decimal(f"{valeur:.2f}")
+
+    @staticmethod
+    def _normaliser(champ, valeur):
+        if valeur is None:
+            return None
+        if champ in CHAMPS_DECIMAUX:
+            return Decimal(str(round(float(valeur), 2)))
+        if champ == 'duree_amortissement':
+            return int(valeur)
+        return valeur
+
+    def _creer(self, lot: pd.DataFrame) -> int:
+        if lot.empty:
+            return 0
+        lignes = self._lignes(lot.drop(columns=['_existant']))
+
+        # Réservation des codes manquants par blocs, une par sous-catégorie
+        sans_code = defaultdict(list)
+        for ligne in lignes:
+            if not ligne.get('code_patrimoine'):
+                sans_code[ligne['sous_categorie']].append(ligne)
+        for sc_id, lignes_sc in sans_code.items():
+            codes = CodePatrimoineAllocator.allouer_codes(
+                self.sous_categories_par_id[sc_id],
+                quantite=len(lignes_sc),
+                prefixe=self.prefixe_code,
+                longueur_code=4
+            )
+            for ligne, code in zip(lignes_sc, codes):
+                ligne['code_patrimoine'] = code
+
+        biens = []
+        for ligne in lignes:
+            donnees = {
+                champ: self._normaliser(champ, valeur)
+                for champ, valeur in ligne.items()
+                if valeur is not None or champ in CHAMPS_TEXTE
+            }
+            for champ in CHAMPS_TEXTE:
+                donnees[champ] = donnees.get(champ) or ''
+            donnees['categorie_id'] = donnees.pop('categorie')
+            donnees['sous_categorie_id'] = donnees.pop('sous_categorie')
+            donnees['entite_id'] = donnees.pop('entite')
+            if donnees.get('duree_amortissement') is None:
+                donnees['duree_amortissement'] = (
+                    self.sous_categories_par_id[donnees['sous_categorie_id']].duree_amortissement_defaut
+                )
+            biens.append(Bien(created_by=self.user, modified_by=self.user, **donnees))
+
+        self._valeurs_actuelles(biens)
+        bulk_create_with_history(
+            biens, Bien, batch_size=self.chunk_size, default_user=self.user
+        )
+        HistoriqueValeur.objects.bulk_create(
+            [
+                HistoriqueValeur(
+                    bien=bien,
+                    date=bien.date_acquisition,
+                    valeur=bien.valeur_acquisition,
+                    type_evaluation='ACQUISITION',
+                    motif="Valeur d'acquisition initiale (import)",
+                    created_by=self.user
+                )
+                for bien in biens
+            ],
+            batch_size=self.chunk_size
+        )
+        RechercheService.mettre_a_jour(Bien, [bien.pk for bien in biens])
+        CumulsBiensService.appliquer(CumulsBiensService.deltas_creation(biens))
+        return len(biens)
+
+    def _mettre_a_jour(self, lot: pd.DataFrame) -> int:
+        if lot.empty:
+            return 0
+        lignes = self._lignes(lot.drop(columns=['_existant']))
+        biens = Bien.all_objects.in_bulk(
+            [ligne['code_patrimoine'] for ligne in lignes],
+            field_name='code_patrimoine'
+        )
+
+        # Contributions aux cumuls avant modification, retirées après écriture
+        deltas = {}
+        for bien in biens.values():
+            CumulsBiensService.cumuler(deltas, CumulsBiensService.contribution_de(bien), -1)
+
+        champs_modifies = {'modified_by', 'modified'}
+        a_revaloriser = []
+        for ligne in lignes:
+            bien = biens[ligne['code_patrimoine']]
+            for champ, valeur in ligne.items():
+                if champ == 'code_patrimoine' or valeur is None:
+                    continue
+                attribut = f"{champ}_id" if champ in ('categorie', 'sous_categorie', 'entite') else champ
+                setattr(bien, attribut, self._normaliser(champ, valeur))
+                champs_modifies.add(attribut)
+                if champ in CHAMPS_VALEUR:
+                    a_revaloriser.append(bien)
+            bien.modified_by = self.user
+            bien.modified = timezone.now()
+
+        a_revaloriser = list({b.pk: b for b in a_revaloriser}.values())
+        if a_revaloriser:
+            self._valeurs_actuelles(a_revaloriser)
+            champs_modifies.add('valeur_actuelle_cache')
+
+        bulk_update_with_history(
+            list(biens.values()), Bien, sorted(champs_modifies),
+            batch_size=self.chunk_size, default_user=self.user
+        )
+        if champs_modifies & set(RechercheService.champs_indexes(Bien)):
+            RechercheService.mettre_a_jour(Bien, [bien.pk for bien in biens.values()])
+        for bien in biens.values():
+            CumulsBiensService.cumuler(deltas, CumulsBiensService.contribution_de(bien))
+        CumulsBiensService.appliquer(deltas)
+        return len(lignes)
@@ -20,8 +20,8 @@ class NotificationService:
     @staticmethod
     def notifier_changement_valeur(bien, historique):
         """Notifie d'un changement de valeur"""
-        difference = historique.valeur - bien.valeur_initiale
-        pourcentage = (difference / bien.valeur_initiale) * 100 if bien.valeur_initiale else 0
+        difference = historique.valeur - bien.valeur_acquisition
+        pourcentage = (difference / bien.valeur_acquisition) * 100 if bien.valeur_acquisition else 0
         
         # Déterminer le type de notification selon l'ampleur du changement
         type_notif = 'info'
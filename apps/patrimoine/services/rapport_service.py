@@ -18,7 +18,7 @@ class RapportService:
             .values('mois')
             .annotate(
                 nombre=Count('id'),
-                valeur_totale=Sum('valeur_initiale')
+                valeur_totale=Sum('valeur_acquisition')
             )
             .order_by('mois')
         )
@@ -66,7 +66,7 @@ class RapportService:
             )
             .annotate(
                 nombre=Count('id'),
-                valeur_totale=Sum('valeur_initiale')
+                valeur_totale=Sum('valeur_acquisition')
             )
             .order_by('province', 'departement', 'commune')
         )
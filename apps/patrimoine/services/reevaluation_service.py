@@ -0,0 +1,219 @@
+# apps/patrimoine/services/reevaluation_service.py
+"""
+Moteur de réévaluation en masse du portefeuille de biens.
+Calcule les valeurs nettes comptables par passes vectorisées (NumPy)
+et les réécrit par UPDATE groupés.
+"""
+from typing import Dict, Optional
+from datetime import date
+from decimal import Decimal
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+import numpy as np
+import logging
+
+from apps.core.utils import CacheManager
+from apps.patrimoine.models import Bien
+from .cumuls_service import CumulsBiensService
+from .hierarchie_service import EntiteHierarchieService
+
+logger = logging.getLogger(__name__)
+
+# Durée moyenne d'un mois, identique à AmortissementCalculator
+JOURS_PAR_MOIS = 30.44
+
+METHODES_SUPPORTEES = ('LINEAR', 'DEGRESSIF')
+
+
+def calculer_valeurs_nettes(
+    valeur_acquisition: np.ndarray,
+    jours_ecoules: np.ndarray,
+    duree_amortissement: np.ndarray,
+    valeur_residuelle: np.ndarray,
+    methode: str = 'LINEAR'
+) -> np.ndarray:
+    """
+    Calcule les valeurs nettes comptables d'un lot de biens.
+
+    Reproduit les méthodes LINEAR et DEGRESSIF de AmortissementCalculator
+    sur des colonnes NumPy. Les biens sans durée d'amortissement (0 ou NaN)
+    conservent leur valeur d'acquisition.
+    """
+    if methode not in METHODES_SUPPORTEES:
+        raise ValueError(f"Méthode d'amortissement non supportée: {methode}")
+
+    va = np.asarray(valeur_acquisition, dtype=np.float64)
+    vr = np.nan_to_num(np.asarray(valeur_residuelle, dtype=np.float64))
+    duree = np.nan_to_num(np.asarray(duree_amortissement, dtype=np.float64))
+    mois_ecoules = np.asarray(jours_ecoules, dtype=np.float64) / JOURS_PAR_MOIS
+
+    amortissable = duree > 0
+    # Éviter la division par zéro sur les biens non amortissables
+    duree_sure = np.where(amortissable, duree, 1.0)
+
+    if methode == 'LINEAR':
+        base = va - vr
+        cumul = np.minimum(base / duree_sure * mois_ecoules, base)
+        valeur_nette = va - cumul
+    else:
+        valeur_nette = _valeurs_nettes_degressives(
+            va, vr, duree_sure, mois_ecoules
+        )
+
+    return np.round(np.where(amortissable, valeur_nette, va), 2)
+
+
+def _valeurs_nettes_degressives(
+    va: np.ndarray,
+    vr: np.ndarray,
+    duree: np.ndarray,
+    mois_ecoules: np.ndarray
+) -> np.ndarray:
+    """Amortissement dégressif annuel, une passe vectorisée par exercice."""
+    coefficient = np.select(
+        [duree <= 36, duree <= 60],
+        [1.25, 1.75],
+        default=2.25
+    )
+    taux_degressif = 12.0 / duree * coefficient
+    annees_ecoulees = np.floor(mois_ecoules / 12).astype(np.int64)
+
+    valeur_nette = va.copy()
+    en_cours = annees_ecoulees > 0
+    nb_passes = int(annees_ecoulees.max()) if annees_ecoulees.size else 0
+
+    for annee in range(nb_passes):
+        actifs = en_cours & (annee < annees_ecoulees)
+        if not actifs.any():
+            break
+
+        # Passage au linéaire lorsque le taux restant devient supérieur
+        annees_restantes = duree / 12 - annee
+        taux = taux_degressif
+        with np.errstate(divide='ignore'):
+            taux_lineaire_restant = np.where(
+                annees_restantes > 0, 1.0 / annees_restantes, 0.0
+            )
+        taux = np.where(taux_lineaire_restant > taux, taux_lineaire_restant, taux)
+
+        valeur_nette = np.where(actifs, valeur_nette - valeur_nette * taux, valeur_nette)
+
+        # Ne pas descendre sous la valeur résiduelle
+        plancher = actifs & (valeur_nette < vr)
+        valeur_nette = np.where(plancher, vr, valeur_nette)
+        en_cours &= ~plancher
+
+    return valeur_nette
+
+
+class ReevaluationService:
+    """
+    Réévaluation nocturne ou à la demande de valeur_actuelle_cache.
+    Parcourt le registre par blocs de clés primaires (keyset) pour
+    borner la mémoire et n'écrit que les lignes dont la valeur change.
+    """
+
+    CHAMPS = (
+        'id', 'valeur_acquisition', 'date_acquisition',
+        'duree_amortissement', 'valeur_residuelle', 'valeur_actuelle_cache'
+    )
+
+    def __init__(self, chunk_size: int = 5000, methode: Optional[str] = None):
+        self.chunk_size = chunk_size
+        self.methode = methode or settings.OPRAG_CONFIG.get('DEPRECIATION_METHOD', 'LINEAR')
+        if self.methode not in METHODES_SUPPORTEES:
+            raise ValueError(f"Méthode d'amortissement non supportée: {self.methode}")
+
+    def reevaluer_portefeuille(
+        self,
+        date_calcul: Optional[date] = None,
+        queryset=None,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Recalcule la valeur actuelle de tous les biens du queryset.
+        Retourne le nombre de lignes traitées et modifiées.
+        """
+        date_calcul = date_calcul or timezone.now().date()
+        queryset = queryset if queryset is not None else Bien.objects.all()
+        queryset = queryset.order_by('pk')
+
+        resultat = {
+            'methode': self.methode,
+            'date_calcul': date_calcul.isoformat(),
+            'biens_traites': 0,
+            'biens_modifies': 0,
+        }
+
+        dernier_pk = None
+        while True:
+            lot = queryset
+            if dernier_pk is not None:
+                lot = lot.filter(pk__gt=dernier_pk)
+            lignes = list(lot.values_list(*self.CHAMPS)[:self.chunk_size])
+            if not lignes:
+                break
+
+            modifies = self._traiter_lot(lignes, date_calcul, dry_run)
+            resultat['biens_traites'] += len(lignes)
+            resultat['biens_modifies'] += modifies
+            dernier_pk = lignes[-1][0]
+
+        if resultat['biens_modifies'] and not dry_run:
+            # Une passe touche la plupart des lignes : une reconstruction
+            # groupée coûte moins que des deltas ligne à ligne.
+            CumulsBiensService.reconstruire()
+            CacheManager.invalidate_tags(*EntiteHierarchieService.tags_biens())
+
+        logger.info(
+            f"Réévaluation {self.methode} au {date_calcul}: "
+            f"{resultat['biens_modifies']}/{resultat['biens_traites']} biens modifiés"
+        )
+        return resultat
+
+    def _traiter_lot(self, lignes, date_calcul: date, dry_run: bool) -> int:
+        """Calcule un lot en colonnes et écrit les valeurs modifiées."""
+        ids, va, dates, duree, vr, actuelle = zip(*lignes)
+
+        valeur_acquisition = np.array(va, dtype=np.float64)
+        date_acq = np.array(
+            [d or date_calcul for d in dates], dtype='datetime64[D]'
+        )
+        jours = (np.datetime64(date_calcul, 'D') - date_acq).astype(np.float64)
+        sans_date = np.array([d is None for d in dates])
+
+        nouvelles = calculer_valeurs_nettes(
+            valeur_acquisition,
+            jours,
+            np.array([d or 0 for d in duree], dtype=np.float64),
+            np.array([v or 0 for v in vr], dtype=np.float64),
+            self.methode
+        )
+        nouvelles = np.where(sans_date, valeur_acquisition, nouvelles)
+
+        anciennes = np.array(
+            [np.nan if v is None else float(v) for v in actuelle],
+            dtype=np.float64
+        )
+        changees = np.flatnonzero(
+            np.isnan(anciennes) | (np.abs(anciennes - nouvelles) >= 0.005)
+        )
+        if dry_run or changees.size == 0:
+            return int(changees.size)
+
+        # modified suit la nouvelle valeur : les validateurs HTTP en dépendent
+        maintenant = timezone.now()
+        objets = [
+            Bien(
+                pk=ids[i],
+                valeur_actuelle_cache=Decimal(f"{nouvelles[i]:.2f}"),
+                modified=maintenant
+            )
+            for i in changees
+        ]
+        with transaction.atomic():
+            Bien.objects.bulk_update(
+                objets, ['valeur_actuelle_cache', 'modified'], batch_size=1000
+            )
+        return len(objets)
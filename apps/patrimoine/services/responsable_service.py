@@ -0,0 +1,91 @@
+# apps/patrimoine/services/responsable_service.py
+"""
+Maintenance du responsable actuel dénormalisé sur Bien.
+Le pointeur responsable_actuel et ses colonnes d'affichage sont
+recalculés depuis les affectations actives après chaque affectation,
+clôture ou transfert.
+"""
+from typing import Optional
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, Now, Trim
+from django.utils import timezone
+import logging
+
+from apps.core.utils import CacheManager
+from apps.patrimoine.models import Bien, BienResponsabilite
+from .hierarchie_service import EntiteHierarchieService
+
+logger = logging.getLogger(__name__)
+
+
+class ResponsableActuelService:
+    """Synchronisation de Bien.responsable_actuel et des colonnes associées."""
+
+    @staticmethod
+    def synchroniser(bien: Bien, affectation: Optional[BienResponsabilite] = None):
+        """
+        Met à jour le pointeur dénormalisé du responsable actuel.
+        Une affectation bornée (date_fin renseignée) ne devient pas
+        le responsable courant, comme pour l'ancienne propriété.
+        Sans affectation fournie, relit l'affectation active restante
+        (aucune après une clôture en masse).
+        """
+        if affectation is None:
+            affectation = BienResponsabilite.objects.filter(
+                bien=bien,
+                actif=True,
+                date_fin__isnull=True
+            ).select_related('responsable__user').order_by('-date_debut').first()
+
+        if affectation is not None and affectation.actif and not affectation.date_fin:
+            valeurs = {
+                'responsable_actuel': affectation,
+                'responsable_actuel_nom': affectation.responsable.user.get_full_name(),
+                'responsable_actuel_fonction': affectation.responsable.fonction,
+            }
+        else:
+            valeurs = {
+                'responsable_actuel': None,
+                'responsable_actuel_nom': '',
+                'responsable_actuel_fonction': '',
+            }
+
+        valeurs['modified'] = timezone.now()
+        Bien.all_objects.filter(pk=bien.pk).update(**valeurs)
+        CacheManager.invalidate_tags(*EntiteHierarchieService.tags_biens([bien.entite_id]))
+        for champ, valeur in valeurs.items():
+            setattr(bien, champ, valeur)
+
+    @staticmethod
+    def synchroniser_tous(queryset=None) -> int:
+        """Recalcule en une requête le responsable actuel de tous les biens."""
+        affectation_active = BienResponsabilite.objects.filter(
+            bien=OuterRef('pk'),
+            actif=True,
+            date_fin__isnull=True
+        ).order_by('-date_debut')
+
+        queryset = queryset if queryset is not None else Bien.all_objects.all()
+        total = queryset.update(
+            responsable_actuel=Subquery(affectation_active.values('pk')[:1]),
+            responsable_actuel_nom=Coalesce(
+                Subquery(
+                    affectation_active.annotate(
+                        nom_complet=Trim(Concat(
+                            'responsable__user__first_name',
+                            Value(' '),
+                            'responsable__user__last_name'
+                        ))
+                    ).values('nom_complet')[:1]
+                ),
+                Value('')
+            ),
+            responsable_actuel_fonction=Coalesce(
+                Subquery(affectation_active.values('responsable__fonction')[:1]),
+                Value('')
+            ),
+            modified=Now()
+        )
+        CacheManager.invalidate_tags(*EntiteHierarchieService.tags_biens())
+        logger.info(f"Responsable actuel synchronisé sur {total} biens")
+        return total
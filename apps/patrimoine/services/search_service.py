@@ -0,0 +1,201 @@
+# apps/patrimoine/services/search_service.py
+"""
+Recherche plein texte PostgreSQL sur les modèles SearchableMixin.
+Les vecteurs pondérés sont recalculés en SQL (UPDATE ... SET
+search_vector = to_tsvector(...)) à chaque écriture, et les recherches
+passent par l'index GIN avec un classement ts_rank.
+L'autocomplétion des biens s'appuie sur pg_trgm (préfixes et fautes de
+frappe) avec un petit cache LRU des préfixes fréquents.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector,
+    TrigramSimilarity, TrigramWordSimilarity
+)
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import Case, F, FloatField, Func, Q, TextField, Value, When
+from django.db.models.functions import Greatest, Upper
+import logging
+
+from apps.core.utils import CacheLocal
+from apps.patrimoine.models import Bien, Categorie, SousCategorie, Entite
+
+logger = logging.getLogger(__name__)
+
+CONFIG_RECHERCHE = 'french'
+
+# Fragment de code recherché en sous-chaîne (index trigramme, 3 caractères minimum)
+LONGUEUR_MIN_FRAGMENT_CODE = 3
+
+# Champs indexés et poids (A le plus fort) par modèle
+CHAMPS_INDEXES: Dict[type, List[Tuple[str, str]]] = {
+    Bien: [
+        ('code_patrimoine', 'A'),
+        ('nom', 'A'),
+        ('numero_serie', 'B'),
+        ('marque', 'B'),
+        ('modele', 'B'),
+        ('tags', 'B'),
+        ('description', 'C'),
+    ],
+    Categorie: [
+        ('code', 'A'),
+        ('nom', 'A'),
+    ],
+    SousCategorie: [
+        ('code', 'A'),
+        ('nom', 'A'),
+        ('description', 'C'),
+    ],
+    Entite: [
+        ('code', 'A'),
+        ('nom', 'A'),
+    ],
+}
+
+
+class RechercheService:
+    """Maintenance des vecteurs de recherche et requêtes classées."""
+
+    @staticmethod
+    def vecteur(model) -> SearchVector:
+        """Expression SQL du vecteur pondéré d'un modèle."""
+        vecteurs = []
+        for champ, poids in CHAMPS_INDEXES[model]:
+            expression = champ
+            if isinstance(model._meta.get_field(champ), ArrayField):
+                # Un mot par élément, sans les accolades du littéral tableau
+                expression = Func(
+                    F(champ), Value(' '), function='array_to_string', output_field=TextField()
+                )
+            vecteurs.append(SearchVector(expression, weight=poids, config=CONFIG_RECHERCHE))
+        vecteur = vecteurs[0]
+        for suivant in vecteurs[1:]:
+            vecteur = vecteur + suivant
+        return vecteur
+
+    @staticmethod
+    def champs_indexes(model) -> List[str]:
+        return [champ for champ, _ in CHAMPS_INDEXES[model]]
+
+    @classmethod
+    def mettre_a_jour(cls, model, pks: Optional[Iterable] = None) -> int:
+        """
+        Recalcule les vecteurs en une requête UPDATE.
+        Sans `pks`, réindexe toute la table (y compris les supprimés logiques).
+        """
+        queryset = model.all_objects.all()
+        if pks is not None:
+            queryset = queryset.filter(pk__in=list(pks))
+        return queryset.update(search_vector=cls.vecteur(model))
+
+    @staticmethod
+    def requete(texte: str) -> SearchQuery:
+        """Requête française tolérant la syntaxe web (guillemets, -, or)."""
+        return SearchQuery(texte, config=CONFIG_RECHERCHE, search_type='websearch')
+
+    @classmethod
+    def rechercher(cls, queryset, texte: str, classer: bool = True):
+        """
+        Filtre `queryset` via l'index GIN et annote le rang `rang`.
+        Pour les biens, un texte d'un seul mot est aussi cherché en
+        sous-chaîne du code patrimoine (index trigramme sur UPPER), et
+        ces correspondances passent en tête.
+        """
+        texte = (texte or '').strip()
+        if not texte:
+            return queryset
+
+        requete = cls.requete(texte)
+        condition = Q(search_vector=requete)
+        rang = SearchRank(F('search_vector'), requete)
+        if (
+            queryset.model is Bien
+            and len(texte) >= LONGUEUR_MIN_FRAGMENT_CODE
+            and len(texte.split()) == 1
+        ):
+            fragment = Q(_code_majuscules__contains=texte.upper())
+            queryset = queryset.annotate(_code_majuscules=Upper('code_patrimoine'))
+            condition |= fragment
+            rang = rang + Case(When(fragment, then=Value(1.0)), default=Value(0.0), output_field=FloatField())
+
+        queryset = queryset.filter(condition).annotate(rang=rang)
+        if classer:
+            queryset = queryset.order_by('-rang', 'pk')
+        return queryset
+
+
+class AutocompletionService:
+    """
+    Autocomplétion approchée des biens sur code patrimoine, n° de série,
+    code-barres et nom. Les colonnes sont comparées en majuscules pour
+    correspondre aux index GIN gin_trgm_ops sur UPPER(colonne).
+    """
+
+    LONGUEUR_MIN = 2
+    LIMITE_MAX = 25
+    CHAMPS = {
+        'code_patrimoine': '_ac_code',
+        'numero_serie': '_ac_serie',
+        'code_barre': '_ac_code_barre',
+        'nom': '_ac_nom',
+    }
+
+    _cache = CacheLocal(taille_max=512, ttl=60)
+
+    @classmethod
+    def suggerer(cls, queryset, texte: str, limite: int = 10, perimetre: str = 'all') -> List[Dict]:
+        """
+        Retourne au plus `limite` biens classés : une correspondance de
+        préfixe passe devant, puis la similarité trigramme la plus forte.
+        `perimetre` distingue les entrées du cache entre utilisateurs.
+        """
+        prefixe = ' '.join((texte or '').split()).upper()
+        if len(prefixe) < cls.LONGUEUR_MIN:
+            return []
+        limite = max(1, min(limite, cls.LIMITE_MAX))
+
+        cle = (perimetre, prefixe, limite)
+        resultats = cls._cache.get(cle)
+        if resultats is None:
+            resultats = cls._interroger(queryset, prefixe, limite)
+            cls._cache.set(cle, resultats)
+        return resultats
+
+    @classmethod
+    def _interroger(cls, queryset, prefixe: str, limite: int) -> List[Dict]:
+        queryset = queryset.annotate(**{
+            alias: Upper(champ) for champ, alias in cls.CHAMPS.items()
+        })
+
+        prefixes = Q()
+        for alias in cls.CHAMPS.values():
+            prefixes |= Q(**{f'{alias}__startswith': prefixe})
+
+        approche = (
+            Q(_ac_code__trigram_similar=prefixe)
+            | Q(_ac_serie__trigram_similar=prefixe)
+            | Q(_ac_code_barre__trigram_similar=prefixe)
+            | Q(_ac_nom__trigram_word_similar=prefixe)
+        )
+
+        return list(
+            queryset.filter(prefixes | approche).annotate(
+                score=Greatest(
+                    TrigramSimilarity('_ac_code', prefixe),
+                    TrigramSimilarity('_ac_serie', prefixe),
+                    TrigramSimilarity('_ac_code_barre', prefixe),
+                    TrigramWordSimilarity(prefixe, '_ac_nom'),
+                ) + Case(
+                    When(prefixes, then=Value(1.0)),
+                    default=Value(0.0),
+                    output_field=FloatField()
+                )
+            ).order_by('-score', 'code_patrimoine').values(
+                'id', 'code_patrimoine', 'nom', 'numero_serie', 'code_barre', 'score'
+            )[:limite]
+        )
+
+    @classmethod
+    def vider_cache(cls):
+        cls._cache.clear()
@@ -13,11 +13,11 @@ class StatistiquesService:
             
             stats = {
                 'total_biens': Bien.objects.count(),
-                'valeur_totale': Bien.objects.aggregate(Sum('valeur_initiale'))['valeur_initiale__sum'] or 0,
+                'valeur_totale': Bien.objects.aggregate(Sum('valeur_acquisition'))['valeur_acquisition__sum'] or 0,
                 'repartition_categories': list(Bien.objects.values('categorie__nom')
-                    .annotate(count=Count('id'), value=Sum('valeur_initiale'))
+                    .annotate(count=Count('id'), value=Sum('valeur_acquisition'))
                     .order_by('-count')),
-                'valeur_moyenne': Bien.objects.aggregate(Avg('valeur_initiale'))['valeur_initiale__avg'] or 0,
+                'valeur_moyenne': Bien.objects.aggregate(Avg('valeur_acquisition'))['valeur_acquisition__avg'] or 0,
             }
             
             # Mettre en cache pour 1 heure
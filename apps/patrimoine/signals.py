@@ -0,0 +1,110 @@
+# apps/patrimoine/signals.py
+"""
+Signaux du patrimoine : table de fermeture des entités, cumuls des biens,
+vecteurs de recherche, caches dérivés des entités et des catégories et
+versions de données des réponses d'API mises en cache.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.core.utils import CacheManager
+from apps.patrimoine.models import Bien, Categorie, Entite, SousCategorie
+from apps.patrimoine.services.categorie_service import CategorieArbreService
+from apps.patrimoine.services.cumuls_service import CumulsBiensService
+from apps.patrimoine.services.hierarchie_service import EntiteHierarchieService
+from apps.patrimoine.services.search_service import RechercheService
+
+
+@receiver(pre_save, sender=Entite)
+def memoriser_parent_entite(sender, instance, raw=False, **kwargs):
+    """Mémorise le parent en base pour détecter un déplacement."""
+    if raw or instance._state.adding:
+        return
+    instance._parent_id_precedent = Entite.all_objects.filter(
+        pk=instance.pk
+    ).values_list('parent_id', flat=True).first()
+
+
+@receiver(post_save, sender=Entite)
+def maintenir_hierarchie_entite(sender, instance, created, raw=False, **kwargs):
+    """Maintient la table de fermeture à la création ou au déplacement."""
+    if raw:
+        return
+    if created:
+        EntiteHierarchieService.inserer_noeud(instance)
+    elif getattr(instance, '_parent_id_precedent', instance.parent_id) != instance.parent_id:
+        EntiteHierarchieService.deplacer_noeud(instance)
+    instance._parent_id_precedent = instance.parent_id
+
+
+@receiver([post_save, post_delete], sender=Entite)
+def invalider_arbre_entites(sender, instance, **kwargs):
+    """Toute modification d'une entité invalide l'arbre mis en cache."""
+    EntiteHierarchieService.invalider_arbre()
+
+
+@receiver([post_save, post_delete], sender=Categorie)
+@receiver([post_save, post_delete], sender=SousCategorie)
+def invalider_arbre_categories(sender, instance, **kwargs):
+    """Toute modification du référentiel des catégories change sa version."""
+    CategorieArbreService.invalider()
+
+
+@receiver([post_save, post_delete], sender=Categorie)
+@receiver([post_save, post_delete], sender=SousCategorie)
+@receiver([post_save, post_delete], sender=Entite)
+def invalider_tags_referentiel(sender, instance, **kwargs):
+    """Toute écriture du référentiel périme les réponses qui le lisent."""
+    nom = sender._meta.model_name
+    CacheManager.invalidate_tags(nom, f"{nom}:{instance.pk}")
+
+
+@receiver([post_save, post_delete], sender=Bien)
+def invalider_tags_bien(sender, instance, **kwargs):
+    """Un bien modifié périme les lectures globales et celles des sous-arbres qui le contiennent."""
+    entites = {instance.entite_id, getattr(instance, '_entite_id_precedente', None)}
+    CacheManager.invalidate_tags(*EntiteHierarchieService.tags_biens(entites))
+
+
+@receiver(post_save, sender=Bien)
+@receiver(post_save, sender=Categorie)
+@receiver(post_save, sender=SousCategorie)
+@receiver(post_save, sender=Entite)
+def indexer_recherche(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recalcule le vecteur de recherche si un champ indexé a pu changer."""
+    if raw:
+        return
+    if update_fields and not set(update_fields) & set(RechercheService.champs_indexes(sender)):
+        return
+    RechercheService.mettre_a_jour(sender, [instance.pk])
+
+
+@receiver(pre_save, sender=Bien)
+def memoriser_contribution_bien(sender, instance, raw=False, **kwargs):
+    """Mémorise la contribution aux cumuls de la ligne avant écriture."""
+    if raw or instance._state.adding:
+        return
+    valeurs = CumulsBiensService.valeurs_en_base(instance.pk)
+    instance._contribution_precedente = CumulsBiensService.contribution(valeurs)
+    # Un transfert périme aussi le périmètre de l'entité d'origine
+    instance._entite_id_precedente = valeurs['entite_id'] if valeurs else None
+
+
+@receiver(post_save, sender=Bien)
+def maintenir_cumuls_bien(sender, instance, raw=False, **kwargs):
+    """Applique aux cumuls le delta entre l'ancienne et la nouvelle ligne."""
+    if raw:
+        return
+    deltas = {}
+    CumulsBiensService.cumuler(deltas, getattr(instance, '_contribution_precedente', None), -1)
+    CumulsBiensService.cumuler(deltas, CumulsBiensService.contribution_de(instance))
+    CumulsBiensService.appliquer(deltas)
+    instance._contribution_precedente = CumulsBiensService.contribution_de(instance)
+
+
+@receiver(post_delete, sender=Bien)
+def retirer_cumuls_bien(sender, instance, **kwargs):
+    """Une suppression physique retire la contribution du bien."""
+    deltas = {}
+    CumulsBiensService.cumuler(deltas, CumulsBiensService.contribution_de(instance), -1)
+    CumulsBiensService.appliquer(deltas)
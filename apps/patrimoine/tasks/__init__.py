@@ -2,10 +2,15 @@
 from .rapports import exporter_inventaire_complet
 from .maintenance import verifier_maintenances_planifiees
 from .notifications import envoyer_notifications_groupees
+from .reevaluation import reevaluer_portefeuille
+from .imports import traiter_import_biens, relancer_imports_interrompus
 
 # Pour permettre l'import direct depuis patrimoine.tasks
 __all__ = [
     'exporter_inventaire_complet',
     'verifier_maintenances_planifiees',
     'envoyer_notifications_groupees',
+    'reevaluer_portefeuille',
+    'traiter_import_biens',
+    'relancer_imports_interrompus',
 ]
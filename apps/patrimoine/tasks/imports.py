@@ -0,0 +1,118 @@
+# tasks/imports.py
+from celery import shared_task
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from datetime import timedelta
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Délai sans progression au-delà duquel un import en cours est considéré interrompu
+DELAI_IMPORT_INTERROMPU = timedelta(minutes=15)
+
+
+def _lire_fichier(job):
+    """Lit le fichier stocké du job dans un DataFrame"""
+    with job.fichier.open('rb') as fichier:
+        if job.fichier.name.lower().endswith('.csv'):
+            return pd.read_csv(fichier, encoding='utf-8-sig')
+        return pd.read_excel(fichier)
+
+
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def traiter_import_biens(self, job_id):
+    """
+    Traite un import de biens lot par lot.
+    Chaque lot et la progression associée sont validés dans la même
+    transaction : une reprise repart exactement après le dernier lot validé.
+    """
+    from ..models import ImportBiens
+    from ..services.import_service import ImportBiensService
+
+    with transaction.atomic():
+        job = ImportBiens.objects.select_for_update().get(pk=job_id)
+        if job.statut in (ImportBiens.Statut.TERMINE, ImportBiens.Statut.ECHEC):
+            return job.statut
+        ImportBiens.objects.filter(pk=job_id).update(
+            statut=ImportBiens.Statut.EN_COURS,
+            date_debut=job.date_debut or timezone.now(),
+            modified=timezone.now()
+        )
+
+    try:
+        df = _lire_fichier(job)
+        service = ImportBiensService(job.created_by, mode=job.mode, chunk_size=job.chunk_size)
+    except Exception as e:
+        logger.error(f"Import {job_id}: lecture impossible: {str(e)}")
+        ImportBiens.objects.filter(pk=job_id).update(
+            statut=ImportBiens.Statut.ECHEC,
+            message=f"Erreur lors de la lecture du fichier: {str(e)}",
+            date_fin=timezone.now(),
+            modified=timezone.now()
+        )
+        return ImportBiens.Statut.ECHEC
+
+    try:
+        if job.lignes_total != len(df):
+            ImportBiens.objects.filter(pk=job_id).update(lignes_total=len(df))
+
+        for debut in range(job.lignes_traitees, len(df), job.chunk_size):
+            lot_brut = df.iloc[debut:debut + job.chunk_size]
+            valides, erreurs = service.preparer(lot_brut)
+
+            with transaction.atomic():
+                job = ImportBiens.objects.select_for_update().get(pk=job_id)
+                if job.lignes_traitees != debut:
+                    # Lot déjà validé par une autre exécution
+                    continue
+                succes, erreurs_lot = service.traiter_lot(valides)
+                erreurs.update(erreurs_lot)
+
+                place = ImportBiens.MAX_ERREURS_DETAILLEES - len(job.erreurs)
+                details = ImportBiensService.rapport(succes, erreurs)['details']
+                ImportBiens.objects.filter(pk=job_id).update(
+                    erreurs=job.erreurs + details[:max(place, 0)],
+                    lignes_traitees=debut + len(lot_brut),
+                    lignes_importees=F('lignes_importees') + succes,
+                    lignes_en_erreur=F('lignes_en_erreur') + len(erreurs),
+                    modified=timezone.now()
+                )
+    except Exception as e:
+        # Les lots déjà validés restent acquis ; le job ne doit pas rester
+        # EN_COURS, sinon la relance automatique le rejouerait indéfiniment.
+        logger.exception(f"Import {job_id}: erreur inattendue: {str(e)}")
+        ImportBiens.objects.filter(pk=job_id).update(
+            statut=ImportBiens.Statut.ECHEC,
+            message=f"Erreur inattendue pendant l'import: {str(e)}",
+            date_fin=timezone.now(),
+            modified=timezone.now()
+        )
+        raise
+
+    ImportBiens.objects.filter(pk=job_id).update(
+        statut=ImportBiens.Statut.TERMINE,
+        date_fin=timezone.now(),
+        modified=timezone.now()
+    )
+    logger.info(f"Import {job_id} terminé ({len(df)} lignes)")
+    return ImportBiens.Statut.TERMINE
+
+
+@shared_task
+def relancer_imports_interrompus():
+    """Relance les imports en cours dont la progression est figée (worker perdu)"""
+    from ..models import ImportBiens
+
+    seuil = timezone.now() - DELAI_IMPORT_INTERROMPU
+    interrompus = ImportBiens.objects.filter(
+        statut=ImportBiens.Statut.EN_COURS,
+        modified__lt=seuil
+    ).values_list('pk', flat=True)
+
+    for job_id in interrompus:
+        logger.warning(f"Reprise de l'import interrompu {job_id}")
+        traiter_import_biens.delay(str(job_id))
+
+    return len(interrompus)
@@ -0,0 +1,18 @@
+# tasks/reevaluation.py
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def reevaluer_portefeuille(methode=None, chunk_size=5000):
+    """Réévaluation nocturne de la valeur actuelle de tous les biens"""
+    from ..services.reevaluation_service import ReevaluationService
+
+    try:
+        service = ReevaluationService(chunk_size=chunk_size, methode=methode)
+        return service.reevaluer_portefeuille()
+    except Exception as e:
+        logger.error(f"Erreur lors de la réévaluation du portefeuille: {str(e)}")
+        return False
@@ -25,14 +25,13 @@ def exporter_inventaire_complet(filters, email_utilisateur):
     # En-têtes
     headers = [
         'ID', 'Nom', 'Catégorie', 'Sous-catégorie', 'Entité', 
-        'Valeur initiale (FCFA)', 'Date acquisition', 'Responsable actuel'
+        'Valeur d\'acquisition (FCFA)', 'Date acquisition', 'Responsable actuel'
     ]
     worksheet.append(headers)
     
     # Données
     for bien in queryset:
-        responsable = bien.responsable_actuel
-        responsable_nom = f"{responsable.responsable.prenom} {responsable.responsable.nom}" if responsable else "N/A"
+        responsable_nom = bien.responsable_actuel_nom or "N/A"
         
         row = [
             bien.id,
@@ -40,7 +39,7 @@ def exporter_inventaire_complet(filters, email_utilisateur):
             bien.categorie.nom if bien.categorie else '',
             bien.sous_categorie.nom if bien.sous_categorie else '',
             bien.entite.nom if bien.entite else '',
-            bien.valeur_initiale,
+            bien.valeur_acquisition,
             bien.date_acquisition.strftime('%d/%m/%Y') if bien.date_acquisition else '',
             responsable_nom
         ]
@@ -0,0 +1,45 @@
+# tests/test_facettes.py
+from uuid import uuid4
+from django.test import SimpleTestCase
+from ..models import Bien
+from ..services.facettes_service import FacettesService
+
+
+class MiseEnFormeFacettesTests(SimpleTestCase):
+    def test_ensembles_de_regroupement(self):
+        categorie = uuid4()
+        lignes = [
+            {'ensemble': ('f_statut',), 'f_statut': 'ACTIF', 'count': 7},
+            {'ensemble': ('f_statut',), 'f_statut': 'REFORME', 'count': 3},
+            {
+                'ensemble': ('f_categorie', 'f_categorie_nom'),
+                'f_categorie': categorie, 'f_categorie_nom': 'Véhicules', 'count': 10
+            },
+            {'ensemble': ('f_annee',), 'f_annee': 2023, 'count': 4},
+            {'ensemble': ('f_annee',), 'f_annee': 2024, 'count': 6},
+            {'ensemble': (), 'count': 10},
+        ]
+
+        resultat = FacettesService._mettre_en_forme(lignes)
+
+        self.assertEqual(resultat['total'], 10)
+        self.assertEqual([f['count'] for f in resultat['facettes']['statut']], [7, 3])
+        self.assertEqual(
+            resultat['facettes']['categorie'],
+            [{'valeur': str(categorie), 'libelle': 'Véhicules', 'count': 10}]
+        )
+        self.assertEqual(
+            [f['valeur'] for f in resultat['facettes']['annee_acquisition']],
+            [2024, 2023]
+        )
+        self.assertEqual(resultat['facettes']['entite'], [])
+
+
+class FacettesQuerysetVideTests(SimpleTestCase):
+    def test_queryset_vide_sans_requete(self):
+        # Filtre categorie_arbre sur une catégorie inconnue : queryset .none(),
+        # SimpleTestCase échoue si une requête est émise
+        resultat = FacettesService.calculer(Bien.objects.none())
+
+        self.assertEqual(resultat['total'], 0)
+        self.assertTrue(all(entrees == [] for entrees in resultat['facettes'].values()))
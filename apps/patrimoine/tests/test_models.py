@@ -0,0 +1,33 @@
+# tests/test_models.py
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from ..models import Categorie, SousCategorie, Entite, Bien
+
+
+class ModelTests(TestCase):
+    def setUp(self):
+        # Création d'objets de base
+        agent = get_user_model().objects.create_user(username='agent')
+        self.audit = {'created_by': agent, 'modified_by': agent}
+        self.cat = Categorie.objects.create(nom='CatTest', code='cattest', type='MOBILIER', **self.audit)
+        self.sc = SousCategorie.objects.create(
+            categorie=self.cat, nom='TestSC', code='mobilier_bureau', **self.audit
+        )
+        self.entite = Entite.objects.create(
+            nom='Ent1', code='ENT1', type='SERVICE', responsable=agent, **self.audit
+        )
+
+    def test_str_models(self):
+        self.assertEqual(str(self.cat), 'CatTest (Bien Mobilier)')
+        self.assertEqual(str(self.sc), 'TestSC – CatTest')
+        self.assertEqual(str(self.entite), 'ENT1 - Ent1')
+
+    def test_bien_creation(self):
+        b = Bien.objects.create(
+            nom='Bien1', categorie=self.cat, sous_categorie=self.sc,
+            entite=self.entite, valeur_acquisition=100,
+            date_acquisition=timezone.now().date(), **self.audit
+        )
+        self.assertEqual(str(b), f'{b.code_patrimoine} - Bien1')
+        self.assertTrue(b.code_patrimoine.startswith('OPRAG-'))
@@ -0,0 +1,27 @@
+# tests/test_reevaluation.py
+from django.test import SimpleTestCase
+from ..services.reevaluation_service import calculer_valeurs_nettes
+
+
+class CalculerValeursNettesTests(SimpleTestCase):
+    def test_lineaire(self):
+        # 1200 amortis sur 12 mois, 10 mois écoulés
+        valeurs = calculer_valeurs_nettes([1200], [304.4], [12], [0], 'LINEAR')
+        self.assertAlmostEqual(valeurs[0], 200.0, places=2)
+
+    def test_lineaire_plancher_valeur_residuelle(self):
+        valeurs = calculer_valeurs_nettes([1000], [10000], [12], [100], 'LINEAR')
+        self.assertAlmostEqual(valeurs[0], 100.0, places=2)
+
+    def test_sans_duree_conserve_valeur_acquisition(self):
+        valeurs = calculer_valeurs_nettes([1000], [5000], [0], [0], 'DEGRESSIF')
+        self.assertAlmostEqual(valeurs[0], 1000.0, places=2)
+
+    def test_degressif(self):
+        # 60 mois, coefficient 1.75 : taux annuel 35 %, deux exercices écoulés
+        valeurs = calculer_valeurs_nettes([10000], [2 * 12 * 30.44 + 1], [60], [0], 'DEGRESSIF')
+        self.assertAlmostEqual(valeurs[0], 10000 * 0.65 * 0.65, places=2)
+
+    def test_methode_inconnue(self):
+        with self.assertRaises(ValueError):
+            calculer_valeurs_nettes([1000], [10], [12], [0], 'SOMME_CHIFFRES')
@@ -0,0 +1,87 @@
+# tests/test_responsable_actuel.py
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from ..models import (
+    Bien, BienResponsabilite, Categorie, Entite, ResponsableBien, SousCategorie
+)
+from ..services.responsable_service import ResponsableActuelService
+
+
+class ResponsableActuelTests(TestCase):
+    def setUp(self):
+        agent = get_user_model().objects.create_user(username='agent')
+        self.audit = {'created_by': agent, 'modified_by': agent}
+        categorie = Categorie.objects.create(
+            nom='Véhicules', code='vehicules', type='MOBILIER', **self.audit
+        )
+        sous_categorie = SousCategorie.objects.create(
+            categorie=categorie, nom='Pick-up', code='pick-up', **self.audit
+        )
+        self.entite = Entite.objects.create(
+            nom='Direction technique', code='DT', type='DIRECTION', responsable=agent,
+            **self.audit
+        )
+        self.bien = Bien.objects.create(
+            nom='Toyota Hilux', categorie=categorie, sous_categorie=sous_categorie,
+            entite=self.entite, valeur_acquisition=1000, date_acquisition=date(2024, 1, 15),
+            **self.audit
+        )
+        self.marie = self.creer_responsable('mobiang', 'Marie', 'Obiang', 'Magasinière')
+        self.paul = self.creer_responsable('pndong', 'Paul', 'Ndong', 'Chauffeur')
+
+    def creer_responsable(self, username, prenom, nom, fonction):
+        user = get_user_model().objects.create_user(
+            username=username, first_name=prenom, last_name=nom
+        )
+        return ResponsableBien.objects.create(
+            user=user, matricule=username.upper(), fonction=fonction,
+            telephone='+24177000000', email_professionnel=f'{username}@oprag.ga',
+            entite_principale=self.entite, **self.audit
+        )
+
+    def affecter(self, responsable, date_debut):
+        affectation = BienResponsabilite.objects.create(
+            bien=self.bien, responsable=responsable, date_debut=date_debut, **self.audit
+        )
+        ResponsableActuelService.synchroniser(self.bien, affectation)
+        return affectation
+
+    def test_affectation_renseigne_les_colonnes(self):
+        affectation = self.affecter(self.marie, date(2024, 2, 1))
+
+        bien = Bien.objects.get(pk=self.bien.pk)
+        self.assertEqual(bien.responsable_actuel_id, affectation.pk)
+        self.assertEqual(bien.responsable_actuel_nom, 'Marie Obiang')
+        self.assertEqual(bien.responsable_actuel_fonction, 'Magasinière')
+
+    def test_reaffectation_remplace_le_responsable(self):
+        self.affecter(self.marie, date(2024, 2, 1))
+        nouvelle = self.affecter(self.paul, date(2024, 6, 1))
+
+        bien = Bien.objects.get(pk=self.bien.pk)
+        self.assertEqual(bien.responsable_actuel_id, nouvelle.pk)
+        self.assertEqual(bien.responsable_actuel_nom, 'Paul Ndong')
+
+    def test_cloture_vide_les_colonnes(self):
+        self.affecter(self.marie, date(2024, 2, 1))
+        self.bien.responsabilites.update(actif=False, date_fin=date(2024, 3, 1))
+        ResponsableActuelService.synchroniser(self.bien)
+
+        bien = Bien.objects.get(pk=self.bien.pk)
+        self.assertIsNone(bien.responsable_actuel)
+        self.assertEqual(bien.responsable_actuel_nom, '')
+        self.assertEqual(bien.responsable_actuel_fonction, '')
+
+    def test_synchronisation_globale_relit_les_affectations(self):
+        affectation = BienResponsabilite.objects.create(
+            bien=self.bien, responsable=self.paul, date_debut=date(2024, 2, 1), **self.audit
+        )
+
+        total = ResponsableActuelService.synchroniser_tous()
+
+        bien = Bien.objects.get(pk=self.bien.pk)
+        self.assertEqual(total, 1)
+        self.assertEqual(bien.responsable_actuel_id, affectation.pk)
+        self.assertEqual(bien.responsable_actuel_nom, 'Paul Ndong')
+        self.assertEqual(bien.responsable_actuel_fonction, 'Chauffeur')
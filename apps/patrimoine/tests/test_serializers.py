@@ -0,0 +1,35 @@
+# tests/test_serializers.py
+from django.test import SimpleTestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from ..serializers import BienSerializer, CategorieSerializer, HistoriqueValeurSerializer
+
+
+def requete(url):
+    return Request(APIRequestFactory().get(url))
+
+
+class ChampsDynamiquesTests(SimpleTestCase):
+    def test_par_defaut_sans_historique(self):
+        serializer = BienSerializer(context={'request': requete('/biens/')})
+
+        self.assertNotIn('historique_valeurs', serializer.fields)
+        self.assertIsInstance(serializer.fields['categorie'], CategorieSerializer)
+
+    def test_fields_restreint_les_champs(self):
+        serializer = BienSerializer(context={'request': requete('/biens/?fields=id,nom')})
+
+        self.assertEqual(set(serializer.fields), {'id', 'nom'})
+
+    def test_expand_imbrique_les_relations_demandees(self):
+        serializer = BienSerializer(
+            context={'request': requete('/biens/?fields=id&expand=historique_valeurs')}
+        )
+
+        self.assertEqual(set(serializer.fields), {'id', 'historique_valeurs'})
+        self.assertIsInstance(serializer.fields['historique_valeurs'].child, HistoriqueValeurSerializer)
+
+    def test_expand_vide_rend_les_cles(self):
+        serializer = BienSerializer(context={'request': requete('/biens/?expand=')})
+
+        self.assertNotIsInstance(serializer.fields['categorie'], CategorieSerializer)
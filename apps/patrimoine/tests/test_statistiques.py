@@ -0,0 +1,16 @@
+# tests/test_statistiques.py
+from django.test import SimpleTestCase
+from ..models import Bien
+from ..services.agregation_service import StatistiquesBiensService
+
+
+class StatistiquesQuerysetVideTests(SimpleTestCase):
+    def test_queryset_vide_statistiques_a_zero(self):
+        # SimpleTestCase échoue si une requête est émise
+        statistiques = StatistiquesBiensService.calculer(Bien.objects.none())
+
+        self.assertEqual(statistiques['total_biens'], 0)
+        self.assertEqual(statistiques['valeur_totale'], 0)
+        self.assertEqual(statistiques['repartition_statut'], [])
+        self.assertEqual(statistiques['top_10_valeur'], [])
+        self.assertEqual(set(statistiques['biens_critiques'].values()), {0})
@@ -9,9 +9,9 @@ urlpatterns = [
     # Route corrigée: ajouter-complet au lieu de ajouter_bien_complet
     path('ajouter-complet/', views.ajouter_bien, name='ajouter_bien_complet'),
     path('ajouter/', views.BienCreateView.as_view(), name='bien_create'),
-    path('<int:pk>/', views.BienDetailView.as_view(), name='bien_detail'),
-    path('<int:pk>/modifier/', views.BienUpdateView.as_view(), name='bien_update'),
-    path('<int:pk>/supprimer/', views.BienDeleteView.as_view(), name='bien_delete'),
+    path('<uuid:pk>/', views.BienDetailView.as_view(), name='bien_detail'),
+    path('<uuid:pk>/modifier/', views.BienUpdateView.as_view(), name='bien_update'),
+    path('<uuid:pk>/supprimer/', views.BienDeleteView.as_view(), name='bien_delete'),
     path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
     path('carte/', views.CarteView.as_view(), name='carte'),
     # AJAX routes
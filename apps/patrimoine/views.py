@@ -1,3 +1,6 @@
+import uuid
+
+from django.db import transaction
 from django.db.models import Sum, Count, Q, F
 from django.db.models.functions import ExtractYear, TruncMonth, TruncYear
 from django.shortcuts import render, redirect, get_object_or_404
@@ -25,6 +28,10 @@ from .models import (
     ProfilEquipementMedical, ProfilMobilier, ProfilTerrain, ProfilConsommable
 )
 
+# Importations des services
+from .services.search_service import RechercheService
+from .services.responsable_service import ResponsableActuelService
+
 # Importations des formulaires
 from .forms import (
     BienForm, HistoriqueValeurForm,
@@ -82,6 +89,21 @@ def accueil_view(request):
     return render(request, "home.html", context)
 
 
+def _renseigner_auteur(instance, request):
+    """Renseigne created_by / modified_by, exigés par la validation d'AuditMixin."""
+    if request.user.is_authenticated:
+        if instance._state.adding:
+            instance.created_by = request.user
+        instance.modified_by = request.user
+
+
+class AuteurMixin:
+    """Vues d'édition : l'utilisateur connecté est l'auteur de l'enregistrement."""
+    def form_valid(self, form):
+        _renseigner_auteur(form.instance, self.request)
+        return super().form_valid(form)
+
+
 # --- Class-based views ---
 class BienListView(ListView):
     model = Bien
@@ -93,9 +115,8 @@ class BienListView(ListView):
         queryset = super().get_queryset().select_related('categorie', 'entite').order_by('nom')
         search_query = self.request.GET.get('q')
         if search_query:
-            queryset = queryset.filter(
-                Q(nom__icontains=search_query) | Q(categorie__nom__icontains=search_query)
-            )
+            # Index GIN plein texte, résultats classés par pertinence
+            queryset = RechercheService.rechercher(queryset, search_query)
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -104,14 +125,14 @@ class BienListView(ListView):
         return context
 
 
-class BienCreateView(CreateView):
+class BienCreateView(AuteurMixin, CreateView):
     model = Bien
     form_class = BienForm
     template_name = 'patrimoine/biens/bien_form.html'
     success_url = reverse_lazy('biens:bien_list')
 
 
-class BienUpdateView(UpdateView):
+class BienUpdateView(AuteurMixin, UpdateView):
     model = Bien
     form_class = BienForm
     template_name = 'patrimoine/biens/bien_form.html'
@@ -127,7 +148,7 @@ class BienDeleteView(DeleteView):
 class DetailViewMixin:
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['historiques'] = self.object.historiques.order_by('date')
+        context['historiques'] = self.object.historique_valeurs.order_by('date')
         return context
 
 # views.py - Exemple de vue optimisée
@@ -145,15 +166,17 @@ class BienDetailView(DetailView):
             'entite',
             'commune__departement__province'
         ).prefetch_related(
-            'historiques',
-            'responsabilites__responsable'
+            'historique_valeurs',
+            'responsabilites__responsable__user'
         )
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['historiques'] = self.object.historiques.order_by('-date')
+        context['historiques'] = self.object.historique_valeurs.order_by('-date')
         context['form'] = HistoriqueValeurForm()
-        context['all_responsables'] = ResponsableBien.objects.all().order_by('nom', 'prenom')
+        context['all_responsables'] = ResponsableBien.objects.select_related('user').order_by(
+            'user__last_name', 'user__first_name'
+        )
         
         # Charger les profils techniques
         self._charger_profil_technique(context)
@@ -191,6 +214,7 @@ class BienDetailView(DetailView):
         if form.is_valid():
             historique = form.save(commit=False)
             historique.bien = self.object
+            _renseigner_auteur(historique, request)
             historique.save()
             messages.success(request, "La valeur a été ajoutée avec succès.")
             return redirect('biens:bien_detail', pk=self.object.pk)
@@ -215,17 +239,20 @@ class BienDetailView(DetailView):
         try:
             responsable = ResponsableBien.objects.get(pk=responsable_id)
             
-            # Créer la responsabilité
-            responsabilite = BienResponsabilite(
-                bien=self.object,
-                responsable=responsable,
-                date_affectation=date_affectation,
-                type_affectation=type_affectation,
-                motif=motif
-            )
-            responsabilite.save()
+            # Créer la responsabilité et mettre à jour le responsable actuel
+            with transaction.atomic():
+                responsabilite = BienResponsabilite(
+                    bien=self.object,
+                    responsable=responsable,
+                    date_debut=date_affectation,
+                    type_affectation=type_affectation.upper(),
+                    motif=motif
+                )
+                _renseigner_auteur(responsabilite, request)
+                responsabilite.save()
+                ResponsableActuelService.synchroniser(self.object, responsabilite)
             
-            messages.success(request, f"Le bien a été assigné à {responsable.prenom} {responsable.nom} avec succès.")
+            messages.success(request, f"Le bien a été assigné à {responsable.user.get_full_name()} avec succès.")
         except ResponsableBien.DoesNotExist:
             messages.error(request, "Le responsable sélectionné n'existe pas.")
         except Exception as e:
@@ -254,7 +281,7 @@ class DashboardView(TemplateView):
         all_biens = self.get_filtered_biens(request)
 
         biens_par_categorie = all_biens.values('categorie__nom').annotate(
-            nb_biens=Count('id'), total=Sum('valeur_initiale')
+            nb_biens=Count('id'), total=Sum('valeur_acquisition')
         )
 
         for category_data in biens_par_categorie:
@@ -293,15 +320,15 @@ class DashboardView(TemplateView):
         all_biens = self.get_filtered_biens(self.request)
 
         context.update({
-            'valeur_totale': all_biens.aggregate(Sum('valeur_initiale'))['valeur_initiale__sum'] or 0,
+            'valeur_totale': all_biens.aggregate(Sum('valeur_acquisition'))['valeur_acquisition__sum'] or 0,
             'par_categorie': all_biens.values('categorie__nom').annotate(
-                nb_biens=Count('id'), total=Sum('valeur_initiale')
+                nb_biens=Count('id'), total=Sum('valeur_acquisition')
             ),
             'par_entite': all_biens.values('entite__nom').annotate(
-                nb_biens=Count('id'), total=Sum('valeur_initiale')
+                nb_biens=Count('id'), total=Sum('valeur_acquisition')
             ),
             'par_commune': all_biens.values('commune__nom').annotate(
-                nb_biens=Count('id'), total=Sum('valeur_initiale')
+                nb_biens=Count('id'), total=Sum('valeur_acquisition')
             ),
             'annees_disponibles': Bien.objects.annotate(annee=ExtractYear('date_acquisition'))
                 .values_list('annee', flat=True)
@@ -337,7 +364,7 @@ class CarteView(TemplateView):
                     'province_nom': commune.departement.province.nom if commune.departement and commune.departement.province else '',
                     'entite_nom': bien.entite.nom if bien.entite else '',
                     'nb_biens': 1,
-                    'total': float(bien.valeur_initiale) if bien.valeur_initiale else 0,
+                    'total': float(bien.valeur_acquisition) if bien.valeur_acquisition else 0,
                 })
 
         context['carte_data'] = carte_data
@@ -354,10 +381,12 @@ class CarteView(TemplateView):
 @csrf_exempt
 def get_profil_form(request):
     sous_categorie_id = request.GET.get('sous_categorie_id')
-    if not sous_categorie_id or not sous_categorie_id.isdigit():
+    try:
+        sous_categorie_id = uuid.UUID(sous_categorie_id or '')
+    except ValueError:
         return JsonResponse({'error': 'ID invalide'}, status=400)
     try:
-        sous_categorie = SousCategorie.objects.get(pk=int(sous_categorie_id))
+        sous_categorie = SousCategorie.objects.get(pk=sous_categorie_id)
         form_config = FORM_MAPPING.get(sous_categorie.code)
         if form_config and form_config['form']:
             html_form = render_to_string(
@@ -381,6 +410,7 @@ def ajouter_bien(request):
 
     if request.method == 'POST' and bien_form.is_valid():
         bien = bien_form.save(commit=False)
+        _renseigner_auteur(bien, request)
         sous_categorie_code = bien_form.cleaned_data['sous_categorie'].code
         profil_form_class = FORM_MAPPING.get(sous_categorie_code, {}).get('form')
         profil_valid = True
@@ -410,7 +440,7 @@ class BienViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['categorie', 'sous_categorie', 'entite', 'commune__departement__province']
     search_fields = ['nom', 'description', 'numero_serie']
-    ordering_fields = ['nom', 'valeur_initiale', 'date_acquisition']
+    ordering_fields = ['nom', 'valeur_acquisition', 'date_acquisition']
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -426,18 +456,18 @@ class BienViewSet(viewsets.ModelViewSet):
         # Calculer les statistiques
         stats = {
             'nombre_total': queryset.count(),
-            'valeur_totale': queryset.aggregate(Sum('valeur_initiale'))['valeur_initiale__sum'] or 0,
+            'valeur_totale': queryset.aggregate(Sum('valeur_acquisition'))['valeur_acquisition__sum'] or 0,
             'par_categorie': list(queryset.values(
                 categorie=F('categorie__nom')
             ).annotate(
                 count=Count('id'),
-                valeur=Sum('valeur_initiale')
+                valeur=Sum('valeur_acquisition')
             ).order_by('-count')),
             'par_entite': list(queryset.values(
                 entite=F('entite__nom')
             ).annotate(
                 count=Count('id'),
-                valeur=Sum('valeur_initiale')
+                valeur=Sum('valeur_acquisition')
             ).order_by('-count')),
         }
         
@@ -448,7 +478,7 @@ class BienViewSet(viewsets.ModelViewSet):
     def historique(self, request, pk=None):
         """Récupère l'historique des valeurs d'un bien"""
         bien = self.get_object()
-        historiques = bien.historiques.all().order_by('-date')
+        historiques = bien.historique_valeurs.all().order_by('-date')
         
         from ..serializers import HistoriqueValeurSerializer
         serializer = HistoriqueValeurSerializer(historiques, many=True)
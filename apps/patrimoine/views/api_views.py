@@ -3,6 +3,7 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from .models import Bien, Categorie, SousCategorie, Entite
 from .serializers import BienSerializer, CategorieSerializer, SousCategorieSerializer, EntiteSerializer
+from ..services.search_service import RechercheService
 
 class BienViewSet(viewsets.ModelViewSet):
     queryset = Bien.objects.all()
@@ -22,6 +23,7 @@ class BienViewSet(viewsets.ModelViewSet):
         if entite:
             queryset = queryset.filter(entite__id=entite)
         if recherche:
-            queryset = queryset.filter(nom__icontains=recherche)
-            
-        return queryset
+            queryset = RechercheService.rechercher(queryset, recherche)
+        
+        # Jointures et colonnes déduites de ?fields= / ?expand=
+        return self.get_serializer_class().optimiser_queryset(queryset, self.request)
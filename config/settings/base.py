@@ -48,6 +48,7 @@ DJANGO_APPS = [
     'django.contrib.staticfiles',
     'django.contrib.humanize',
     'django.contrib.gis',  # Pour la géolocalisation
+    'django.contrib.postgres',  # Recherche plein texte et trigrammes
 ]
 
 THIRD_PARTY_APPS = [
@@ -71,6 +72,7 @@ THIRD_PARTY_APPS = [
 ]
 
 LOCAL_APPS = [
+    'apps.core',
     'apps.patrimoine',
     'apps.authentication',
     'apps.notifications',
@@ -272,7 +274,8 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'apps.api.v1.renderers.ORJSONRenderer',
+        'apps.api.v1.renderers.MessagePackRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_FILTER_BACKENDS': [